@@ -6,7 +6,14 @@ from contextlib import asynccontextmanager
 from dependency_injector.wiring import Provide, inject
 from fastapi import FastAPI
 
-from app.internal.workers import Workers
+from app.internal.repository.publish_buffer import PublishBuffer
+from app.internal.repository.v1.rabbitmq.rpc import RPCRepository
+from app.internal.repository.v1.rabbitmq.topology import Topology
+from app.internal.services import Services
+from app.internal.workers import Worker, Workers
+from app.pkg.async_helpers.password_hasher import password_hasher
+from app.pkg.clients import Clients
+from app.pkg.settings import settings
 
 
 @inject
@@ -14,20 +21,47 @@ from app.internal.workers import Workers
 async def lifespan(
     app: FastAPI,
     worker: Worker = Provide[Workers.worker],
+    publish_buffers: list[PublishBuffer] = Provide[Services.v1.publish_buffers],
+    topology: Topology = Provide[Services.v1.rabbitmq_repositories.topology],
+    rpc_repository: RPCRepository = Provide[
+        Services.v1.rabbitmq_repositories.rpc_repository
+    ],
+    clients: Clients = Provide[Clients],
 ):
+    # Incompatible declaration of the existing entity stops the startup.
+    await topology.declare()
     app.state.shutting_down = False
-    await worker.task()
-    worker_task = asyncio.create_task(worker.task())
+    # Consumers may run in ``python -m app.workers`` processes instead.
+    worker_task = (
+        asyncio.create_task(worker.task()) if settings.API.RUN_CONSUMERS else None
+    )
 
     yield
 
     app.state.shutting_down = True
-    worker_task.cancel()
+    if worker_task is not None:
+        worker_task.cancel()
+        try:
+            await asyncio.wait_for(
+                worker_task,
+                timeout=settings.WORKERS.DRAIN_TIMEOUT,
+            )
+        except (asyncio.CancelledError, asyncio.TimeoutError):
+            pass
 
-    try:
-        await worker_task
-    except asyncio.CancelledError:
-        pass
+    # Buffered messages are published before the broker connections close.
+    await asyncio.gather(
+        *[
+            publish_buffer.close(timeout=settings.WORKERS.DRAIN_TIMEOUT)
+            for publish_buffer in publish_buffers
+        ],
+    )
+    await rpc_repository.close()
+    password_hasher.close()
+    # Closes pooled HTTP clients, ``None`` if no client was used.
+    closing = clients.shutdown_resources()
+    if closing is not None:
+        await closing
 
     await shutdown_event()
 
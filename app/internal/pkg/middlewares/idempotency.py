@@ -0,0 +1,245 @@
+"""Idempotency-Key support for write routes.
+
+The first request with ``Idempotency-Key`` header reserves the key in redis
+with ``SET NX``, runs the route and stores the response. Retries with the same
+key get the stored response back without running the route again.
+
+Examples:
+    Mark the route with :func:`.idempotent` and use :class:`.IdempotencyRoute`
+    as ``route_class`` of the router::
+
+        >>> from fastapi import APIRouter
+        >>> router = APIRouter(route_class=IdempotencyRoute)
+        >>>
+        >>> @router.post("/")
+        ... @idempotent()
+        ... async def create():
+        ...     ...
+"""
+
+import base64
+import hashlib
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from dependency_injector.wiring import Provide, inject
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.internal.repository.v1.redis.idempotency import IdempotencyRepository
+from app.internal.services import Services
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.models.v1.exceptions.idempotency import (
+    IdempotencyKeyReused,
+    IdempotentRequestInProgress,
+)
+from app.pkg.settings import settings
+
+__all__ = [
+    "idempotent",
+    "get_idempotency_repository",
+    "IdempotencyRoute",
+    "IDEMPOTENCY_KEY_HEADER",
+]
+
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+#: Headers that are rebuilt for every response and must not be replayed.
+_NOT_STORED_HEADERS = frozenset(("content-length", "x-request-id"))
+
+_T = TypeVar("_T", bound=Callable)
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class IdempotencyOptions:
+    """Options of the idempotent route.
+
+    Attributes:
+        ttl:
+            TTL in seconds of the stored response.
+            Default: :attr:`.APIServer.IDEMPOTENCY_KEY_TTL`.
+    """
+
+    ttl: int | None = None
+
+
+def idempotent(ttl: int | None = None) -> Callable[[_T], _T]:
+    """Mark route as supporting ``Idempotency-Key`` header.
+
+    Args:
+        ttl: TTL in seconds of the stored response.
+
+    Notes:
+        The decorator only marks the endpoint, the work is done by
+        :class:`.IdempotencyRoute`.
+
+    Returns:
+        Decorator that returns the same endpoint.
+    """
+
+    def wrapper(endpoint: _T) -> _T:
+        endpoint.__idempotency__ = IdempotencyOptions(ttl=ttl)
+        return endpoint
+
+    return wrapper
+
+
+@inject
+def get_idempotency_repository(
+    repository: IdempotencyRepository = Provide[
+        Services.v1.redis_repositories.idempotency_repository
+    ],
+) -> IdempotencyRepository:
+    """Repository with stored responses of idempotent routes.
+
+    Notes:
+        Routes are built before the containers are wired, so the repository is
+        resolved on every request.
+
+    Args:
+        repository: Injected repository.
+
+    Returns:
+        Repository with stored responses.
+    """
+    return repository
+
+
+class IdempotencyRoute(RequestIDRoute):
+    """Middleware that replays stored responses of idempotent routes.
+
+    Routes without :func:`.idempotent` mark and requests without
+    ``Idempotency-Key`` header are processed as usual.
+    """
+
+    def get_route_handler(self) -> Callable:
+        """Override the route handler to add idempotency functionality.
+
+        Returns:
+            Callable: The customized route handler with idempotency logic.
+        """
+        original_route_handler = super().get_route_handler()
+        options: IdempotencyOptions | None = getattr(
+            self.endpoint,
+            "__idempotency__",
+            None,
+        )
+        if options is None:
+            return original_route_handler
+
+        ttl = options.ttl or settings.API.IDEMPOTENCY_KEY_TTL
+
+        async def custom_route_handler(request: Request) -> Response:
+            """Replay the stored response or run the route and store its
+            response.
+
+            Args:
+                request (Request): The incoming HTTP request.
+
+            Raises:
+                IdempotencyKeyReused: Key was used with another request body.
+                IdempotentRequestInProgress: First request is still running.
+
+            Returns:
+                Response: Stored or fresh HTTP response.
+            """
+            idempotency_key = request.headers.get(IDEMPOTENCY_KEY_HEADER)
+            if not idempotency_key:
+                return await original_route_handler(request)
+
+            repository = get_idempotency_repository()
+            redis_key = self.__build_key(request, idempotency_key)
+            fingerprint = hashlib.sha256(await request.body()).hexdigest()
+
+            reserved = await repository.create(
+                redis_key=redis_key,
+                cmd=models.IdempotentResponse(fingerprint=fingerprint),
+                expire_time=min(ttl, settings.API.IDEMPOTENCY_LOCK_TTL),
+            )
+            if not reserved:
+                return await self.__replay(repository, redis_key, fingerprint)
+
+            try:
+                response = await original_route_handler(request)
+            except BaseException:
+                await repository.delete(redis_key=redis_key)
+                raise
+
+            if response.status_code >= 500:
+                await repository.delete(redis_key=redis_key)
+                return response
+
+            await repository.update(
+                redis_key=redis_key,
+                cmd=models.IdempotentResponse(
+                    fingerprint=fingerprint,
+                    completed=True,
+                    status_code=response.status_code,
+                    body=base64.b64encode(response.body).decode(),
+                    headers={
+                        key: value
+                        for key, value in response.headers.items()
+                        if key not in _NOT_STORED_HEADERS
+                    },
+                ),
+                expire_time=ttl,
+            )
+            return response
+
+        return custom_route_handler
+
+    @staticmethod
+    def __build_key(request: Request, idempotency_key: str) -> str:
+        """Build redis key scoped by route and auth token of the client.
+
+        Args:
+            request: The incoming HTTP request.
+            idempotency_key: Value of ``Idempotency-Key`` header.
+
+        Returns:
+            Redis key of the request.
+        """
+        scope = hashlib.sha256(
+            request.headers.get("X-ACCESS-TOKEN", "").encode(),
+        ).hexdigest()
+        return (
+            f"idempotency:{request.method}:{request.url.path}:{scope}:"
+            f"{idempotency_key}"
+        )
+
+    @staticmethod
+    async def __replay(
+        repository: IdempotencyRepository,
+        redis_key: str,
+        fingerprint: str,
+    ) -> Response:
+        """Build response from the stored one.
+
+        Args:
+            repository: Repository with stored responses.
+            redis_key: Redis key of the request.
+            fingerprint: Fingerprint of the current request body.
+
+        Raises:
+            IdempotencyKeyReused: Key was used with another request body.
+            IdempotentRequestInProgress: First request is still running.
+
+        Returns:
+            Stored HTTP response.
+        """
+        stored = await repository.read(redis_key=redis_key)
+        if stored is not None and stored.fingerprint != fingerprint:
+            raise IdempotencyKeyReused
+        if stored is None or not stored.completed:
+            raise IdempotentRequestInProgress
+
+        logger.debug("Replay stored response.", extra={"key": redis_key})
+        return Response(
+            content=base64.b64decode(stored.body),
+            status_code=stored.status_code,
+            headers={**stored.headers, "Idempotent-Replayed": "true"},
+        )
@@ -0,0 +1,167 @@
+"""Full-response cache for GET routes.
+
+The serialized body and headers of successful responses are stored in
+:data:`.response_cache`. A hit is returned before dependencies of the route
+are resolved, so the service, the repository and serialization of the
+response model are skipped. Values are dropped by entity tags on repository
+writes, see :func:`.invalidate_cache`. Responses built while a write dropped
+their tags are not stored.
+
+Examples:
+    Mark the route with :func:`.cached` and use :class:`.ResponseCacheRoute`
+    as ``route_class`` of the router::
+
+        >>> from fastapi import APIRouter
+        >>> router = APIRouter(route_class=ResponseCacheRoute)
+        >>>
+        >>> @router.get("/")
+        ... @cached(tags=("city",))
+        ... async def read_all():
+        ...     ...
+"""
+
+import hashlib
+import json
+from dataclasses import dataclass
+from typing import Callable, TypeVar
+
+from starlette.requests import Request
+from starlette.responses import Response
+
+from app.internal.pkg.middlewares.idempotency import IdempotencyRoute
+from app.internal.repository.v1.redis.cache import response_cache
+from app.pkg.settings import settings
+
+__all__ = ["cached", "ResponseCacheRoute", "RESPONSE_CACHE_HEADER"]
+
+RESPONSE_CACHE_HEADER = "X-Cache"
+
+#: Headers that are rebuilt for every response and must not be cached.
+_NOT_STORED_HEADERS = frozenset(("content-length", "x-request-id"))
+
+_T = TypeVar("_T", bound=Callable)
+
+
+@dataclass(frozen=True)
+class ResponseCacheOptions:
+    """Options of the cached route.
+
+    Attributes:
+        tags:
+            Entity tags of the response. Writes of any of them drop the
+            response.
+        ttl:
+            TTL in seconds of the cached response.
+            Default: :attr:`.APIServer.RESPONSE_CACHE_TTL`.
+    """
+
+    tags: tuple[str, ...]
+    ttl: int | None = None
+
+
+def cached(tags: tuple[str, ...], ttl: int | None = None) -> Callable[[_T], _T]:
+    """Mark GET route as cacheable.
+
+    Args:
+        tags: Entity tags of the response.
+        ttl: TTL in seconds of the cached response.
+
+    Notes:
+        The decorator only marks the endpoint, the work is done by
+        :class:`.ResponseCacheRoute`.
+
+    Returns:
+        Decorator that returns the same endpoint.
+    """
+
+    def wrapper(endpoint: _T) -> _T:
+        endpoint.__response_cache__ = ResponseCacheOptions(tags=tags, ttl=ttl)
+        return endpoint
+
+    return wrapper
+
+
+class ResponseCacheRoute(IdempotencyRoute):
+    """Middleware that returns cached responses of cacheable routes.
+
+    Routes without :func:`.cached` mark and non-GET requests are processed as
+    usual. Only ``200`` responses are cached.
+    """
+
+    def get_route_handler(self) -> Callable:
+        """Override the route handler to add response cache functionality.
+
+        Returns:
+            Callable: The customized route handler with response cache logic.
+        """
+        original_route_handler = super().get_route_handler()
+        options: ResponseCacheOptions | None = getattr(
+            self.endpoint,
+            "__response_cache__",
+            None,
+        )
+        if options is None:
+            return original_route_handler
+
+        ttl = options.ttl or settings.API.RESPONSE_CACHE_TTL
+
+        async def custom_route_handler(request: Request) -> Response:
+            """Return cached response or run the route and cache its response.
+
+            Args:
+                request (Request): The incoming HTTP request.
+
+            Returns:
+                Response: Cached or fresh HTTP response.
+            """
+            if request.method != "GET":
+                return await original_route_handler(request)
+
+            key = self.__build_key(request)
+            stored = await response_cache.get(key)
+            if stored is not None:
+                headers, _, body = stored.partition(b"\n")
+                return Response(
+                    content=body,
+                    headers={**json.loads(headers), RESPONSE_CACHE_HEADER: "HIT"},
+                )
+
+            # Versions are read before the route reads the database, so the
+            # response is not stored if a write drops its tags meanwhile.
+            versions = await response_cache.versions(options.tags)
+            response = await original_route_handler(request)
+            if response.status_code != 200:
+                return response
+
+            headers = {
+                key: value
+                for key, value in response.headers.items()
+                if key not in _NOT_STORED_HEADERS
+            }
+            await response_cache.set(
+                key,
+                json.dumps(headers).encode() + b"\n" + response.body,
+                tags=options.tags,
+                ttl=ttl,
+                versions=versions,
+            )
+            response.headers[RESPONSE_CACHE_HEADER] = "MISS"
+            return response
+
+        return custom_route_handler
+
+    @staticmethod
+    def __build_key(request: Request) -> str:
+        """Build cache key scoped by path, query and auth token of the client.
+
+        Args:
+            request: The incoming HTTP request.
+
+        Returns:
+            Cache key of the request.
+        """
+        scope = hashlib.sha256(
+            request.headers.get("X-ACCESS-TOKEN", "").encode(),
+        ).hexdigest()
+        query = "&".join(sorted(request.url.query.split("&")))
+        return f"response_cache:{request.url.path}?{query}:{scope}"
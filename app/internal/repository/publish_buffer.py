@@ -0,0 +1,427 @@
+"""Bounded in-memory buffer in front of the message transport."""
+
+import asyncio
+import os
+import socket
+from itertools import groupby
+from typing import List, Optional, Sequence, Type
+
+from redis.exceptions import RedisError
+
+from app.internal.repository.transport import Transport
+from app.internal.repository.v1.redis.stream import StreamEntry, StreamRepository
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.base import Model
+from app.pkg.models.base.settings_enum import OverflowEnum
+from app.pkg.models.v1.exceptions.publish_buffer import PublishBufferFull
+
+__all__ = ["PublishBuffer"]
+
+
+class PublishBuffer(Transport):
+    """Transport that returns as soon as the message is buffered.
+
+    Drainer task publishes buffered messages in batches through ``transport``
+    and retries the batch up to ``max_attempts`` times. Batch that still
+    fails is spilled to redis, or dropped and logged without ``spill``.
+    Spilled messages replayed more than ``max_attempts`` times are moved to
+    the ``{routing_key}.spill.dlq`` stream. Callers wait for the broker only
+    when the buffer is full, then ``overflow`` decides what happens:
+
+    * ``block`` - wait for free space in the buffer.
+    * ``reject`` - raise :class:`.PublishBufferFull` (``429``). Batch of
+      :meth:`.create_many` is rejected as a whole, so a retry of the caller
+      does not publish its first messages twice.
+    * ``spill`` - append the message to the redis stream
+      ``{routing_key}.spill``. Drainer replays spilled messages through
+      ``transport`` when the buffer is idle and between buffered batches,
+      at most once per ``retry_delay_ms``, after the messages buffered
+      before the spill are published.
+
+    Attributes:
+        name: Name of the buffer in metrics.
+        transport: Transport which publishes buffered messages.
+        max_size: Max count of messages in the buffer.
+        overflow: Behavior of the full buffer.
+        batch_size: Max count of messages published at once.
+        retry_delay_ms: Delay in milliseconds before the failed batch is
+            published again. Drainer replays spilled messages with the same
+            interval.
+        max_attempts: Count of publish attempts of the batch before it is
+            spilled or dropped.
+        spill: Redis stream repository for ``spill`` overflow and failed
+            batches.
+        model: Model of spilled messages.
+        routing_keys: Routing keys whose spilled messages are replayed
+            after restart.
+
+    Notes:
+        Messages are lost if the process is killed before they are drained,
+        use :class:`.Transport` directly when every message must be confirmed
+        before the response.
+    """
+
+    spill_group = "publish_buffer"
+
+    def __init__(
+        self,
+        name: str,
+        transport: Transport,
+        max_size: int,
+        overflow: OverflowEnum = OverflowEnum.BLOCK,
+        batch_size: int = 256,
+        retry_delay_ms: int = 500,
+        max_attempts: int = 5,
+        spill: Optional[StreamRepository] = None,
+        model: Optional[Type[Model]] = None,
+        routing_keys: Sequence[str] = (),
+    ):
+        self.name = name
+        self.transport = transport
+        self.max_size = max_size
+        self.overflow = overflow
+        self.batch_size = batch_size
+        self.retry_delay_ms = retry_delay_ms
+        self.max_attempts = max_attempts
+        self.spill = spill
+        self.model = model
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+
+        self.__queue: asyncio.Queue[tuple[str, Model]] = asyncio.Queue(max_size)
+        self.__drainer: asyncio.Task | None = None
+        self.__spill_keys = set(routing_keys)
+        self.__spill_groups: set[str] = set()
+        # Sequence numbers of buffered and drained messages, spilled ones
+        # are replayed once the drainer passes ``__replay_after``.
+        self.__buffered = 0
+        self.__drained = 0
+        self.__replay_after: int | None = None
+        self.__published = 0
+        self.__failed = 0
+        self.__rejected = 0
+        self.__spilled = 0
+        self.__replayed = 0
+        self.__dropped = 0
+        self.__logger = get_logger(__name__)
+
+    async def create(self, message: Model, routing_key: str) -> Model:
+        """Put message into the buffer.
+
+        Args:
+            message: Message to publish.
+            routing_key: Name of the target queue.
+
+        Raises:
+            PublishBufferFull: Buffer is full and ``overflow`` is ``reject``.
+
+        Returns:
+            Buffered message.
+        """
+        self.__start()
+        try:
+            self.__queue.put_nowait((routing_key, message))
+            self.__buffered += 1
+        except asyncio.QueueFull:
+            await self.__overflow(message, routing_key)
+        return message
+
+    async def create_many(
+        self,
+        messages: Sequence[Model],
+        routing_key: str,
+    ) -> Sequence[Model]:
+        """Put all messages into the buffer.
+
+        Args:
+            messages: Messages to publish.
+            routing_key: Name of the target queue.
+
+        Raises:
+            PublishBufferFull: Buffer has no space for all messages and
+                ``overflow`` is ``reject``, none of them is buffered.
+
+        Returns:
+            Buffered messages.
+        """
+        free = self.max_size - self.__queue.qsize()
+        if self.overflow == OverflowEnum.REJECT and len(messages) > free:
+            self.__rejected += len(messages)
+            raise PublishBufferFull
+        for message in messages:
+            await self.create(message=message, routing_key=routing_key)
+        return messages
+
+    def metrics(self) -> models.PublishBufferMetrics:
+        """Current depth and counters of the buffer."""
+        return models.PublishBufferMetrics(
+            name=self.name,
+            depth=self.__queue.qsize(),
+            max_size=self.max_size,
+            published=self.__published,
+            failed=self.__failed,
+            rejected=self.__rejected,
+            spilled=self.__spilled,
+            replayed=self.__replayed,
+            dropped=self.__dropped,
+        )
+
+    async def close(self, timeout: float) -> None:
+        """Wait until buffered messages are published and stop the drainer.
+
+        Args:
+            timeout: Max time in seconds to wait for the drain.
+        """
+        if self.__drainer is None:
+            return
+        try:
+            await asyncio.wait_for(self.__queue.join(), timeout=timeout)
+        except asyncio.TimeoutError:
+            self.__logger.error(
+                "%s messages of publish buffer %s were not published.",
+                self.__queue.qsize(),
+                self.name,
+            )
+        self.__drainer.cancel()
+        await asyncio.gather(self.__drainer, return_exceptions=True)
+        self.__drainer = None
+
+    def __start(self) -> None:
+        """Start drainer task in the running loop."""
+        if self.__drainer is None or self.__drainer.done():
+            self.__drainer = asyncio.create_task(self.__drain())
+
+    async def __overflow(self, message: Model, routing_key: str) -> None:
+        """Handle message that does not fit into the buffer.
+
+        Args:
+            message: Message to publish.
+            routing_key: Name of the target queue.
+        """
+        if self.overflow == OverflowEnum.REJECT:
+            self.__rejected += 1
+            raise PublishBufferFull
+
+        if self.overflow == OverflowEnum.SPILL and self.spill is not None:
+            try:
+                await self.spill.create(message, self.__spill_stream(routing_key))
+                self.__spill_keys.add(routing_key)
+                self.__spilled += 1
+                if self.__replay_after is None:
+                    self.__replay_after = self.__buffered
+                return
+            except RedisError:
+                self.__logger.exception(
+                    "Failed to spill message of publish buffer %s, waiting.",
+                    self.name,
+                )
+
+        await self.__queue.put((routing_key, message))
+        self.__buffered += 1
+
+    async def __drain(self) -> None:
+        """Publish buffered messages until the task is cancelled."""
+        loop = asyncio.get_running_loop()
+        replayed_at = float("-inf")
+        while True:
+            try:
+                first = await asyncio.wait_for(
+                    self.__queue.get(),
+                    timeout=self.retry_delay_ms / 1000,
+                )
+            except asyncio.TimeoutError:
+                self.__replay_after = None
+                await self.__replay()
+                replayed_at = loop.time()
+                continue
+
+            batch = [first]
+            while len(batch) < self.batch_size and not self.__queue.empty():
+                batch.append(self.__queue.get_nowait())
+            try:
+                await self.__publish(batch)
+            finally:
+                self.__drained += len(batch)
+                for _ in batch:
+                    self.__queue.task_done()
+
+            # Messages are spilled when the buffer is busy, so waiting for
+            # an idle buffer would leave them in redis for the whole load.
+            if (
+                self.__spill_keys
+                and loop.time() - replayed_at >= self.retry_delay_ms / 1000
+                and (
+                    self.__replay_after is None
+                    or self.__drained >= self.__replay_after
+                )
+            ):
+                self.__replay_after = None
+                await self.__replay()
+                replayed_at = loop.time()
+
+    async def __publish(self, batch: List[tuple[str, Model]]) -> None:
+        """Publish batch, retrying it up to ``max_attempts`` times.
+
+        Args:
+            batch: Pairs of routing key and message in order of arrival.
+        """
+        for attempt in range(1, self.max_attempts + 1):
+            try:
+                for routing_key, items in groupby(batch, key=lambda item: item[0]):
+                    await self.transport.create_many(
+                        messages=[message for _, message in items],
+                        routing_key=routing_key,
+                    )
+                self.__published += len(batch)
+                return
+            except Exception:
+                self.__failed += 1
+                self.__logger.exception(
+                    "Failed to publish %s messages of publish buffer %s, "
+                    "attempt %s of %s.",
+                    len(batch),
+                    self.name,
+                    attempt,
+                    self.max_attempts,
+                )
+                if attempt < self.max_attempts:
+                    await asyncio.sleep(self.retry_delay_ms / 1000)
+        await self.__give_up(batch)
+
+    async def __give_up(self, batch: List[tuple[str, Model]]) -> None:
+        """Spill batch that failed ``max_attempts`` times, drop it without
+        ``spill``.
+
+        Args:
+            batch: Pairs of routing key and message in order of arrival.
+        """
+        if self.spill is not None:
+            try:
+                for routing_key, items in groupby(batch, key=lambda item: item[0]):
+                    await self.spill.create_many(
+                        [message for _, message in items],
+                        self.__spill_stream(routing_key),
+                    )
+                    self.__spill_keys.add(routing_key)
+                self.__spilled += len(batch)
+                self.__logger.error(
+                    "Spilled %s messages of publish buffer %s after %s attempts.",
+                    len(batch),
+                    self.name,
+                    self.max_attempts,
+                )
+                return
+            except RedisError:
+                self.__logger.exception(
+                    "Failed to spill messages of publish buffer %s.",
+                    self.name,
+                )
+
+        self.__dropped += len(batch)
+        self.__logger.error(
+            "Dropped %s messages of publish buffer %s after %s attempts: %s.",
+            len(batch),
+            self.name,
+            self.max_attempts,
+            [message.to_dict() for _, message in batch],
+        )
+
+    async def __replay(self) -> None:
+        """Publish batch of spilled messages of every known routing key."""
+        if self.spill is None or self.model is None:
+            return
+
+        for routing_key in list(self.__spill_keys):
+            stream = self.__spill_stream(routing_key)
+            try:
+                if stream not in self.__spill_groups:
+                    await self.spill.create_group(stream, self.spill_group)
+                    self.__spill_groups.add(stream)
+                entries = await self.spill.claim(
+                    stream=stream,
+                    group=self.spill_group,
+                    consumer=self.consumer,
+                    min_idle_time=self.retry_delay_ms * 10,
+                    count=self.batch_size,
+                )
+                if entries:
+                    entries = await self.__dead_letter(stream, entries)
+                else:
+                    entries = await self.spill.read_group(
+                        stream=stream,
+                        group=self.spill_group,
+                        consumer=self.consumer,
+                        count=self.batch_size,
+                        block=None,
+                    )
+                messages = []
+                for entry_id, fields in entries:
+                    try:
+                        messages.append(self.spill.parse_fields(fields, self.model))
+                    except (KeyError, ValueError):
+                        self.__logger.exception(
+                            "Drop malformed spilled entry %s.",
+                            entry_id,
+                        )
+                if messages:
+                    await self.transport.create_many(
+                        messages=messages,
+                        routing_key=routing_key,
+                    )
+                await self.spill.ack(
+                    stream,
+                    self.spill_group,
+                    *[entry_id for entry_id, _ in entries],
+                )
+                self.__replayed += len(messages)
+            except Exception:
+                self.__failed += 1
+                self.__logger.exception(
+                    "Failed to replay spilled messages of %s.",
+                    routing_key,
+                )
+
+    async def __dead_letter(
+        self,
+        stream: str,
+        entries: List[StreamEntry],
+    ) -> List[StreamEntry]:
+        """Move claimed entries replayed ``max_attempts`` times to the
+        ``{stream}.dlq`` stream.
+
+        Args:
+            stream: Name of the spill stream.
+            entries: Claimed entries.
+
+        Returns:
+            Entries to replay again.
+        """
+        deliveries = await self.spill.deliveries(
+            stream,
+            self.spill_group,
+            *[entry_id for entry_id, _ in entries],
+        )
+        exhausted = [
+            entry
+            for entry, count in zip(entries, deliveries)
+            if count > self.max_attempts
+        ]
+        if exhausted:
+            await self.spill.dead_letter(stream, self.spill_group, exhausted)
+            self.__dropped += len(exhausted)
+            self.__logger.error(
+                "Dead-lettered %s spilled messages of %s after %s attempts.",
+                len(exhausted),
+                stream,
+                self.max_attempts,
+            )
+        return [
+            entry
+            for entry, count in zip(entries, deliveries)
+            if count <= self.max_attempts
+        ]
+
+    @staticmethod
+    def __spill_stream(routing_key: str) -> str:
+        """Name of the redis stream with spilled messages of the routing key."""
+        return f"{routing_key}.spill"
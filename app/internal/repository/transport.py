@@ -0,0 +1,67 @@
+"""Abstract message transport interface."""
+
+from abc import ABC, abstractmethod
+from typing import Sequence
+
+from app.pkg.models.base import Model
+
+__all__ = ["Transport"]
+
+
+class Transport(ABC):
+    """Base interface of the message transport.
+
+    Services publish messages through this interface, so the broker behind
+    the queue can be selected in settings per queue.
+
+    Examples:
+        >>> from app.pkg.models import v1 as models
+        >>> class StdoutTransport(Transport):
+        ...     async def create(
+        ...         self,
+        ...         message: models.CreateBidCommand,
+        ...         routing_key: str,
+        ...     ) -> models.CreateBidCommand:
+        ...         print(routing_key, message)
+        ...         return message
+
+    Notes:
+        All methods must be asynchronous.
+    """
+
+    @abstractmethod
+    async def create(self, message: Model, routing_key: str) -> Model:
+        """Publish message.
+
+        Args:
+            message: Message to publish. Must be inherited from ``Model``.
+            routing_key: Name of the target queue.
+
+        Returns:
+            Published message.
+        """
+
+        raise NotImplementedError
+
+    async def create_many(
+        self,
+        messages: Sequence[Model],
+        routing_key: str,
+    ) -> Sequence[Model]:
+        """Publish batch of messages.
+
+        Args:
+            messages: Messages to publish.
+            routing_key: Name of the target queue.
+
+        Notes:
+            Default implementation publishes messages one by one. Override it
+            when the broker has a cheaper way to publish a batch.
+
+        Returns:
+            Published messages.
+        """
+
+        for message in messages:
+            await self.create(message=message, routing_key=routing_key)
+        return messages
@@ -4,6 +4,7 @@ from dependency_injector import containers, providers
 
 from app.internal.repository.v1.postgresql.city import CityRepository
 from app.internal.repository.v1.postgresql.country import CountryRepository
+from app.internal.repository.v1.postgresql.outbox import OutboxRepository
 
 
 class Repositories(containers.DeclarativeContainer):
@@ -11,3 +12,4 @@ class Repositories(containers.DeclarativeContainer):
 
     city_repository = providers.Factory(CityRepository)
     country_repository = providers.Factory(CountryRepository)
+    outbox_repository = providers.Factory(OutboxRepository)
@@ -7,6 +7,10 @@ from app.internal.repository.v1.postgresql.connection import get_connection
 from app.internal.repository.v1.postgresql.handlers.collect_response import (
     collect_response,
 )
+from app.internal.repository.v1.postgresql.handlers.invalidate_cache import (
+    invalidate_cache,
+)
+from app.internal.repository.v1.postgresql.outbox import write_outbox
 from app.pkg.models import v1 as models
 
 __all__ = ["CityRepository"]
@@ -15,6 +19,7 @@ __all__ = ["CityRepository"]
 class CityRepository(Repository):
     """City repository implementation."""
 
+    @invalidate_cache("city")
     @collect_response
     async def create(self, cmd: models.CreateCityCommand) -> models.City:
         """
@@ -39,8 +44,11 @@ class CityRepository(Repository):
                 (select country_code from country where city.country_id = country.country_id);
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                city = await cur.fetchone()
+                await write_outbox(cur, "city.created", city)
+            return city
 
     @collect_response
     async def read(self, query: models.ReadCityQuery) -> models.City:
@@ -105,6 +113,7 @@ class CityRepository(Repository):
             await cur.execute(q)
             return await cur.fetchall()
 
+    @invalidate_cache("city")
     @collect_response
     async def update(self, cmd: models.UpdateCityCommand) -> models.City:
         """
@@ -128,9 +137,13 @@ class CityRepository(Repository):
                 (select country_code from country where city.country_id = country.country_id);
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                city = await cur.fetchone()
+                await write_outbox(cur, "city.updated", city)
+            return city
 
+    @invalidate_cache("city")
     @collect_response
     async def delete(self, cmd: models.DeleteCityCommand) -> models.City:
         """
@@ -152,5 +165,8 @@ class CityRepository(Repository):
                 (select country_code from country where city.country_id = country.country_id);
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                city = await cur.fetchone()
+                await write_outbox(cur, "city.deleted", city)
+            return city
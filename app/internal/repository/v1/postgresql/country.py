@@ -10,6 +10,10 @@ from app.internal.repository.v1.postgresql.handlers.collect_response import (
 from app.internal.repository.v1.postgresql.handlers.insert_changelog import (
     insert_changelog,
 )
+from app.internal.repository.v1.postgresql.handlers.invalidate_cache import (
+    invalidate_cache,
+)
+from app.internal.repository.v1.postgresql.outbox import write_outbox
 from app.pkg.models import v1 as models
 
 __all__ = ["CountryRepository"]
@@ -18,6 +22,7 @@ __all__ = ["CountryRepository"]
 class CountryRepository(Repository):
     """Country repository implementation."""
 
+    @invalidate_cache("country")
     @collect_response
     async def create(self, cmd: models.CreateCountryCommand) -> models.Country:
         """
@@ -37,8 +42,11 @@ class CountryRepository(Repository):
             returning country_id, country_name, country_code
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                country = await cur.fetchone()
+                await write_outbox(cur, "country.created", country)
+            return country
 
     @collect_response
     async def read(self, query: models.ReadCountryQuery) -> models.Country:
@@ -76,6 +84,7 @@ class CountryRepository(Repository):
             await cur.execute(q)
             return await cur.fetchall()
 
+    @invalidate_cache("country", "city")
     @collect_response
     async def update(self, cmd: models.UpdateCountryCommand) -> models.Country:
         """
@@ -95,9 +104,13 @@ class CountryRepository(Repository):
             returning country_id, country_name, country_code
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                country = await cur.fetchone()
+                await write_outbox(cur, "country.updated", country)
+            return country
 
+    @invalidate_cache("country", "city")
     @collect_response
     async def delete(self, cmd: models.DeleteCountryCommand) -> models.Country:
         """
@@ -114,5 +127,8 @@ class CountryRepository(Repository):
             returning country_id, country_name, country_code
         """
         async with get_connection() as cur:
-            await cur.execute(q, cmd.to_dict())
-            return await cur.fetchone()
+            async with cur.begin():
+                await cur.execute(q, cmd.to_dict())
+                country = await cur.fetchone()
+                await write_outbox(cur, "country.deleted", country)
+            return country
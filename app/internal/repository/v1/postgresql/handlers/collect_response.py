@@ -1,6 +1,6 @@
 """Collect response module."""
 
-from functools import wraps
+from functools import lru_cache, wraps
 from types import NoneType, UnionType
 from typing import (
     Any,
@@ -92,9 +92,7 @@ async def process_response(
     if not response:
         raise EmptyResult
 
-    adapter = TypeAdapter(return_annotation)
-
-    return adapter.validate_python(
+    return __adapter(return_annotation).validate_python(
         await __convert_response(
             response=response,
             annotations=str(return_annotation),
@@ -137,6 +135,12 @@ async def __convert_memory_viewer(r: RealDictRow) -> RealDictRow:
     return r
 
 
+@lru_cache(maxsize=None)
+def __adapter(return_annotation: Any) -> TypeAdapter:
+    """Validator of the return annotation, built once per annotation."""
+    return TypeAdapter(return_annotation)
+
+
 def __is_optional_type(origin: ParamSpec | Type[UnionType] | type | None) -> bool:
     """Check if the type is Optional or Union.
     Args:
@@ -0,0 +1,30 @@
+"""Module for dropping cached responses after repository writes."""
+
+from functools import wraps
+from typing import Any, Callable
+
+from app.internal.repository.v1.redis.cache import response_cache
+
+__all__ = ["invalidate_cache"]
+
+
+def invalidate_cache(*tags: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """Decorator for dropping cached responses bound to the entity tags after
+    successful write.
+
+    Args:
+        *tags: Entity tags changed by the write.
+
+    Returns: Inner decorator.
+    """
+
+    def invalidate_cache_inner(function: Callable[..., Any]) -> Callable[..., Any]:
+        @wraps(function)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            result = await function(*args, **kwargs)
+            await response_cache.invalidate(*tags)
+            return result
+
+        return wrapper
+
+    return invalidate_cache_inner
@@ -0,0 +1,140 @@
+"""Repository for transactional outbox."""
+
+from typing import Any, Awaitable, Callable, List, Mapping
+
+from aiopg.pool import Cursor
+from psycopg2.extras import Json  # type: ignore
+
+from app.internal.repository.repository import Repository
+from app.internal.repository.v1.postgresql.connection import get_connection
+from app.internal.repository.v1.postgresql.handlers.handle_exception import (
+    handle_exception,
+)
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+__all__ = ["OutboxRepository", "write_outbox"]
+
+
+async def write_outbox(
+    cur: Cursor,
+    event_type: str,
+    payload: Mapping[str, Any] | None,
+    routing_key: str = settings.RABBITMQ.OUTBOX_ROUTING_KEY,
+) -> None:
+    """Write event row on the cursor of the running transaction.
+
+    Args:
+        cur: Cursor inside ``cur.begin()`` of the entity mutation.
+        event_type: Type of the event.
+        payload: Row of the mutated entity. ``None`` writes nothing.
+        routing_key: Routing key of the event.
+
+    Examples:
+        Event row is committed or rolled back together with the mutation::
+
+            >>> async with get_connection() as cur:
+            ...     async with cur.begin():
+            ...         await cur.execute(q, cmd.to_dict())
+            ...         city = await cur.fetchone()
+            ...         await write_outbox(cur, "city.created", city)
+    """
+
+    if payload is None:
+        return
+
+    q = """
+        insert into outbox (routing_key, event_type, payload)
+        values (%(routing_key)s, %(event_type)s, %(payload)s);
+    """
+    await cur.execute(
+        q,
+        {
+            "routing_key": routing_key,
+            "event_type": event_type,
+            "payload": Json(dict(payload)),
+        },
+    )
+
+
+class OutboxRepository(Repository):
+    """Outbox repository implementation."""
+
+    @handle_exception
+    async def relay(
+        self,
+        publish: Callable[[List[models.OutboxEvent]], Awaitable[Any]],
+        batch_size: int,
+        lease_ms: int,
+    ) -> int:
+        """Publish batch of pending events and delete them.
+
+        Rows are claimed for ``lease_ms`` in a short transaction with
+        ``FOR UPDATE SKIP LOCKED``, so relays of several processes share the
+        outbox without publishing the same row twice and no row lock is held
+        while the broker confirms. Rows are deleted after the confirmed
+        publish. If ``publish`` fails, the claim is released and rows stay
+        pending. Rows of the relay that died before the delete are claimed
+        again after the lease, so events are published at least once.
+
+        Args:
+            publish: Coroutine function that publishes events with confirms.
+            batch_size: Max count of rows in the batch.
+            lease_ms: Time in milliseconds the claimed rows are hidden from
+                other relays.
+
+        Returns:
+            Count of published events.
+        """
+
+        claim = """
+            update outbox
+            set claimed_until = now() + make_interval(secs => %(lease_ms)s / 1000.0)
+            where outbox_id in (
+                select outbox_id
+                from outbox
+                where claimed_until is null or claimed_until < now()
+                order by outbox_id
+                limit %(batch_size)s
+                for update skip locked
+            )
+            returning outbox_id,
+                      routing_key,
+                      event_type,
+                      payload;
+        """
+        release = """
+            update outbox
+            set claimed_until = null
+            where outbox_id = any(%(outbox_ids)s);
+        """
+        delete = """
+            delete from outbox
+            where outbox_id = any(%(outbox_ids)s);
+        """
+        async with get_connection() as cur:
+            async with cur.begin():
+                await cur.execute(
+                    claim,
+                    {"batch_size": batch_size, "lease_ms": lease_ms},
+                )
+                rows = await cur.fetchall()
+
+        events = sorted(
+            (models.OutboxEvent(**row) for row in rows),
+            key=lambda event: event.outbox_id,
+        )
+        if not events:
+            return 0
+
+        outbox_ids = [event.outbox_id for event in events]
+        try:
+            await publish(events)
+        except Exception:
+            async with get_connection() as cur:
+                await cur.execute(release, {"outbox_ids": outbox_ids})
+            raise
+
+        async with get_connection() as cur:
+            await cur.execute(delete, {"outbox_ids": outbox_ids})
+        return len(events)
@@ -3,9 +3,81 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.repository.v1.rabbitmq.event import EventRepository
+from app.internal.repository.v1.rabbitmq.rpc import RPCRepository
+from app.internal.repository.v1.rabbitmq.topology import Topology
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
 
 
 class Repositories(containers.DeclarativeContainer):
     """RabbitMQ repository container."""
 
-    base_repository = providers.Factory(BaseRepository)
+    configuration = providers.Configuration(name="settings")
+    configuration.from_dict(settings.model_dump())
+
+    topology = providers.Singleton(
+        Topology,
+        exchanges=providers.List(
+            providers.Factory(
+                models.ExchangeDeclaration,
+                name=configuration.RABBITMQ.EXCHANGE_NAME,
+                exchange_type=configuration.RABBITMQ.EXCHANGE_TYPE,
+            ),
+        ),
+        queues=providers.List(
+            providers.Factory(
+                models.QueueDeclaration,
+                name=configuration.RABBITMQ.BID_QUEUE_NAME,
+                bindings=providers.List(
+                    providers.Factory(
+                        models.QueueBinding,
+                        exchange=configuration.RABBITMQ.EXCHANGE_NAME,
+                        routing_key=configuration.RABBITMQ.BID_QUEUE_NAME,
+                    ),
+                ),
+            ),
+            providers.Factory(
+                models.QueueDeclaration,
+                name=configuration.RABBITMQ.BID_QUEUE_NAME_SECOND,
+                bindings=providers.List(
+                    providers.Factory(
+                        models.QueueBinding,
+                        exchange=configuration.RABBITMQ.EXCHANGE_NAME,
+                        routing_key=configuration.RABBITMQ.BID_QUEUE_NAME_SECOND,
+                    ),
+                ),
+            ),
+            # Outbox events are routed by the default exchange.
+            providers.Factory(
+                models.QueueDeclaration,
+                name=configuration.RABBITMQ.OUTBOX_ROUTING_KEY,
+            ),
+            # RPC requests are routed by the default exchange.
+            providers.Factory(
+                models.QueueDeclaration,
+                name=configuration.RABBITMQ.BID_STATUS_QUEUE_NAME,
+            ),
+        ),
+    )
+
+    base_repository = providers.Factory(
+        BaseRepository,
+        confirm_window=configuration.RABBITMQ.PUBLISH_CONFIRM_WINDOW,
+        compress_threshold=configuration.RABBITMQ.PUBLISH_COMPRESS_THRESHOLD,
+        topology=topology,
+        exchange_name=configuration.RABBITMQ.EXCHANGE_NAME,
+    )
+
+    event_repository = providers.Factory(
+        EventRepository,
+        confirm_window=configuration.RABBITMQ.PUBLISH_CONFIRM_WINDOW,
+        topology=topology,
+    )
+
+    # Replies of all calls of the process are consumed by one channel.
+    rpc_repository = providers.Singleton(
+        RPCRepository,
+        timeout_ms=configuration.RABBITMQ.RPC_TIMEOUT_MS,
+        compress_threshold=configuration.RABBITMQ.PUBLISH_COMPRESS_THRESHOLD,
+    )
@@ -1,26 +1,139 @@
 """Create base rabbitmq repository."""
 
-import json
-from typing import Any
+import asyncio
+from typing import Any, Sequence
 
 import aio_pika
 
+from app.internal.repository.transport import Transport
 from app.internal.repository.v1.rabbitmq.connection import get_connection
+from app.internal.repository.v1.rabbitmq.topology import Topology
+from app.pkg.codec import CONTENT_TYPE_JSON, encode_message
 
 __all__ = ["BaseRepository"]
 
 
-class BaseRepository:
-    """Create rabbitmq repository."""
+class BaseRepository(Transport):
+    """Create rabbitmq repository.
+
+    Attributes:
+        confirm_window:
+            Max count of messages of one batch waiting for publisher confirms
+            at the same time.
+        compress_threshold:
+            Min size in bytes of the message body to compress. ``None``
+            disables compression.
+        topology:
+            Topology with cached exchange handles. ``None`` publishes to the
+            default exchange.
+        exchange_name:
+            Exchange of published messages, declared by ``topology``.
+    """
+
+    confirm_window: int
+    compress_threshold: int | None
+    topology: Topology | None
+    exchange_name: str
+
+    def __init__(
+        self,
+        confirm_window: int = 256,
+        compress_threshold: int | None = None,
+        topology: Topology | None = None,
+        exchange_name: str = "",
+    ):
+        self.confirm_window = confirm_window
+        self.compress_threshold = compress_threshold
+        self.topology = topology
+        self.exchange_name = exchange_name
 
-    @staticmethod
     async def create(
+        self,
         message: Any,
         routing_key: str,
     ):
+        # Pooled channel is in confirm mode, publish waits for broker ack.
         async with get_connection() as channel:
-            await channel.default_exchange.publish(
-                aio_pika.Message(body=json.dumps(message.to_dict()).encode("utf-8")),
+            exchange = await self._exchange(channel)
+            await exchange.publish(
+                self._build_message(message),
                 routing_key=routing_key,
             )
             return message
+
+    async def create_many(
+        self,
+        messages: Sequence[Any],
+        routing_key: str,
+    ) -> Sequence[Any]:
+        """Publish batch of messages on one channel.
+
+        Messages of the window are sent without waiting for each other, then
+        confirms of the whole window are awaited.
+
+        Args:
+            messages: Messages to publish.
+            routing_key: Name of the target queue.
+
+        Returns:
+            Published messages.
+        """
+        async with get_connection() as channel:
+            exchange = await self._exchange(channel)
+            for start in range(0, len(messages), self.confirm_window):
+                await asyncio.gather(
+                    *[
+                        exchange.publish(
+                            self._build_message(message),
+                            routing_key=routing_key,
+                        )
+                        for message in messages[start : start + self.confirm_window]
+                    ],
+                )
+            return messages
+
+    @staticmethod
+    async def depth(queue_name: str) -> int:
+        """Count of messages ready in the queue, read by passive declare.
+
+        Args:
+            queue_name: Name of the queue.
+
+        Returns:
+            Count of ready messages.
+        """
+        async with get_connection() as channel:
+            queue = await channel.declare_queue(queue_name, passive=True)
+            return queue.declaration_result.message_count
+
+    async def _exchange(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+    ) -> aio_pika.abc.AbstractExchange:
+        """Exchange of the repository on the channel.
+
+        Args:
+            channel: Channel to publish on.
+
+        Returns:
+            Cached exchange handle.
+        """
+        if self.topology is None:
+            return channel.default_exchange
+        return await self.topology.exchange(channel, self.exchange_name)
+
+    def _build_message(self, message: Any) -> aio_pika.Message:
+        """Serialize model to AMQP message with content headers.
+
+        Args:
+            message: Model to publish.
+
+        Returns:
+            AMQP message.
+        """
+        body, content_encoding = encode_message(message, self.compress_threshold)
+        return aio_pika.Message(
+            body=body,
+            content_type=CONTENT_TYPE_JSON,
+            content_encoding=content_encoding,
+        )
@@ -8,13 +8,20 @@ from dependency_injector.wiring import Provide, inject
 
 from app.pkg.connectors import Connectors
 
-__all__ = ["get_connection", "acquire_connection"]
+__all__ = [
+    "get_connection",
+    "get_consumer_connection",
+    "acquire_connection",
+    "acquire_channel",
+    "open_channel",
+]
 
 
 @asynccontextmanager
 @inject
 async def get_connection(
     pool: aio_pika.pool.Pool = Provide[Connectors.rabbitmq.connector],
+    channel_pool: aio_pika.pool.Pool = Provide[Connectors.rabbitmq.channel_pool],
     return_pool: bool = False,
 ) -> Union[aio_pika.Channel, aio_pika.pool.Pool]:
     """Get async connection pool to rabbitmq.
@@ -22,8 +29,10 @@ async def get_connection(
     Args:
         pool:
             rabbitmq connection pool.
+        channel_pool:
+            rabbitmq pool of publisher channels in confirm mode.
         return_pool:
-            if True, return pool, else return connection.
+            if True, return pool of connections, else return pooled channel.
 
     Examples:
         If you have a function that contains a query in rabbitmq,
@@ -38,17 +47,73 @@ async def get_connection(
     Returns:
         Async connection to rabbitmq.
     """
-    if not isinstance(pool, aio_pika.pool.Pool):
-        pool = await pool
-
     if return_pool:
+        if not isinstance(pool, aio_pika.pool.Pool):
+            pool = await pool
         yield pool
         return
 
-    async with acquire_connection(pool) as channel:
+    if not isinstance(channel_pool, aio_pika.pool.Pool):
+        channel_pool = await channel_pool
+
+    async with acquire_channel(channel_pool) as channel:
         yield channel
 
 
+@asynccontextmanager
+@inject
+async def get_consumer_connection(
+    connection: aio_pika.abc.AbstractRobustConnection = Provide[
+        Connectors.rabbitmq.consumer_connection
+    ],
+) -> aio_pika.abc.AbstractRobustConnection:
+    """Get dedicated connection of consumers of the process.
+
+    Args:
+        connection:
+            rabbitmq connection shared by consumers.
+
+    Examples:
+        Every consumer opens own channel on the connection::
+
+            >>> async with get_consumer_connection() as connection:
+            ...     async with open_channel(connection) as channel:
+            ...         queue = await channel.declare_queue("queue_name")
+
+    Notes:
+        The connection is not closed on exit, it lives until shutdown of the
+        resources.
+
+    Returns:
+        Connection of consumers.
+    """
+    if not isinstance(connection, aio_pika.abc.AbstractRobustConnection):
+        connection = await connection
+
+    yield connection
+
+
+@asynccontextmanager
+async def open_channel(
+    connection: aio_pika.abc.AbstractConnection,
+) -> aio_pika.abc.AbstractChannel:
+    """Open channel on the connection and close it on exit.
+
+    Args:
+        connection:
+            Getings from :func:`.get_consumer_connection` connection.
+
+    Returns:
+        Opened channel.
+    """
+    channel = await connection.channel()
+    try:
+        yield channel
+    finally:
+        if not channel.is_closed:
+            await channel.close()
+
+
 @asynccontextmanager
 async def acquire_connection(
     pool: aio_pika.pool.Pool,
@@ -74,9 +139,43 @@ async def acquire_connection(
             ...             queue = await _cursor.get_queue("queue_name")
             ...             await queue.get()
 
+    Notes:
+        The channel is closed on exit. Use :func:`.acquire_channel` for
+        short-lived operations like publishing and
+        :func:`.get_consumer_connection` for long-lived consumers, they must
+        not hold connections of the pool.
+
     Returns:
         Async connection to rabbitmq.
     """
     async with pool.acquire() as conn:
         channel = await conn.channel()
+        try:
+            yield channel
+        finally:
+            if not channel.is_closed:
+                await channel.close()
+
+
+@asynccontextmanager
+async def acquire_channel(
+    channel_pool: aio_pika.pool.Pool,
+) -> aio_pika.abc.AbstractRobustChannel:
+    """Acquire channel from pool of channels.
+
+    Args:
+        channel_pool:
+            Getings from :attr:`.RabbitMQContainer.channel_pool` pool of channels.
+
+    Notes:
+        Channels closed by the broker (e.g. after channel-level error) are
+        reopened before they are given out, so the pool never hands out a
+        dead channel.
+
+    Returns:
+        Channel in confirm mode.
+    """
+    async with channel_pool.acquire() as channel:
+        if channel.is_closed:
+            await channel.reopen()
         yield channel
@@ -0,0 +1,68 @@
+"""Create rabbitmq repository of entity events."""
+
+import asyncio
+import json
+from typing import Sequence
+
+import aio_pika
+
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.repository.v1.rabbitmq.connection import get_connection
+from app.pkg.codec import CONTENT_TYPE_JSON
+from app.pkg.models import v1 as models
+
+__all__ = ["EventRepository"]
+
+
+class EventRepository(BaseRepository):
+    """Publish entity events relayed from the outbox table.
+
+    Events are routed by ``routing_key`` of the outbox row.
+    """
+
+    async def publish(
+        self,
+        events: Sequence[models.OutboxEvent],
+    ) -> Sequence[models.OutboxEvent]:
+        """Publish events on one channel and wait for publisher confirms.
+
+        Args:
+            events: Events to publish.
+
+        Returns:
+            Published events.
+        """
+        async with get_connection() as channel:
+            exchange = await self._exchange(channel)
+            for start in range(0, len(events), self.confirm_window):
+                await asyncio.gather(
+                    *[
+                        exchange.publish(
+                            self._build_event(event),
+                            routing_key=event.routing_key,
+                        )
+                        for event in events[start : start + self.confirm_window]
+                    ],
+                )
+            return events
+
+    @staticmethod
+    def _build_event(event: models.OutboxEvent) -> aio_pika.Message:
+        """Serialize outbox event to persistent AMQP message.
+
+        Outbox id is sent as ``message_id``, so consumers can drop events
+        published twice after a failed commit of the relay.
+
+        Args:
+            event: Event to publish.
+
+        Returns:
+            AMQP message.
+        """
+        return aio_pika.Message(
+            body=json.dumps(event.payload, default=str).encode(),
+            content_type=CONTENT_TYPE_JSON,
+            type=event.event_type,
+            message_id=str(event.outbox_id),
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
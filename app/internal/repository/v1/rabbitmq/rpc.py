@@ -0,0 +1,157 @@
+"""Create rabbitmq repository for request/reply calls."""
+
+import asyncio
+import uuid
+from typing import Any, Optional, Type
+
+import aio_pika
+
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.repository.v1.rabbitmq.connection import get_consumer_connection
+from app.pkg.codec import decode_message
+from app.pkg.logger import get_logger
+from app.pkg.models.base import Model
+from app.pkg.models.v1.exceptions.rpc import RPCTimeout, RPCUnroutable
+
+__all__ = ["RPCRepository", "REPLY_TO"]
+
+#: Pseudo-queue of RabbitMQ direct reply-to.
+REPLY_TO = "amq.rabbitmq.reply-to"
+
+
+class RPCRepository(BaseRepository):
+    """Publish request and wait for the reply of the worker.
+
+    Requests are published to the queue named ``routing_key`` through the
+    default exchange with ``correlation_id`` and ``reply_to`` set to direct
+    reply-to, so replies need no queue per caller. Requests are ``mandatory``,
+    the call fails at once with :class:`.RPCUnroutable` if no queue takes the
+    request. One channel of the process consumes all replies and resolves
+    pending futures by ``correlation_id``. Request expires in the queue
+    together with the timeout of the call, so workers do not process requests
+    nobody waits for.
+
+    Attributes:
+        timeout_ms: Default time in milliseconds to wait for the reply.
+
+    Examples:
+        Callback of the consumer replies by returning a model::
+
+            >>> async def read_bid_status(query: models.ReadBidStatusQuery):
+            ...     return models.BidStatus(bid_name=query.bid_name, status="done")
+            >>> status = await rpc_repository.call(
+            ...     models.ReadBidStatusQuery(bid_name="bid"),
+            ...     routing_key="bid_status",
+            ...     response_model=models.BidStatus,
+            ... )
+    """
+
+    timeout_ms: int
+
+    def __init__(self, timeout_ms: int = 5000, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.timeout_ms = timeout_ms
+        self.__channel: Optional[aio_pika.abc.AbstractChannel] = None
+        self.__futures: dict[str, asyncio.Future] = {}
+        self.__lock = asyncio.Lock()
+        self.__logger = get_logger(__name__)
+
+    async def call(
+        self,
+        message: Model,
+        routing_key: str,
+        response_model: Type[Model],
+        timeout_ms: Optional[int] = None,
+    ) -> Model:
+        """Publish request and wait for the reply.
+
+        Args:
+            message: Request to publish.
+            routing_key: Name of the queue of the request.
+            response_model: Model of the reply.
+            timeout_ms: Time in milliseconds to wait for the reply. Default
+                is :attr:`.timeout_ms`.
+
+        Raises:
+            RPCTimeout: Reply did not come in time.
+            RPCUnroutable: Request was returned by the broker, no queue
+                takes it.
+
+        Returns:
+            Decoded reply.
+        """
+        timeout_ms = timeout_ms or self.timeout_ms
+        channel = await self.__start()
+        correlation_id = uuid.uuid4().hex
+        future = asyncio.get_running_loop().create_future()
+        self.__futures[correlation_id] = future
+
+        request = self._build_message(message)
+        request.correlation_id = correlation_id
+        # Returned message is matched to its publish by ``message_id``.
+        request.message_id = correlation_id
+        request.reply_to = REPLY_TO
+        # ``aio_pika`` sends ``str(int(seconds * 1000))``, half a millisecond
+        # keeps float error from truncating e.g. 1001 ms to ``"1000"``.
+        request.expiration = (timeout_ms + 0.5) / 1000
+        try:
+            # Direct reply-to requires publishing on the consuming channel.
+            await channel.default_exchange.publish(
+                request,
+                routing_key=routing_key,
+                mandatory=True,
+            )
+            reply = await asyncio.wait_for(future, timeout=timeout_ms / 1000)
+        except aio_pika.exceptions.PublishError:
+            raise RPCUnroutable from None
+        except asyncio.TimeoutError:
+            raise RPCTimeout from None
+        finally:
+            self.__futures.pop(correlation_id, None)
+
+        return decode_message(
+            reply.body,
+            response_model,
+            content_type=reply.content_type,
+            content_encoding=reply.content_encoding,
+        )
+
+    async def close(self) -> None:
+        """Cancel pending calls and close the reply channel."""
+        for future in self.__futures.values():
+            future.cancel()
+        self.__futures.clear()
+        if self.__channel is not None and not self.__channel.is_closed:
+            await self.__channel.close()
+        self.__channel = None
+
+    async def __start(self) -> aio_pika.abc.AbstractChannel:
+        """Open the channel and start the consumer of replies once.
+
+        Returns:
+            Channel of the process for requests and replies.
+        """
+        async with self.__lock:
+            if self.__channel is None or self.__channel.is_closed:
+                async with get_consumer_connection() as connection:
+                    self.__channel = await connection.channel(
+                        on_return_raises=True,
+                    )
+                queue = await self.__channel.get_queue(REPLY_TO, ensure=False)
+                await queue.consume(self.__on_reply, no_ack=True)
+            return self.__channel
+
+    async def __on_reply(self, message: aio_pika.abc.AbstractIncomingMessage) -> None:
+        """Resolve pending call of the reply.
+
+        Args:
+            message: Reply of the worker.
+        """
+        future = self.__futures.get(message.correlation_id)
+        if future is None or future.done():
+            self.__logger.warning(
+                "Drop late reply with correlation id %s.",
+                message.correlation_id,
+            )
+            return
+        future.set_result(message)
@@ -0,0 +1,129 @@
+"""Rabbitmq topology declared at startup."""
+
+from typing import List
+from weakref import WeakKeyDictionary
+
+import aio_pika
+
+from app.internal.repository.v1.rabbitmq.connection import get_connection
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+
+__all__ = ["Topology"]
+
+
+class Topology:
+    """Declare exchanges, queues and bindings once and cache exchange handles.
+
+    Repositories publish through :meth:`.exchange`, which returns a cached
+    handle of the declared exchange without a round-trip to the broker.
+
+    Attributes:
+        exchanges: Exchanges to declare.
+        queues: Queues to declare with their bindings.
+
+    Examples:
+        Declaration runs in the lifespan, so incompatible arguments of the
+        existing entity stop the startup::
+
+            >>> async with get_connection() as channel:
+            ...     await topology.declare(channel)
+            ...     exchange = await topology.exchange(channel, "bids")
+            ...     await exchange.publish(message, routing_key="rabbit__channel")
+    """
+
+    def __init__(
+        self,
+        exchanges: List[models.ExchangeDeclaration],
+        queues: List[models.QueueDeclaration],
+    ):
+        self.exchanges = exchanges
+        self.queues = queues
+        self.__handles: WeakKeyDictionary[
+            aio_pika.abc.AbstractChannel,
+            dict[str, aio_pika.abc.AbstractExchange],
+        ] = WeakKeyDictionary()
+        self.__logger = get_logger(__name__)
+
+    async def declare(
+        self,
+        channel: aio_pika.abc.AbstractChannel | None = None,
+    ) -> None:
+        """Declare all entities of the topology.
+
+        Args:
+            channel: Channel to declare on. Pooled channel is used if it is not
+                passed.
+
+        Raises:
+            aio_pika.exceptions.ChannelPreconditionFailed: Entity already
+                exists with other type or arguments.
+        """
+        if channel is None:
+            async with get_connection() as pooled_channel:
+                await self.declare(pooled_channel)
+            return
+
+        # Default exchange with empty name exists and routes by queue name.
+        for declaration in self.exchanges:
+            if not declaration.name:
+                continue
+            self.__cache(channel)[declaration.name] = await channel.declare_exchange(
+                declaration.name,
+                type=aio_pika.ExchangeType(declaration.exchange_type),
+                durable=declaration.durable,
+                arguments=declaration.arguments or None,
+            )
+        for declaration in self.queues:
+            queue = await channel.declare_queue(
+                declaration.name,
+                durable=declaration.durable,
+                arguments=declaration.arguments or None,
+            )
+            for binding in declaration.bindings:
+                if not binding.exchange:
+                    continue
+                await queue.bind(binding.exchange, routing_key=binding.routing_key)
+        self.__logger.info(
+            "Declared %s exchanges and %s queues.",
+            len(self.exchanges),
+            len(self.queues),
+        )
+
+    async def exchange(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        name: str,
+    ) -> aio_pika.abc.AbstractExchange:
+        """Cached handle of the exchange on the channel.
+
+        Args:
+            channel: Channel to publish on.
+            name: Name of the exchange. Empty name is the default exchange.
+
+        Returns:
+            Exchange handle.
+        """
+        if not name:
+            return channel.default_exchange
+
+        handles = self.__cache(channel)
+        if name not in handles:
+            # Exchange is declared at startup, so the handle needs no
+            # round-trip to the broker.
+            handles[name] = await channel.get_exchange(name, ensure=False)
+        return handles[name]
+
+    def __cache(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+    ) -> dict[str, aio_pika.abc.AbstractExchange]:
+        """Exchange handles of the channel.
+
+        Args:
+            channel: Channel of the handles.
+
+        Returns:
+            Mutable mapping from exchange name to handle.
+        """
+        return self.__handles.setdefault(channel, {})
@@ -3,7 +3,23 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository.v1.redis.base_repository import BaseRedisRepository
+from app.internal.repository.v1.redis.consumer_metrics import (
+    ConsumerMetricsRepository,
+)
+from app.internal.repository.v1.redis.idempotency import IdempotencyRepository
+from app.internal.repository.v1.redis.stream import StreamRepository
+from app.pkg.settings import settings
 
 
 class RedisRepositories(containers.DeclarativeContainer):
+    configuration = providers.Configuration(name="settings")
+    configuration.from_dict(settings.model_dump())
+
     base_redis_repository = providers.Factory(BaseRedisRepository)
+    idempotency_repository = providers.Factory(IdempotencyRepository)
+    consumer_metrics_repository = providers.Factory(ConsumerMetricsRepository)
+    stream_repository = providers.Factory(
+        StreamRepository,
+        maxlen=configuration.REDIS.STREAM_MAXLEN,
+        compress_threshold=configuration.RABBITMQ.PUBLISH_COMPRESS_THRESHOLD,
+    )
@@ -0,0 +1,144 @@
+"""Repository for cached values bound to entity tags."""
+
+from typing import Iterable, Sequence
+
+from redis.exceptions import WatchError
+
+from app.internal.repository.v1.redis.connection import get_connection
+from app.pkg.cache import LocalCache, TwoLayerCache
+from app.pkg.settings import settings
+
+__all__ = ["CacheRepository", "response_cache"]
+
+
+class CacheRepository:
+    """Store cached values in redis and drop them by entity tags.
+
+    Every tag is a redis set with keys of the values tagged by it and a
+    counter with version of the tag, bumped on every invalidation.
+    """
+
+    @staticmethod
+    def tag_key(tag: str) -> str:
+        """Build redis key of the tag set.
+
+        Args:
+            tag: Entity tag.
+
+        Returns:
+            Redis key of the set with tagged keys.
+        """
+        return f"cache:tag:{tag}"
+
+    @staticmethod
+    def version_key(tag: str) -> str:
+        """Build redis key of the tag version.
+
+        Args:
+            tag: Entity tag.
+
+        Returns:
+            Redis key of the version counter.
+        """
+        return f"cache:version:{tag}"
+
+    async def create(
+        self,
+        redis_key: str,
+        value: bytes,
+        tags: Iterable[str],
+        expire_time: int,
+        versions: Sequence[int] | None = None,
+    ) -> bool:
+        """Store value and bind it to the tags.
+
+        Args:
+            redis_key: Key of the value.
+            value: Cached value.
+            tags: Entity tags of the value.
+            expire_time: TTL of the value in seconds.
+            versions: Versions of the tags read before the value was built.
+                Versions are watched, so the value is not stored if any tag
+                was invalidated since then.
+
+        Returns:
+            ``True`` if the value was stored.
+        """
+        tags = tuple(tags)
+        async with get_connection() as connect:
+            async with connect.pipeline(transaction=True) as pipe:
+                if versions is not None:
+                    version_keys = [self.version_key(tag) for tag in tags]
+                    await pipe.watch(*version_keys)
+                    current = await pipe.mget(version_keys)
+                    if [int(version or 0) for version in current] != list(versions):
+                        return False
+                    pipe.multi()
+                pipe.set(redis_key, value, ex=expire_time)
+                for tag in tags:
+                    pipe.sadd(self.tag_key(tag), redis_key)
+                    pipe.expire(self.tag_key(tag), expire_time, gt=True)
+                    pipe.expire(self.tag_key(tag), expire_time, nx=True)
+                try:
+                    await pipe.execute()
+                except WatchError:
+                    return False
+        return True
+
+    @staticmethod
+    async def read(redis_key: str) -> bytes | None:
+        """Read cached value.
+
+        Args:
+            redis_key: Key of the value.
+
+        Returns:
+            Cached value or ``None`` if key does not exist.
+        """
+        async with get_connection() as connect:
+            return await connect.get(redis_key)
+
+    async def read_versions(self, tags: Sequence[str]) -> list[int]:
+        """Read versions of the tags.
+
+        Args:
+            tags: Entity tags.
+
+        Returns:
+            Versions in order of ``tags``, ``0`` for tags never invalidated.
+        """
+        if not tags:
+            return []
+        async with get_connection() as connect:
+            versions = await connect.mget([self.version_key(tag) for tag in tags])
+        return [int(version or 0) for version in versions]
+
+    async def delete_by_tags(self, tags: Iterable[str]) -> None:
+        """Bump versions of the tags and drop all values bound to them.
+
+        Args:
+            tags: Entity tags.
+        """
+        tags = tuple(tags)
+        if not tags:
+            return
+        tag_keys = [self.tag_key(tag) for tag in tags]
+        async with get_connection() as connect:
+            # Versions are bumped first, so values built before the write can
+            # not be stored between the read of the keys and their deletion.
+            async with connect.pipeline(transaction=True) as pipe:
+                for tag in tags:
+                    pipe.incr(self.version_key(tag))
+                await pipe.execute()
+            keys = await connect.sunion(tag_keys)
+            await connect.delete(*keys, *tag_keys)
+
+
+#: TwoLayerCache: Cache of the responses of GET routes.
+response_cache = TwoLayerCache(
+    local=LocalCache(
+        max_size=settings.API.RESPONSE_CACHE_LOCAL_MAX_SIZE,
+        ttl=settings.API.RESPONSE_CACHE_LOCAL_TTL,
+    ),
+    repository=CacheRepository(),
+)
@@ -1,10 +1,10 @@
 """Create connection to redis."""
 
 from contextlib import asynccontextmanager
-from typing import Union
+from typing import AsyncIterator
 
 from dependency_injector.wiring import Provide, inject
-from redis.asyncio.connection import Connection, ConnectionPool
+from redis.asyncio import Redis
 
 from app.pkg.connectors import Connectors
 
@@ -14,27 +14,23 @@ __all__ = ["get_connection"]
 @asynccontextmanager
 @inject
 async def get_connection(
-    pool: ConnectionPool = Provide[Connectors.redis.connector],
-    return_pool: bool = False,
-) -> Union[Connection, ConnectionPool]:
-    """Get async connection pool to redis.
+    client: Redis = Provide[Connectors.redis.connector],
+) -> AsyncIterator[Redis]:
+    """Get async client of redis.
 
     Args:
-        pool:
-            redis connection pool.
-        return_pool:
-            if True, return pool, else return connection.
+        client:
+            redis client with connection pool, shared between calls.
+
+    Notes:
+        The client is not closed on exit: ``async with client`` would
+        disconnect every pooled connection after each command.
 
     Returns:
-        Async connection to redis.
+        Async client of redis.
     """
 
-    if not isinstance(pool, ConnectionPool):
-        pool = await pool
-
-    if return_pool:
-        yield pool
-        return
+    if not isinstance(client, Redis):
+        client = await client
 
-    async with pool as connection:
-        yield connection
+    yield client
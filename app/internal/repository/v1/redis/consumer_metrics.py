@@ -0,0 +1,54 @@
+"""Repository for metrics reported by consumer processes."""
+
+from typing import List
+
+from app.internal.repository.v1.redis.connection import get_connection
+from app.pkg.models import v1 as models
+
+__all__ = ["ConsumerMetricsRepository"]
+
+
+class ConsumerMetricsRepository:
+    """Store the latest metrics of every consumer process in redis.
+
+    Key of the process expires if the process stops reporting.
+    """
+
+    prefix = "consumer_metrics"
+
+    async def create(
+        self,
+        cmd: models.ConsumerProcessMetrics,
+        expire_time: int,
+    ) -> None:
+        """Store metrics of the process.
+
+        Args:
+            cmd: Metrics of the process.
+            expire_time: TTL of the metrics in seconds.
+        """
+        async with get_connection() as connect:
+            await connect.set(
+                f"{self.prefix}:{cmd.process}",
+                cmd.model_dump_json(),
+                ex=expire_time,
+            )
+
+    async def read_all(self) -> List[models.ConsumerProcessMetrics]:
+        """Read metrics of all alive processes.
+
+        Returns:
+            Metrics of the processes sorted by process name.
+        """
+        async with get_connection() as connect:
+            keys = sorted(
+                [key async for key in connect.scan_iter(match=f"{self.prefix}:*")],
+            )
+            if not keys:
+                return []
+            values = await connect.mget(keys)
+        return [
+            models.ConsumerProcessMetrics.model_validate_json(value)
+            for value in values
+            if value is not None
+        ]
@@ -0,0 +1,79 @@
+"""Repository for responses of idempotent requests."""
+
+from typing import Optional
+
+from app.internal.repository.v1.redis.connection import get_connection
+from app.internal.repository.v1.redis.handlers.collect_response import collect_response
+from app.pkg.models import v1 as models
+
+__all__ = ["IdempotencyRepository"]
+
+
+class IdempotencyRepository:
+    """Store responses bound to ``Idempotency-Key`` header in redis."""
+
+    @staticmethod
+    async def create(
+        redis_key: str,
+        cmd: models.IdempotentResponse,
+        expire_time: int,
+    ) -> bool:
+        """Reserve idempotency key.
+
+        Args:
+            redis_key: Key of the idempotent request.
+            cmd: Initial state of the request.
+            expire_time: TTL of the key in seconds.
+
+        Returns:
+            ``True`` if the key was reserved by this call, ``False`` if the key
+            already exists.
+        """
+        async with get_connection() as connect:
+            return bool(
+                await connect.set(
+                    redis_key,
+                    cmd.model_dump_json(),
+                    ex=expire_time,
+                    nx=True,
+                ),
+            )
+
+    @staticmethod
+    async def update(
+        redis_key: str,
+        cmd: models.IdempotentResponse,
+        expire_time: int,
+    ) -> None:
+        """Store the final response of the request.
+
+        Args:
+            redis_key: Key of the idempotent request.
+            cmd: Response of the request.
+            expire_time: TTL of the key in seconds.
+        """
+        async with get_connection() as connect:
+            await connect.set(redis_key, cmd.model_dump_json(), ex=expire_time)
+
+    @collect_response
+    async def read(self, redis_key: str) -> Optional[models.IdempotentResponse]:
+        """Read stored state of the request.
+
+        Args:
+            redis_key: Key of the idempotent request.
+
+        Returns:
+            Stored state of the request or ``None`` if key does not exist.
+        """
+        async with get_connection() as connect:
+            return await connect.get(redis_key)
+
+    @staticmethod
+    async def delete(redis_key: str) -> None:
+        """Release idempotency key.
+
+        Args:
+            redis_key: Key of the idempotent request.
+        """
+        async with get_connection() as connect:
+            await connect.delete(redis_key)
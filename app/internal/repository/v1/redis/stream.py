@@ -0,0 +1,279 @@
+"""Redis Streams transport for messages."""
+
+from typing import Any, Sequence, Type
+
+from redis.exceptions import ResponseError
+
+from app.internal.repository.transport import Transport
+from app.internal.repository.v1.redis.connection import get_connection
+from app.pkg.codec import CONTENT_TYPE_JSON, decode_message, encode_message
+from app.pkg.models.base import Model
+
+__all__ = ["StreamRepository", "StreamEntry"]
+
+#: tuple[bytes, dict[bytes, bytes]]: Id and fields of the stream entry.
+StreamEntry = tuple[bytes, dict[bytes, bytes]]
+
+
+class StreamRepository(Transport):
+    """Publish and consume messages through redis streams.
+
+    Attributes:
+        maxlen:
+            Approximate max length of the stream. Older entries are trimmed by
+            ``XADD MAXLEN ~``.
+        compress_threshold:
+            Min size in bytes of the message body to compress. ``None``
+            disables compression.
+
+    Notes:
+        Every entry has ``body``, ``content_type`` and optional
+        ``content_encoding`` fields.
+    """
+
+    maxlen: int
+    compress_threshold: int | None
+
+    def __init__(self, maxlen: int, compress_threshold: int | None = None):
+        self.maxlen = maxlen
+        self.compress_threshold = compress_threshold
+
+    async def create(self, message: Any, routing_key: str):
+        """Append message to the stream with ``XADD``.
+
+        Args:
+            message: Message to publish.
+            routing_key: Name of the stream.
+
+        Returns:
+            Published message.
+        """
+        async with get_connection() as connect:
+            await connect.xadd(
+                routing_key,
+                self._build_fields(message),
+                maxlen=self.maxlen,
+                approximate=True,
+            )
+            return message
+
+    async def create_many(self, messages: Sequence[Any], routing_key: str):
+        """Append batch of messages to the stream in one pipeline.
+
+        Args:
+            messages: Messages to publish.
+            routing_key: Name of the stream.
+
+        Returns:
+            Published messages.
+        """
+        async with get_connection() as connect:
+            async with connect.pipeline(transaction=False) as pipe:
+                for message in messages:
+                    pipe.xadd(
+                        routing_key,
+                        self._build_fields(message),
+                        maxlen=self.maxlen,
+                        approximate=True,
+                    )
+                await pipe.execute()
+            return messages
+
+    def _build_fields(self, message: Any) -> dict[str, bytes | str]:
+        """Serialize model to fields of the stream entry.
+
+        Args:
+            message: Model to publish.
+
+        Returns:
+            Fields of the stream entry.
+        """
+        body, content_encoding = encode_message(message, self.compress_threshold)
+        fields = {"body": body, "content_type": CONTENT_TYPE_JSON}
+        if content_encoding:
+            fields["content_encoding"] = content_encoding
+        return fields
+
+    @staticmethod
+    def parse_fields(fields: dict[bytes, bytes], model: Type[Model]) -> Model:
+        """Deserialize fields of the stream entry to model.
+
+        Args:
+            fields: Fields of the stream entry.
+            model: Model of the message.
+
+        Raises:
+            KeyError: Entry has no ``body`` field.
+            ValueError: Body can not be decoded into ``model``.
+
+        Returns:
+            Decoded message.
+        """
+        content_type = fields.get(b"content_type")
+        content_encoding = fields.get(b"content_encoding")
+        return decode_message(
+            fields[b"body"],
+            model,
+            content_type=content_type.decode() if content_type else None,
+            content_encoding=content_encoding.decode() if content_encoding else None,
+        )
+
+    @staticmethod
+    async def create_group(stream: str, group: str) -> None:
+        """Create consumer group of the stream if it does not exist.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+        """
+        async with get_connection() as connect:
+            try:
+                await connect.xgroup_create(stream, group, id="0", mkstream=True)
+            except ResponseError as error:
+                if "BUSYGROUP" not in str(error):
+                    raise
+
+    @staticmethod
+    async def read_group(
+        stream: str,
+        group: str,
+        consumer: str,
+        count: int,
+        block: int | None,
+    ) -> list[StreamEntry]:
+        """Read batch of new messages for the consumer with ``XREADGROUP``.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+            consumer: Name of the consumer inside the group.
+            count: Max count of messages in the batch.
+            block: Time in milliseconds to wait for new messages. ``None``
+                returns at once.
+
+        Returns:
+            List of stream entries.
+        """
+        async with get_connection() as connect:
+            response = await connect.xreadgroup(
+                group,
+                consumer,
+                {stream: ">"},
+                count=count,
+                block=block,
+            )
+        if not response:
+            return []
+        _, entries = response[0]
+        return entries
+
+    @staticmethod
+    async def claim(
+        stream: str,
+        group: str,
+        consumer: str,
+        min_idle_time: int,
+        count: int,
+    ) -> list[StreamEntry]:
+        """Take over messages stuck in pending lists of other consumers with
+        ``XAUTOCLAIM``.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+            consumer: Name of the consumer which gets the messages.
+            min_idle_time: Min idle time in milliseconds of the pending message.
+            count: Max count of claimed messages.
+
+        Returns:
+            List of claimed stream entries.
+        """
+        async with get_connection() as connect:
+            response = await connect.xautoclaim(
+                stream,
+                group,
+                consumer,
+                min_idle_time=min_idle_time,
+                count=count,
+            )
+        return [entry for entry in response[1] if entry[1] is not None]
+
+    @staticmethod
+    async def deliveries(stream: str, group: str, *entry_ids: bytes) -> list[int]:
+        """Count of deliveries of pending messages from ``XPENDING``.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+            *entry_ids: Ids of pending entries.
+
+        Returns:
+            Count of deliveries for every entry, ``0`` for entries which are
+            not pending.
+        """
+        if not entry_ids:
+            return []
+        async with get_connection() as connect:
+            async with connect.pipeline(transaction=False) as pipe:
+                for entry_id in entry_ids:
+                    pipe.xpending_range(stream, group, entry_id, entry_id, 1)
+                responses = await pipe.execute()
+        return [
+            response[0]["times_delivered"] if response else 0
+            for response in responses
+        ]
+
+    @staticmethod
+    async def dead_letter(
+        stream: str,
+        group: str,
+        entries: Sequence[StreamEntry],
+    ) -> None:
+        """Move messages to the ``<stream>.dlq`` stream and acknowledge them.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+            entries: Stream entries to move.
+        """
+        if not entries:
+            return
+        async with get_connection() as connect:
+            async with connect.pipeline(transaction=True) as pipe:
+                for _, fields in entries:
+                    pipe.xadd(f"{stream}.dlq", fields)
+                pipe.xack(stream, group, *[entry_id for entry_id, _ in entries])
+                await pipe.execute()
+
+    @staticmethod
+    async def lag(stream: str, group: str) -> int | None:
+        """Count of entries not yet delivered to the consumer group.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+
+        Returns:
+            Lag of the group or ``None`` if redis does not report it.
+        """
+        async with get_connection() as connect:
+            groups = await connect.xinfo_groups(stream)
+        for info in groups:
+            name = info.get("name")
+            if name in (group, group.encode()):
+                return info.get("lag")
+        return None
+
+    @staticmethod
+    async def ack(stream: str, group: str, *entry_ids: bytes) -> None:
+        """Acknowledge processed messages with ``XACK``.
+
+        Args:
+            stream: Name of the stream.
+            group: Name of the consumer group.
+            *entry_ids: Ids of processed entries.
+        """
+        if not entry_ids:
+            return
+        async with get_connection() as connect:
+            await connect.xack(stream, group, *entry_ids)
@@ -9,7 +9,7 @@ Examples:
         >>> __routes__.register_routes(app=app)
 """
 
-from app.internal.routes import v1
+from app.internal.routes import health, v1
 from app.pkg.models.core.routes import Routes
 
 __all__ = [
@@ -18,5 +18,8 @@ __all__ = [
 
 
 __routes__ = Routes(
-    routers=(v1.router,),
+    routers=(
+        v1.router,
+        health.router,
+    ),
 )
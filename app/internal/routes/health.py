@@ -0,0 +1,50 @@
+"""Health routes module."""
+
+from typing import List
+
+from dependency_injector.wiring import Provide, inject
+from fastapi import APIRouter, Depends
+from starlette import status
+
+from app.internal.services import Services
+from app.internal.services.v1.health import HealthService
+from app.pkg.models import v1 as models
+
+router = APIRouter(
+    prefix="/health",
+    tags=["Health"],
+)
+
+
+@router.get(
+    "/consumers",
+    response_model=List[models.ConsumerProcessMetrics],
+    status_code=status.HTTP_200_OK,
+    description="""
+    Description: Latest metrics of alive consumer processes: counters,
+    processing time histogram, in-flight callbacks and queue depth."
+    Used: Used in monitoring.
+    """,
+)
+@inject
+async def read_consumers(
+    health_service: HealthService = Depends(Provide[Services.v1.health_service]),
+):
+    return await health_service.read_consumers()
+
+
+@router.get(
+    "/clients",
+    response_model=List[models.BulkheadState],
+    status_code=status.HTTP_200_OK,
+    description="""
+    Description: Occupancy of bulkheads of outbound clients of the process:
+    running and waiting requests and count of rejected ones.
+    Used: Used in monitoring.
+    """,
+)
+@inject
+async def read_clients(
+    health_service: HealthService = Depends(Provide[Services.v1.health_service]),
+):
+    return health_service.read_clients()
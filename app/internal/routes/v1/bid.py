@@ -1,18 +1,22 @@
 """Consumer routes module."""
 
+from typing import Annotated, List
+
 from dependency_injector.wiring import Provide, inject
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Body, Depends
 from starlette import status
 
+from app.internal.pkg.middlewares.idempotency import IdempotencyRoute, idempotent
+from app.internal.repository.publish_buffer import PublishBuffer
 from app.internal.services import Services
 from app.internal.services.v1 import BidService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.settings import settings
 
 router = APIRouter(
     prefix="/bid",
     tags=["Bid V1"],
-    route_class=RequestIDRoute,
+    route_class=IdempotencyRoute,
 )
 
 
@@ -24,6 +28,7 @@ router = APIRouter(
     Used: Used in backend.
     """,
 )
+@idempotent()
 @inject
 async def create_bid(
     cmd: models.CreateBidCommand,
@@ -32,6 +37,26 @@ async def create_bid(
     await bid_service.create_bid(cmd)
 
 
+@router.post(
+    "/batch",
+    status_code=status.HTTP_204_NO_CONTENT,
+    description="""
+    Description: Bid route - create batch of bids in one request."
+    Used: Used in backend.
+    """,
+)
+@idempotent()
+@inject
+async def create_bids(
+    cmds: Annotated[
+        List[models.CreateBidCommand],
+        Body(min_length=1, max_length=settings.API.BID_BATCH_MAX_SIZE),
+    ],
+    bid_service: BidService = Depends(Provide[Services.v1.bid_service]),
+):
+    await bid_service.create_bids(cmds)
+
+
 @router.post(
     "/second",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -40,9 +65,47 @@ async def create_bid(
     Used: Used in backend.
     """,
 )
+@idempotent()
 @inject
 async def create_bid_second(
     cmd: models.CreateBidCommand,
     bid_service: BidService = Depends(Provide[Services.v1.bid_service]),
 ):
     await bid_service.create_bid_second(cmd)
+
+
+@router.get(
+    "/status/{bid_name}",
+    response_model=models.BidStatus,
+    status_code=status.HTTP_200_OK,
+    description="""
+    Description: Status of the bid, answered by consumers through RPC."
+    Used: Used in backend.
+    """,
+)
+@inject
+async def read_bid_status(
+    bid_name: str,
+    bid_service: BidService = Depends(Provide[Services.v1.bid_service]),
+):
+    return await bid_service.read_bid_status(
+        models.ReadBidStatusQuery(bid_name=bid_name),
+    )
+
+
+@router.get(
+    "/buffer",
+    response_model=List[models.PublishBufferMetrics],
+    status_code=status.HTTP_200_OK,
+    description="""
+    Description: Depth and counters of bid publish buffers."
+    Used: Used in monitoring.
+    """,
+)
+@inject
+async def read_publish_buffers(
+    publish_buffers: List[PublishBuffer] = Depends(
+        Provide[Services.v1.publish_buffers],
+    ),
+):
+    return [publish_buffer.metrics() for publish_buffer in publish_buffers]
@@ -5,18 +5,20 @@ from typing import List
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, status
 
+from app.internal.pkg.middlewares.idempotency import idempotent
+from app.internal.pkg.middlewares.response_cache import ResponseCacheRoute, cached
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
 from app.internal.services import Services
 from app.internal.services.v1.city import CityService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.models.base.json_response import direct_response
 
 router = APIRouter(
     prefix="/city",
     tags=["City"],
-    route_class=RequestIDRoute,
+    route_class=ResponseCacheRoute,
 )
 
 
@@ -30,6 +32,8 @@ router = APIRouter(
     """,
     dependencies=[Depends(token_based_verification)],
 )
+@cached(tags=("city",))
+@direct_response()
 @inject
 async def read_all_city(
     city_service: CityService = Depends(Provide[Services.v1.city_service]),
@@ -46,6 +50,8 @@ async def read_all_city(
     Used: Used in frontend.
     """,
 )
+@cached(tags=("city",))
+@direct_response()
 @inject
 async def read_city_by_country(
     country_code: str,
@@ -66,6 +72,7 @@ async def read_city_by_country(
     """,
     dependencies=[Depends(token_based_verification)],
 )
+@idempotent()
 @inject
 async def create_city(
     cmd: models.CreateCityCommand,
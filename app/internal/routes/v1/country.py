@@ -5,18 +5,20 @@ from typing import List
 from dependency_injector.wiring import Provide, inject
 from fastapi import APIRouter, Depends, status
 
+from app.internal.pkg.middlewares.idempotency import idempotent
+from app.internal.pkg.middlewares.response_cache import ResponseCacheRoute, cached
 from app.internal.pkg.middlewares.token_based_verification import (
     token_based_verification,
 )
 from app.internal.services import Services
 from app.internal.services.v1.country import CountryService
 from app.pkg.models import v1 as models
-from app.pkg.models.base.request_id_route import RequestIDRoute
+from app.pkg.models.base.json_response import direct_response
 
 router = APIRouter(
     prefix="/country",
     tags=["Country"],
-    route_class=RequestIDRoute,
+    route_class=ResponseCacheRoute,
 )
 
 
@@ -29,6 +31,8 @@ router = APIRouter(
     Used: Used in frontend.
     """,
 )
+@cached(tags=("country",))
+@direct_response()
 @inject
 async def read_all_country(
     country_service: CountryService = Depends(Provide[Services.v1.country_service]),
@@ -45,6 +49,7 @@ async def read_all_country(
     Used: This method is used as an example of injecting one service into another.
     """,
 )
+@direct_response()
 @inject
 async def read_country_with_cities(
     country_service: CountryService = Depends(Provide[Services.v1.country_service]),
@@ -82,6 +87,7 @@ async def read_country(
     """,
     dependencies=[Depends(token_based_verification)],
 )
+@idempotent()
 @inject
 async def create_country(
     cmd: models.CreateCountryCommand,
@@ -3,10 +3,13 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories
-from app.internal.repository.v1 import postgresql, rabbitmq
+from app.internal.repository.publish_buffer import PublishBuffer
+from app.internal.repository.v1 import postgresql, rabbitmq, redis
 from app.internal.services.v1.bid import BidService
 from app.internal.services.v1.city import CityService
 from app.internal.services.v1.country import CountryService
+from app.internal.services.v1.health import HealthService
+from app.pkg.models import v1 as models
 from app.pkg.settings import settings
 
 
@@ -20,6 +23,10 @@ class Services(containers.DeclarativeContainer):
         Repositories.v1.rabbitmq,
     )  # type: ignore
 
+    redis_repositories: redis.RedisRepositories = providers.Container(
+        Repositories.v1.redis,
+    )  # type: ignore
+
     postgres_repositories: postgresql.Repositories = providers.Container(
         Repositories.v1.postgres,
     )  # type: ignore
@@ -41,12 +48,64 @@ class Services(containers.DeclarativeContainer):
         city_service=city_service,
     )
 
+    # HealthService
+    health_service = providers.Factory(
+        HealthService,
+    )
+    health_service.add_attributes(
+        consumer_metrics_repository=redis_repositories.consumer_metrics_repository,
+    )
+
+    # Publish buffers are shared by all requests of the process.
+    bid_publish_buffer = providers.Singleton(
+        PublishBuffer,
+        name="bid",
+        transport=providers.Selector(
+            configuration.RABBITMQ.BID_QUEUE_TRANSPORT,
+            rabbitmq=rabbitmq_repositories.base_repository,
+            redis=redis_repositories.stream_repository,
+        ),
+        max_size=configuration.RABBITMQ.PUBLISH_BUFFER_SIZE,
+        overflow=configuration.RABBITMQ.PUBLISH_BUFFER_OVERFLOW,
+        batch_size=configuration.RABBITMQ.PUBLISH_BUFFER_BATCH_SIZE,
+        retry_delay_ms=configuration.RABBITMQ.PUBLISH_BUFFER_RETRY_DELAY_MS,
+        max_attempts=configuration.RABBITMQ.PUBLISH_BUFFER_MAX_ATTEMPTS,
+        spill=redis_repositories.stream_repository,
+        model=models.CreateBidCommand,
+        routing_keys=providers.List(configuration.RABBITMQ.BID_QUEUE_NAME),
+    )
+    bid_publish_buffer_second = providers.Singleton(
+        PublishBuffer,
+        name="bid_second",
+        transport=providers.Selector(
+            configuration.RABBITMQ.BID_QUEUE_SECOND_TRANSPORT,
+            rabbitmq=rabbitmq_repositories.base_repository,
+            redis=redis_repositories.stream_repository,
+        ),
+        max_size=configuration.RABBITMQ.PUBLISH_BUFFER_SIZE,
+        overflow=configuration.RABBITMQ.PUBLISH_BUFFER_OVERFLOW,
+        batch_size=configuration.RABBITMQ.PUBLISH_BUFFER_BATCH_SIZE,
+        retry_delay_ms=configuration.RABBITMQ.PUBLISH_BUFFER_RETRY_DELAY_MS,
+        max_attempts=configuration.RABBITMQ.PUBLISH_BUFFER_MAX_ATTEMPTS,
+        spill=redis_repositories.stream_repository,
+        model=models.CreateBidCommand,
+        routing_keys=providers.List(configuration.RABBITMQ.BID_QUEUE_NAME_SECOND),
+    )
+    publish_buffers = providers.List(
+        bid_publish_buffer,
+        bid_publish_buffer_second,
+    )
+
     # BidService
     bid_service = providers.Factory(
         BidService,
     )
     bid_service.add_attributes(
         rabbit_base_repository=rabbitmq_repositories.base_repository,
+        bid_transport=bid_publish_buffer,
+        bid_transport_second=bid_publish_buffer_second,
         rabbit_bid_queue=configuration.RABBITMQ.BID_QUEUE_NAME,
         rabbit_bid_queue_second=configuration.RABBITMQ.BID_QUEUE_NAME_SECOND,
+        rpc_repository=rabbitmq_repositories.rpc_repository,
+        rabbit_bid_status_queue=configuration.RABBITMQ.BID_STATUS_QUEUE_NAME,
     )
@@ -1,8 +1,11 @@
 """Module for consumer service."""
 
 import asyncio
+from typing import List
 
+from app.internal.repository.transport import Transport
 from app.internal.repository.v1.rabbitmq import BaseRepository
+from app.internal.repository.v1.rabbitmq.rpc import RPCRepository
 from app.pkg.logger import get_logger
 from app.pkg.models import v1 as models
 
@@ -13,32 +16,80 @@ class BidService:
     """Consumer service."""
 
     rabbit_base_repository: BaseRepository
+    #: Publish buffer in front of the transport of ``rabbit_bid_queue``,
+    #  selected by ``RABBITMQ__BID_QUEUE_TRANSPORT``.
+    bid_transport: Transport
+    #: Publish buffer in front of the transport of ``rabbit_bid_queue_second``,
+    #  selected by ``RABBITMQ__BID_QUEUE_SECOND_TRANSPORT``.
+    bid_transport_second: Transport
     rabbit_bid_queue: str
     rabbit_bid_queue_second: str
+    #: Calls of ``rabbit_bid_status_queue`` consumers.
+    rpc_repository: RPCRepository
+    rabbit_bid_status_queue: str
 
     def __init__(self):
         self.__logger = get_logger(__name__)
 
     async def create_bid(self, cmd: models.CreateBidCommand) -> None:
-        """Create bid and send it to rabbit."""
+        """Create bid and send it to the bid queue."""
 
-        await self.rabbit_base_repository.create(
+        await self.bid_transport.create(
             message=cmd,
             routing_key=self.rabbit_bid_queue,
         )
-        self.__logger.info("Message was sent to rabbitmq consumer queue.")
+        self.__logger.info("Message was buffered for consumer queue.")
+
+    async def create_bids(self, cmds: List[models.CreateBidCommand]) -> None:
+        """Create batch of bids and send them to the bid queue."""
+
+        await self.bid_transport.create_many(
+            messages=cmds,
+            routing_key=self.rabbit_bid_queue,
+        )
+        self.__logger.info(
+            "%s messages were buffered for consumer queue.",
+            len(cmds),
+        )
 
     async def bid_callback(self, cmd: models.CreateBidCommand) -> None:
         self.__logger.info("Bid callback was called with data %s.", cmd.to_dict())
 
+    async def bid_batch_callback(self, cmds: List[models.CreateBidCommand]) -> None:
+        self.__logger.info(
+            "Bid batch callback was called with %s bids.",
+            len(cmds),
+        )
+
+    async def read_bid_status(
+        self,
+        query: models.ReadBidStatusQuery,
+    ) -> models.BidStatus:
+        """Ask consumers for the status of the bid and wait for the reply."""
+
+        return await self.rpc_repository.call(
+            query,
+            routing_key=self.rabbit_bid_status_queue,
+            response_model=models.BidStatus,
+        )
+
+    async def bid_status_callback(
+        self,
+        query: models.ReadBidStatusQuery,
+    ) -> models.BidStatus:
+        """Reply to the status request of the bid."""
+
+        self.__logger.info("Bid status of %s was requested.", query.bid_name)
+        return models.BidStatus(bid_name=query.bid_name, status="accepted")
+
     async def create_bid_second(self, cmd: models.CreateBidCommand) -> None:
-        """Create bid and send it to rabbit - another queue."""
+        """Create bid and send it to another bid queue."""
 
-        await self.rabbit_base_repository.create(
+        await self.bid_transport_second.create(
             message=cmd,
             routing_key=self.rabbit_bid_queue_second,
         )
-        self.__logger.info("Message was sent to rabbitmq consumer queue.")
+        self.__logger.info("Message was buffered for consumer queue.")
 
     async def bid_callback_second(self, cmd: models.CreateBidCommand) -> None:
         self.__logger.info(
@@ -100,18 +100,18 @@ class CountryService:
         Returns:
             typing.List[models.CountryWithCities]: Read countries with cities.
         """
-        result = []
         self.__logger.debug("Reading countries with cities")
-        for country_item in await self.country_repository.read_all():
-            cities = await self.city_service.read_cities_by_country(
+        countries = await self.country_repository.read_all()
+        cities = [
+            await self.city_service.read_cities_by_country(
                 query=models.ReadCityByCountryQuery(
                     country_code=country_item.country_code,
                 ),
             )
-            result.append(
-                country_item.migrate(
-                    models.CountryWithCities,
-                    extra_fields={"cities": cities},
-                ),
-            )
-        return result
+            for country_item in countries
+        ]
+        return models.Country.migrate_many(
+            countries,
+            models.CountryWithCities,
+            extra_fields=[{"cities": country_cities} for country_cities in cities],
+        )
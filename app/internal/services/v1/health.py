@@ -0,0 +1,45 @@
+"""Service for health checks."""
+
+from typing import List
+
+from app.internal.repository.v1.redis.consumer_metrics import (
+    ConsumerMetricsRepository,
+)
+from app.pkg.handlers.exception import handle_cancelled_error
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.health import ConsumersUnavailable
+
+__all__ = ["HealthService"]
+
+
+class HealthService:
+    """Service for health checks."""
+
+    consumer_metrics_repository: ConsumerMetricsRepository
+
+    @handle_cancelled_error
+    async def read_consumers(self) -> List[models.ConsumerProcessMetrics]:
+        """Read the latest metrics of alive consumer processes.
+
+        Raises:
+            ConsumersUnavailable: No process reported metrics recently.
+
+        Returns:
+            Metrics of the consumer processes.
+        """
+        processes = await self.consumer_metrics_repository.read_all()
+        if not processes:
+            raise ConsumersUnavailable
+        return processes
+
+    @staticmethod
+    def read_clients() -> List[models.BulkheadState]:
+        """Read occupancy of bulkheads of outbound clients of the process.
+
+        Returns:
+            Bulkheads of the clients created in the process.
+        """
+        # Clients import workers, which import services, so import lazily.
+        from app.pkg.clients.bulkhead import read_bulkheads
+
+        return read_bulkheads()
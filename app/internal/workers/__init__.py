@@ -3,11 +3,17 @@
 from dependency_injector import containers, providers
 
 from app.internal.repository import Repositories
-from app.internal.repository.v1 import rabbitmq
+from app.internal.repository.v1 import postgresql, rabbitmq, redis
 from app.internal.services import Services
+from app.internal.workers.metrics import MetricsReporter
+from app.internal.workers.outbox import OutboxRelay
+from app.internal.workers.rabbitmq_consumer import RabbitMQConsumer
+from app.internal.workers.redis_stream import StreamConsumer
+from app.internal.workers.worker import Worker
+from app.pkg.models import v1 as models
 from app.pkg.settings import settings
 
-__all__ = ["Workers"]
+__all__ = ["Workers", "Worker"]
 
 
 class Workers(containers.DeclarativeContainer):
@@ -21,3 +27,86 @@ class Workers(containers.DeclarativeContainer):
     rabbitmq_repositories: rabbitmq.Repositories = providers.Container(
         Repositories.v1.rabbitmq,
     )  # type: ignore
+
+    postgresql_repositories: postgresql.Repositories = providers.Container(
+        Repositories.v1.postgres,
+    )  # type: ignore
+
+    redis_repositories: redis.RedisRepositories = providers.Container(
+        Repositories.v1.redis,
+    )  # type: ignore
+
+    queues = providers.List(
+        providers.Factory(
+            models.ConsumerQueueData,
+            queue_name=configuration.RABBITMQ.BID_QUEUE_NAME,
+            queue_callback=services.v1.bid_service.provided.bid_callback,
+            queue_batch_callback=services.v1.bid_service.provided.bid_batch_callback,
+            batch_size=configuration.RABBITMQ.BID_QUEUE_BATCH_SIZE,
+            batch_timeout_ms=configuration.RABBITMQ.BID_QUEUE_BATCH_TIMEOUT_MS,
+            queue_incoming_model=models.CreateBidCommand,
+            queue_transport=configuration.RABBITMQ.BID_QUEUE_TRANSPORT,
+            prefetch_count=configuration.RABBITMQ.BID_QUEUE_PREFETCH_COUNT,
+            concurrency=configuration.RABBITMQ.BID_QUEUE_CONCURRENCY,
+            max_attempts=configuration.RABBITMQ.RETRY_MAX_ATTEMPTS,
+            retry_delay_ms=configuration.RABBITMQ.RETRY_DELAY_MS,
+        ),
+        providers.Factory(
+            models.ConsumerQueueData,
+            queue_name=configuration.RABBITMQ.BID_QUEUE_NAME_SECOND,
+            queue_callback=services.v1.bid_service.provided.bid_callback_second,
+            queue_incoming_model=models.CreateBidCommand,
+            queue_transport=configuration.RABBITMQ.BID_QUEUE_SECOND_TRANSPORT,
+            prefetch_count=configuration.RABBITMQ.BID_QUEUE_SECOND_PREFETCH_COUNT,
+            concurrency=configuration.RABBITMQ.BID_QUEUE_SECOND_CONCURRENCY,
+            max_attempts=configuration.RABBITMQ.RETRY_MAX_ATTEMPTS,
+            retry_delay_ms=configuration.RABBITMQ.RETRY_DELAY_MS,
+        ),
+        # Consumers reply to RPC calls, requests always go through rabbitmq.
+        providers.Factory(
+            models.ConsumerQueueData,
+            queue_name=configuration.RABBITMQ.BID_STATUS_QUEUE_NAME,
+            queue_callback=services.v1.bid_service.provided.bid_status_callback,
+            queue_incoming_model=models.ReadBidStatusQuery,
+            max_attempts=1,
+        ),
+    )
+
+    rabbitmq_consumer = providers.Factory(RabbitMQConsumer)
+
+    stream_consumer = providers.Factory(
+        StreamConsumer,
+        repository=redis_repositories.stream_repository,
+        group=configuration.REDIS.STREAM_GROUP,
+        batch_size=configuration.REDIS.STREAM_BATCH_SIZE,
+        block_ms=configuration.REDIS.STREAM_BLOCK_MS,
+        claim_idle_ms=configuration.REDIS.STREAM_CLAIM_IDLE_MS,
+    )
+
+    outbox_relay = providers.Factory(
+        OutboxRelay,
+        repository=postgresql_repositories.outbox_repository,
+        publisher=rabbitmq_repositories.event_repository,
+        routing_key=configuration.RABBITMQ.OUTBOX_ROUTING_KEY,
+        batch_size=configuration.RABBITMQ.OUTBOX_BATCH_SIZE,
+        poll_interval_ms=configuration.RABBITMQ.OUTBOX_POLL_INTERVAL_MS,
+        lease_ms=configuration.RABBITMQ.OUTBOX_LEASE_MS,
+    )
+
+    metrics_reporter = providers.Factory(
+        MetricsReporter,
+        repository=redis_repositories.consumer_metrics_repository,
+        rabbitmq_repository=rabbitmq_repositories.base_repository,
+        stream_repository=redis_repositories.stream_repository,
+        stream_group=configuration.REDIS.STREAM_GROUP,
+        interval=configuration.WORKERS.METRICS_INTERVAL,
+    )
+
+    worker = providers.Factory(
+        Worker,
+        queues=queues,
+        rabbitmq_consumer=rabbitmq_consumer.provider,
+        stream_consumer=stream_consumer.provider,
+        outbox_relay=outbox_relay.provider,
+        metrics_reporter=metrics_reporter,
+    )
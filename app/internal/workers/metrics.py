@@ -0,0 +1,205 @@
+"""In-process metrics of queue consumers."""
+
+import asyncio
+import os
+import socket
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Iterator, List, Optional
+
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.internal.repository.v1.redis.consumer_metrics import (
+    ConsumerMetricsRepository,
+)
+from app.internal.repository.v1.redis.stream import StreamRepository
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.base.settings_enum import TransportEnum
+
+__all__ = ["ConsumerMetrics", "MetricsReporter", "BUCKETS_MS"]
+
+#: Upper bounds in milliseconds of processing time histogram buckets.
+BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+
+
+class ConsumerMetrics:
+    """Counters and processing time histogram of one queue.
+
+    The object outlives consumer restarts, so counters are cumulative for
+    the process.
+
+    Attributes:
+        queue_name: Name of the queue.
+        concurrency: Max count of callbacks running at the same time.
+    """
+
+    def __init__(self, queue_name: str, concurrency: int):
+        self.queue_name = queue_name
+        self.concurrency = concurrency
+        self.consumed = 0
+        self.acked = 0
+        self.nacked = 0
+        self.in_flight = 0
+        self.processing_time_sum_ms = 0.0
+        self.__buckets = [0] * (len(BUCKETS_MS) + 1)
+
+    def delivered(self, count: int = 1) -> None:
+        """Count messages delivered to the consumer."""
+        self.consumed += count
+
+    @contextmanager
+    def track(self) -> Iterator[None]:
+        """Count running callback and measure its processing time."""
+        self.in_flight += 1
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.in_flight -= 1
+            self.observe((time.perf_counter() - started) * 1000)
+
+    def observe(self, elapsed_ms: float) -> None:
+        """Add processing time of one callback to the histogram.
+
+        Args:
+            elapsed_ms: Processing time in milliseconds.
+        """
+        self.processing_time_sum_ms += elapsed_ms
+        self.__buckets[bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+
+    def ack(self, count: int = 1) -> None:
+        """Count acknowledged messages."""
+        self.acked += count
+
+    def nack(self, count: int = 1) -> None:
+        """Count messages moved to retry or dead-letter queues."""
+        self.nacked += count
+
+    def snapshot(
+        self,
+        depth: Optional[int] = None,
+    ) -> models.ConsumerQueueMetrics:
+        """Current values of the metrics.
+
+        Args:
+            depth: Count of messages waiting in the queue.
+
+        Returns:
+            Metrics of the queue with cumulative histogram buckets.
+        """
+        buckets, total = {}, 0
+        for bound, count in zip((*BUCKETS_MS, "+Inf"), self.__buckets):
+            total += count
+            buckets[str(bound)] = total
+        return models.ConsumerQueueMetrics(
+            queue_name=self.queue_name,
+            consumed=self.consumed,
+            acked=self.acked,
+            nacked=self.nacked,
+            in_flight=self.in_flight,
+            concurrency=self.concurrency,
+            depth=depth,
+            processing_time_sum_ms=self.processing_time_sum_ms,
+            processing_time_buckets=buckets,
+        )
+
+
+class MetricsReporter:
+    """Poll queue depth and store metrics of the process in redis.
+
+    Depth of rabbitmq queue is read by passive declare, depth of redis
+    stream is the lag of the consumer group.
+
+    Attributes:
+        repository: Storage of reported metrics.
+        rabbitmq_repository: Repository for passive declare of queues.
+        stream_repository: Repository for lag of consumer groups.
+        stream_group: Consumer group of redis streams.
+        interval: Time in seconds between reports.
+    """
+
+    def __init__(
+        self,
+        repository: ConsumerMetricsRepository,
+        rabbitmq_repository: BaseRepository,
+        stream_repository: StreamRepository,
+        stream_group: str,
+        interval: int,
+    ):
+        self.repository = repository
+        self.rabbitmq_repository = rabbitmq_repository
+        self.stream_repository = stream_repository
+        self.stream_group = stream_group
+        self.interval = interval
+        self.process = f"{socket.gethostname()}-{os.getpid()}"
+        self.__logger = get_logger(__name__)
+
+    async def report(
+        self,
+        queues: List[models.ConsumerQueueData],
+        metrics: dict[str, ConsumerMetrics],
+    ) -> None:
+        """Store metrics every ``interval`` until the task is cancelled.
+
+        Args:
+            queues: Consumed queues.
+            metrics: Metrics of the queues by queue name.
+        """
+        while True:
+            try:
+                await self.repository.create(
+                    await self.snapshot(queues, metrics),
+                    expire_time=self.interval * 3,
+                )
+            except Exception:
+                self.__logger.exception("Failed to report consumer metrics.")
+            await asyncio.sleep(self.interval)
+
+    async def snapshot(
+        self,
+        queues: List[models.ConsumerQueueData],
+        metrics: dict[str, ConsumerMetrics],
+    ) -> models.ConsumerProcessMetrics:
+        """Current metrics of the process.
+
+        Args:
+            queues: Consumed queues.
+            metrics: Metrics of the queues by queue name.
+
+        Returns:
+            Metrics of the process.
+        """
+        return models.ConsumerProcessMetrics(
+            process=self.process,
+            reported_at=datetime.now(tz=timezone.utc),
+            queues=[
+                metrics[queue.queue_name].snapshot(depth=await self.__depth(queue))
+                for queue in queues
+            ],
+        )
+
+    async def __depth(self, queue: models.ConsumerQueueData) -> Optional[int]:
+        """Count of messages waiting in the queue.
+
+        Args:
+            queue: Consumed queue.
+
+        Returns:
+            Depth of the queue or ``None`` if the broker is not available.
+        """
+        try:
+            if queue.queue_transport == TransportEnum.REDIS:
+                return await self.stream_repository.lag(
+                    queue.queue_name,
+                    self.stream_group,
+                )
+            return await self.rabbitmq_repository.depth(queue.queue_name)
+        except Exception:
+            self.__logger.warning(
+                "Failed to read depth of queue %s.",
+                queue.queue_name,
+                exc_info=True,
+            )
+            return None
@@ -0,0 +1,47 @@
+"""Relay of the transactional outbox to rabbitmq."""
+
+import asyncio
+
+from app.internal.repository.v1.postgresql.outbox import OutboxRepository
+from app.internal.repository.v1.rabbitmq.event import EventRepository
+from app.pkg.logger import get_logger
+
+__all__ = ["OutboxRelay"]
+
+
+class OutboxRelay:
+    """Publish pending outbox rows and delete them.
+
+    Full batch is followed by the next one at once, the empty outbox is
+    polled every ``poll_interval_ms``.
+    """
+
+    def __init__(
+        self,
+        repository: OutboxRepository,
+        publisher: EventRepository,
+        routing_key: str,
+        batch_size: int,
+        poll_interval_ms: int,
+        lease_ms: int,
+    ):
+        self.repository = repository
+        self.publisher = publisher
+        self.routing_key = routing_key
+        self.batch_size = batch_size
+        self.poll_interval_ms = poll_interval_ms
+        self.lease_ms = lease_ms
+        self.__logger = get_logger(__name__)
+
+    async def consume(self) -> None:
+        """Run relay loop until the task is cancelled."""
+
+        self.__logger.info("Start relaying outbox to %s.", self.routing_key)
+        while True:
+            relayed = await self.repository.relay(
+                self.publisher.publish,
+                self.batch_size,
+                self.lease_ms,
+            )
+            if relayed < self.batch_size:
+                await asyncio.sleep(self.poll_interval_ms / 1000)
@@ -0,0 +1,322 @@
+"""Consumer of rabbitmq queues."""
+
+import asyncio
+
+import aio_pika
+
+from app.internal.repository.v1.rabbitmq.connection import (
+    get_consumer_connection,
+    open_channel,
+)
+from app.internal.workers.metrics import ConsumerMetrics
+from app.internal.workers.retry import RetryTopology
+from app.pkg.codec import CONTENT_TYPE_JSON, decode_message, encode_message
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.base import Model
+
+__all__ = ["RabbitMQConsumer"]
+
+
+class RabbitMQConsumer:
+    """Read messages of the queue and pass them to the callback concurrently.
+
+    The broker delivers at most ``prefetch_count`` unacknowledged messages,
+    at most ``concurrency`` callbacks run at the same time. Messages are
+    acknowledged after successful callback. Failed messages leave the queue
+    at once and come back after exponential delay, see :class:`.RetryTopology`.
+    Malformed messages go straight to the dead-letter queue. If the message
+    has ``reply_to`` (see :class:`.RPCRepository`), the model returned by the
+    callback is published as the reply.
+
+    In batch mode (see :attr:`.ConsumerQueueData.is_batch`) up to
+    ``batch_size`` messages, or the ones that arrived within
+    ``batch_timeout_ms``, are passed to ``queue_batch_callback`` as a list and
+    acknowledged with one multi-ack. Batches are settled in delivery order,
+    so the multi-ack never covers messages of a batch still in flight.
+    """
+
+    def __init__(
+        self,
+        queue: models.ConsumerQueueData,
+        metrics: ConsumerMetrics | None = None,
+    ):
+        self.queue = queue
+        self.topology = RetryTopology(queue)
+        self.metrics = metrics or ConsumerMetrics(
+            queue.queue_name,
+            queue.concurrency,
+        )
+        self.__semaphore = asyncio.Semaphore(queue.concurrency)
+        self.__tasks: set[asyncio.Task] = set()
+        self.__logger = get_logger(__name__)
+
+    async def consume(self) -> None:
+        """Run consume loop until the task is cancelled.
+
+        The consumer owns one channel on the dedicated connection of
+        consumers. In-flight callbacks are awaited before return, so messages
+        are acknowledged on the same channel they were delivered on.
+        """
+
+        async with get_consumer_connection() as connection:
+            async with open_channel(connection) as channel:
+                await channel.set_qos(
+                    prefetch_count=max(
+                        self.queue.prefetch_count,
+                        self.queue.batch_size or 0,
+                    ),
+                )
+                queue = await channel.declare_queue(
+                    self.queue.queue_name,
+                    durable=True,
+                )
+                await self.topology.declare(channel)
+                self.__logger.info(
+                    "Start consuming queue %s.",
+                    self.queue.queue_name,
+                )
+                try:
+                    async with queue.iterator() as iterator:
+                        if self.queue.is_batch:
+                            await self.__consume_batches(channel, iterator)
+                        else:
+                            await self.__consume_messages(channel, iterator)
+                finally:
+                    await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+    async def __consume_messages(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        iterator: aio_pika.abc.AbstractQueueIterator,
+    ) -> None:
+        """Pass every message to the callback in its own task.
+
+        Args:
+            channel: Channel of the consumer.
+            iterator: Iterator of delivered messages.
+        """
+        async for message in iterator:
+            self.metrics.delivered()
+            await self.__semaphore.acquire()
+            self.__spawn(self.__process(channel, message))
+
+    async def __consume_batches(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        iterator: aio_pika.abc.AbstractQueueIterator,
+    ) -> None:
+        """Collect messages in batches and pass every batch to the batch
+        callback in its own task.
+
+        Args:
+            channel: Channel of the consumer.
+            iterator: Iterator of delivered messages.
+        """
+        previous: asyncio.Task | None = None
+        while True:
+            batch = await self.__collect(iterator)
+            self.metrics.delivered(len(batch))
+            await self.__semaphore.acquire()
+            previous = self.__spawn(self.__process_batch(channel, batch, previous))
+
+    async def __collect(
+        self,
+        iterator: aio_pika.abc.AbstractQueueIterator,
+    ) -> list[aio_pika.abc.AbstractIncomingMessage]:
+        """Wait for the first message, then collect more until the batch is
+        full or the batch timeout is over.
+
+        Args:
+            iterator: Iterator of delivered messages.
+
+        Returns:
+            Non-empty batch of messages.
+        """
+        loop = asyncio.get_running_loop()
+        batch = [await iterator.__anext__()]
+        deadline = loop.time() + self.queue.batch_timeout_ms / 1000
+        while len(batch) < self.queue.batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(iterator.__anext__(), timeout=timeout),
+                )
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    def __spawn(self, coroutine) -> asyncio.Task:
+        """Run coroutine in the tracked task.
+
+        Args:
+            coroutine: Coroutine to run.
+
+        Returns:
+            Created task.
+        """
+        task = asyncio.create_task(coroutine)
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+        return task
+
+    async def __process_batch(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        batch: list[aio_pika.abc.AbstractIncomingMessage],
+        previous: asyncio.Task | None,
+    ) -> None:
+        """Pass batch to the batch callback and settle it.
+
+        Args:
+            channel: Channel of the consumer.
+            batch: Delivered messages.
+            previous: Task of the previous batch. It is awaited before the
+                multi-ack.
+        """
+        try:
+            cmds, messages = [], []
+            for message in batch:
+                try:
+                    cmds.append(
+                        decode_message(
+                            message.body,
+                            self.queue.queue_incoming_model,
+                            content_type=message.content_type,
+                            content_encoding=message.content_encoding,
+                        ),
+                    )
+                    messages.append(message)
+                except ValueError:
+                    self.__logger.exception(
+                        "Dead-letter malformed message of queue %s.",
+                        self.queue.queue_name,
+                    )
+                    await self.__retry(channel, message)
+
+            error = None
+            if cmds:
+                try:
+                    with self.metrics.track():
+                        await self.queue.queue_batch_callback(cmds)
+                except Exception as exc:
+                    self.__logger.exception(
+                        "Batch of %s messages of queue %s was not processed.",
+                        len(cmds),
+                        self.queue.queue_name,
+                    )
+                    error = exc
+
+            if previous is not None:
+                await asyncio.gather(previous, return_exceptions=True)
+
+            if error is not None:
+                for message in messages:
+                    await self.__retry(channel, message, error)
+            elif messages:
+                await messages[-1].ack(multiple=True)
+                self.metrics.ack(len(messages))
+        finally:
+            self.__semaphore.release()
+
+    async def __process(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        message: aio_pika.abc.AbstractIncomingMessage,
+    ) -> None:
+        """Pass message to the callback and settle it.
+
+        Args:
+            channel: Channel of the consumer.
+            message: Delivered message.
+        """
+        try:
+            try:
+                cmd = decode_message(
+                    message.body,
+                    self.queue.queue_incoming_model,
+                    content_type=message.content_type,
+                    content_encoding=message.content_encoding,
+                )
+            except ValueError:
+                self.__logger.exception(
+                    "Dead-letter malformed message of queue %s.",
+                    self.queue.queue_name,
+                )
+                await self.__retry(channel, message)
+                return
+
+            try:
+                with self.metrics.track():
+                    result = await self.queue.queue_callback(cmd)
+            except Exception as error:
+                self.__logger.exception(
+                    "Message of queue %s was not processed, attempt %s.",
+                    self.queue.queue_name,
+                    self.topology.attempts(message) + 1,
+                )
+                await self.__retry(channel, message, error)
+                return
+            if message.reply_to and result is not None:
+                await self.__reply(channel, message, result)
+            await message.ack()
+            self.metrics.ack()
+        finally:
+            self.__semaphore.release()
+
+    async def __reply(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        message: aio_pika.abc.AbstractIncomingMessage,
+        result: Model,
+    ) -> None:
+        """Publish result of the callback to ``reply_to`` of the request.
+
+        Args:
+            channel: Channel of the consumer.
+            message: Request with ``reply_to`` and ``correlation_id``.
+            result: Result of the callback.
+        """
+        body, content_encoding = encode_message(result)
+        try:
+            await channel.default_exchange.publish(
+                aio_pika.Message(
+                    body=body,
+                    content_type=CONTENT_TYPE_JSON,
+                    content_encoding=content_encoding,
+                    correlation_id=message.correlation_id,
+                ),
+                routing_key=message.reply_to,
+            )
+        except Exception:
+            # Caller gets timeout, request is not processed twice.
+            self.__logger.exception(
+                "Failed to reply to request of queue %s.",
+                self.queue.queue_name,
+            )
+
+    async def __retry(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        message: aio_pika.abc.AbstractIncomingMessage,
+        error: Exception | None = None,
+    ) -> None:
+        """Move failed message to retry topology, requeue it if it is not
+        possible.
+
+        Args:
+            channel: Channel of the consumer.
+            message: Failed message.
+            error: Error of the attempt.
+        """
+        self.metrics.nack()
+        try:
+            await self.topology.retry(channel, message, error)
+        except Exception:
+            self.__logger.exception(
+                "Failed to move message of queue %s to retry queue.",
+                self.queue.queue_name,
+            )
+            await message.reject(requeue=True)
@@ -0,0 +1,260 @@
+"""Consumer of redis streams."""
+
+import asyncio
+import os
+import socket
+
+from app.internal.repository.v1.redis.stream import StreamEntry, StreamRepository
+from app.internal.workers.metrics import ConsumerMetrics
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+
+__all__ = ["StreamConsumer"]
+
+
+class StreamConsumer:
+    """Read messages of the stream in consumer group and pass them to the
+    callback.
+
+    Every message is passed to the callback in its own task, at most
+    ``concurrency`` of the queue at once, and acknowledged as soon as its
+    callback is done, so a slow message does not hold back the rest of the
+    batch. In batch mode the whole batch read by ``XREADGROUP`` (at most
+    ``batch_size`` of the queue) is passed to ``queue_batch_callback`` at
+    once. Messages left unacknowledged by failed callbacks or dead consumers
+    are taken over with ``XAUTOCLAIM`` after ``claim_idle_ms``. Malformed
+    messages and messages delivered more than ``max_attempts`` times of the
+    queue are moved to the ``<stream>.dlq`` stream.
+    """
+
+    def __init__(
+        self,
+        repository: StreamRepository,
+        queue: models.ConsumerQueueData,
+        group: str,
+        batch_size: int,
+        block_ms: int,
+        claim_idle_ms: int,
+        metrics: ConsumerMetrics | None = None,
+    ):
+        self.repository = repository
+        self.queue = queue
+        self.group = group
+        self.batch_size = batch_size
+        self.block_ms = block_ms
+        self.claim_idle_ms = claim_idle_ms
+        self.consumer = f"{socket.gethostname()}-{os.getpid()}"
+        self.metrics = metrics or ConsumerMetrics(
+            queue.queue_name,
+            queue.concurrency,
+        )
+        self.__semaphore = asyncio.Semaphore(queue.concurrency)
+        self.__tasks: set[asyncio.Task] = set()
+        self.__in_flight: set[bytes] = set()
+        self.__logger = get_logger(__name__)
+
+    async def consume(self) -> None:
+        """Run consume loop until the task is cancelled.
+
+        In-flight callbacks are awaited before return.
+        """
+
+        stream = self.queue.queue_name
+        await self.repository.create_group(stream=stream, group=self.group)
+        self.__logger.info(
+            "Start consuming stream %s as %s.",
+            stream,
+            self.consumer,
+        )
+
+        try:
+            while True:
+                entries = await self.__claim(stream)
+                if not entries:
+                    entries = await self.repository.read_group(
+                        stream=stream,
+                        group=self.group,
+                        consumer=self.consumer,
+                        count=self.queue.batch_size or self.batch_size,
+                        block=self.block_ms,
+                    )
+                if not entries:
+                    await asyncio.sleep(0)
+                    continue
+
+                self.metrics.delivered(len(entries))
+                if self.queue.is_batch:
+                    await self.__settle_batch(stream, entries)
+                    continue
+                for entry_id, fields in entries:
+                    await self.__semaphore.acquire()
+                    self.__in_flight.add(entry_id)
+                    self.__spawn(self.__process(stream, entry_id, fields))
+        finally:
+            await asyncio.gather(*self.__tasks, return_exceptions=True)
+
+    async def __claim(self, stream: str) -> list[StreamEntry]:
+        """Take over stuck messages and dead-letter the exhausted ones.
+
+        Args:
+            stream: Name of the stream.
+
+        Returns:
+            Claimed entries to process again.
+        """
+        entries = [
+            entry
+            for entry in await self.repository.claim(
+                stream=stream,
+                group=self.group,
+                consumer=self.consumer,
+                min_idle_time=self.claim_idle_ms,
+                count=self.queue.batch_size or self.batch_size,
+            )
+            if entry[0] not in self.__in_flight
+        ]
+        deliveries = await self.repository.deliveries(
+            stream,
+            self.group,
+            *[entry_id for entry_id, _ in entries],
+        )
+        exhausted = [
+            entry
+            for entry, count in zip(entries, deliveries)
+            if count > self.queue.max_attempts
+        ]
+        if exhausted:
+            self.__logger.error(
+                "Dead-letter %s entries of stream %s after %s attempts.",
+                len(exhausted),
+                stream,
+                self.queue.max_attempts,
+            )
+            await self.__dead_letter(stream, exhausted)
+        return [
+            entry
+            for entry, count in zip(entries, deliveries)
+            if count <= self.queue.max_attempts
+        ]
+
+    async def __dead_letter(self, stream: str, entries: list[StreamEntry]) -> None:
+        """Move entries to the dead-letter stream.
+
+        Args:
+            stream: Name of the stream.
+            entries: Stream entries to move.
+        """
+        if entries:
+            await self.repository.dead_letter(stream, self.group, entries)
+            self.metrics.nack(len(entries))
+
+    def __spawn(self, coroutine) -> asyncio.Task:
+        """Run coroutine in the tracked task.
+
+        Args:
+            coroutine: Coroutine to run.
+
+        Returns:
+            Created task.
+        """
+        task = asyncio.create_task(coroutine)
+        self.__tasks.add(task)
+        task.add_done_callback(self.__tasks.discard)
+        return task
+
+    async def __process(
+        self,
+        stream: str,
+        entry_id: bytes,
+        fields: dict[bytes, bytes],
+    ) -> None:
+        """Pass message to the callback and acknowledge it on success.
+
+        Failed message stays pending until it is claimed again, malformed one
+        is dead-lettered. The slot of the semaphore taken by the consume loop
+        is released on exit.
+
+        Args:
+            stream: Name of the stream.
+            entry_id: Id of the stream entry.
+            fields: Fields of the stream entry.
+        """
+        try:
+            message = self.__decode(entry_id, fields)
+            if message is None:
+                await self.__dead_letter(stream, [(entry_id, fields)])
+                return
+            with self.metrics.track():
+                await self.queue.queue_callback(message)
+            await self.repository.ack(stream, self.group, entry_id)
+            self.metrics.ack()
+        except Exception:
+            self.__logger.exception(
+                "Stream entry %s was not processed.",
+                entry_id,
+            )
+            self.metrics.nack()
+        finally:
+            self.__in_flight.discard(entry_id)
+            self.__semaphore.release()
+
+    async def __settle_batch(self, stream: str, entries: list[StreamEntry]) -> None:
+        """Process the batch and acknowledge its processed entries.
+
+        Malformed entries are dead-lettered, failed batch stays pending until
+        it is claimed again.
+
+        Args:
+            stream: Name of the stream.
+            entries: Stream entries of the batch.
+        """
+        messages = [self.__decode(entry_id, fields) for entry_id, fields in entries]
+        await self.__dead_letter(
+            stream,
+            [entry for entry, message in zip(entries, messages) if message is None],
+        )
+        decoded = [
+            (entry_id, message)
+            for (entry_id, _), message in zip(entries, messages)
+            if message is not None
+        ]
+        if not decoded:
+            return
+
+        try:
+            with self.metrics.track():
+                await self.queue.queue_batch_callback(
+                    [message for _, message in decoded],
+                )
+        except Exception:
+            self.__logger.exception(
+                "Batch of %s stream entries was not processed.",
+                len(decoded),
+            )
+            self.metrics.nack(len(decoded))
+            return
+        await self.repository.ack(
+            stream,
+            self.group,
+            *[entry_id for entry_id, _ in decoded],
+        )
+        self.metrics.ack(len(decoded))
+
+    def __decode(self, entry_id: bytes, fields: dict[bytes, bytes]):
+        """Decode stream entry into ``queue_incoming_model``.
+
+        Args:
+            entry_id: Id of the stream entry.
+            fields: Fields of the stream entry.
+
+        Returns:
+            Decoded message or ``None`` for malformed entry.
+        """
+        try:
+            return self.repository.parse_fields(
+                fields,
+                self.queue.queue_incoming_model,
+            )
+        except (KeyError, ValueError):
+            self.__logger.exception("Dead-letter malformed stream entry %s.", entry_id)
+            return None
@@ -0,0 +1,135 @@
+"""Retry topology of rabbitmq consumer queues.
+
+For the queue ``bids`` with ``max_attempts=3`` the topology is::
+
+    bids.retry.1  TTL = delay       --dead-letter-->  bids
+    bids.retry.2  TTL = delay * 2   --dead-letter-->  bids
+    bids.dlq
+
+Failed message is acknowledged in the hot queue and published to the retry
+queue of the next attempt. When the message expires there, the broker
+dead-letters it back to the hot queue. After the last attempt the message is
+published to the dead-letter queue. Properties of the message, including
+``reply_to`` and ``correlation_id`` of RPC requests, are kept, so a retried
+request is still answered to its caller.
+"""
+
+import aio_pika
+
+from app.pkg.models import v1 as models
+
+__all__ = ["RetryTopology", "ATTEMPTS_HEADER", "ERROR_HEADER"]
+
+#: Header with count of failed attempts of the message.
+ATTEMPTS_HEADER = "x-attempts"
+#: Header with the last error of the message in the dead-letter queue.
+ERROR_HEADER = "x-last-error"
+
+
+class RetryTopology:
+    """Names and declaration of retry queues of the consumer queue."""
+
+    def __init__(self, queue: models.ConsumerQueueData):
+        self.queue_name = queue.queue_name
+        self.max_attempts = queue.max_attempts
+        self.retry_delay_ms = queue.retry_delay_ms
+
+    @property
+    def dead_letter_queue(self) -> str:
+        """Name of the final dead-letter queue."""
+        return f"{self.queue_name}.dlq"
+
+    def retry_queue(self, attempt: int) -> str:
+        """Name of the retry queue of the attempt.
+
+        Args:
+            attempt: Number of the next attempt, starting from 1.
+
+        Returns:
+            Name of the retry queue.
+        """
+        return f"{self.queue_name}.retry.{attempt}"
+
+    def delay(self, attempt: int) -> int:
+        """Exponential delay of the attempt.
+
+        Args:
+            attempt: Number of the next attempt, starting from 1.
+
+        Returns:
+            Delay in milliseconds.
+        """
+        return self.retry_delay_ms * 2 ** (attempt - 1)
+
+    @staticmethod
+    def attempts(message: aio_pika.abc.AbstractIncomingMessage) -> int:
+        """Count of failed attempts of the message.
+
+        Args:
+            message: Delivered message.
+
+        Returns:
+            Count of failed attempts.
+        """
+        return int(message.headers.get(ATTEMPTS_HEADER, 0))
+
+    async def declare(self, channel: aio_pika.abc.AbstractChannel) -> None:
+        """Declare retry queues and dead-letter queue.
+
+        Args:
+            channel: Channel to declare queues on.
+        """
+        for attempt in range(1, self.max_attempts):
+            await channel.declare_queue(
+                self.retry_queue(attempt),
+                durable=True,
+                arguments={
+                    "x-message-ttl": self.delay(attempt),
+                    "x-dead-letter-exchange": "",
+                    "x-dead-letter-routing-key": self.queue_name,
+                },
+            )
+        await channel.declare_queue(self.dead_letter_queue, durable=True)
+
+    async def retry(
+        self,
+        channel: aio_pika.abc.AbstractChannel,
+        message: aio_pika.abc.AbstractIncomingMessage,
+        error: BaseException | None = None,
+    ) -> None:
+        """Move failed message to the next retry queue or to the dead-letter
+        queue and acknowledge it.
+
+        Args:
+            channel: Channel of the consumer.
+            message: Failed message.
+            error: Error of the attempt. ``None`` moves the message straight
+                to the dead-letter queue.
+        """
+        attempt = self.attempts(message) + 1
+        headers = {**message.headers, ATTEMPTS_HEADER: attempt}
+        expiration = message.expiration
+        if error is None or attempt >= self.max_attempts:
+            routing_key = self.dead_letter_queue
+            headers[ERROR_HEADER] = repr(error) if error else "malformed message"
+            # Dead-letter queue has no consumer, messages stay for inspection.
+            expiration = None
+        else:
+            routing_key = self.retry_queue(attempt)
+
+        await channel.default_exchange.publish(
+            aio_pika.Message(
+                body=message.body,
+                headers=headers,
+                content_type=message.content_type,
+                content_encoding=message.content_encoding,
+                delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+                priority=message.priority,
+                correlation_id=message.correlation_id,
+                reply_to=message.reply_to,
+                expiration=expiration,
+                message_id=message.message_id,
+            ),
+            routing_key=routing_key,
+        )
+        await message.ack()
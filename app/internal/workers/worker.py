@@ -0,0 +1,96 @@
+"""Runner of all queue consumers."""
+
+import asyncio
+from typing import Callable, List, Optional
+
+from app.internal.workers.metrics import ConsumerMetrics, MetricsReporter
+from app.internal.workers.outbox import OutboxRelay
+from app.internal.workers.rabbitmq_consumer import RabbitMQConsumer
+from app.internal.workers.redis_stream import StreamConsumer
+from app.pkg.logger import get_logger
+from app.pkg.models import v1 as models
+from app.pkg.models.base.settings_enum import TransportEnum
+
+__all__ = ["Worker"]
+
+
+class Worker:
+    """Run consumers of registered queues in one event loop.
+
+    Every :class:`.ConsumerQueueData` gets its own consumer, selected by
+    ``queue_transport`` of the queue. :class:`.OutboxRelay` runs next to the
+    consumers if it is passed. :class:`.MetricsReporter` stores metrics of
+    the consumers in redis for ``/health/consumers``.
+    """
+
+    def __init__(
+        self,
+        queues: List[models.ConsumerQueueData],
+        rabbitmq_consumer: Callable[..., RabbitMQConsumer],
+        stream_consumer: Callable[..., StreamConsumer],
+        outbox_relay: Optional[Callable[..., OutboxRelay]] = None,
+        metrics_reporter: Optional[MetricsReporter] = None,
+    ):
+        self.queues = queues
+        self.rabbitmq_consumer = rabbitmq_consumer
+        self.stream_consumer = stream_consumer
+        self.outbox_relay = outbox_relay
+        self.metrics_reporter = metrics_reporter
+        # Counters outlive consumer restarts.
+        self.metrics = {
+            queue.queue_name: ConsumerMetrics(queue.queue_name, queue.concurrency)
+            for queue in queues
+        }
+        self.__logger = get_logger(__name__)
+
+    async def task(self) -> None:
+        """Consume all queues until the task is cancelled.
+
+        Consumer that failed or stopped is restarted after a second, so a
+        broken connection does not stop other queues and a broker that keeps
+        cancelling the consumer does not cause a hot reconnect loop.
+        """
+
+        runners = [self.__run(queue) for queue in self.queues]
+        if self.outbox_relay is not None:
+            runners.append(self.__run_relay())
+        if self.metrics_reporter is not None:
+            runners.append(self.metrics_reporter.report(self.queues, self.metrics))
+        await asyncio.gather(*runners)
+
+    async def __run(self, queue: models.ConsumerQueueData) -> None:
+        """Run consumer of the queue and restart it when it stops.
+
+        Args:
+            queue: Queue to consume.
+        """
+        while True:
+            metrics = self.metrics[queue.queue_name]
+            if queue.queue_transport == TransportEnum.REDIS:
+                consumer = self.stream_consumer(queue=queue, metrics=metrics)
+            else:
+                consumer = self.rabbitmq_consumer(queue=queue, metrics=metrics)
+            try:
+                await consumer.consume()
+            except Exception:
+                self.__logger.exception(
+                    "Consumer of queue %s failed, restarting.",
+                    queue.queue_name,
+                )
+            else:
+                self.__logger.warning(
+                    "Consumer of queue %s stopped, restarting.",
+                    queue.queue_name,
+                )
+            await asyncio.sleep(1)
+
+    async def __run_relay(self) -> None:
+        """Run outbox relay and restart it when it stops."""
+        while True:
+            try:
+                await self.outbox_relay().consume()
+            except Exception:
+                self.__logger.exception("Outbox relay failed, restarting.")
+            else:
+                self.__logger.warning("Outbox relay stopped, restarting.")
+            await asyncio.sleep(1)
@@ -0,0 +1,165 @@
+"""Bcrypt hashing off the event loop."""
+
+import asyncio
+import time
+from concurrent import futures
+from dataclasses import dataclass
+
+import bcrypt
+
+from app.pkg.settings import settings
+
+__all__ = ["PasswordHasher", "PasswordHasherMetrics", "password_hasher"]
+
+
+@dataclass(frozen=True)
+class PasswordHasherMetrics:
+    """Counters of :class:`.PasswordHasher`.
+
+    Attributes:
+        hashed: Count of computed hashes.
+        verified: Count of checked passwords.
+        failed: Count of calls that raised an error.
+        in_flight: Count of calls running in the pool.
+        waiting: Count of calls waiting for a free slot.
+        time_sum_ms: Total time in milliseconds spent in the pool.
+    """
+
+    hashed: int
+    verified: int
+    failed: int
+    in_flight: int
+    waiting: int
+    time_sum_ms: float
+
+
+class PasswordHasher:
+    """Run bcrypt in a dedicated pool, so the event loop is not blocked.
+
+    At most ``concurrency`` calls run at once, the rest wait on the
+    semaphore instead of piling up in the executor queue. bcrypt releases
+    the GIL, so threads are enough for most setups. Processes isolate CPU
+    load from the API process completely.
+
+    Attributes:
+        rounds: Cost factor of new hashes.
+        concurrency: Max count of hashes computed at once.
+        use_processes: Run bcrypt in a process pool instead of threads.
+
+    Examples:
+        Hash the password before it is stored and check it on login::
+
+            >>> hashed = await password_hasher.hash(b"password")
+            >>> assert await password_hasher.verify(b"password", hashed)
+    """
+
+    def __init__(
+        self,
+        rounds: int = 12,
+        concurrency: int = 4,
+        use_processes: bool = False,
+    ):
+        self.rounds = rounds
+        self.concurrency = concurrency
+        self.use_processes = use_processes
+        self.__executor: futures.Executor | None = None
+        self.__semaphore: asyncio.Semaphore | None = None
+        self.__hashed = 0
+        self.__verified = 0
+        self.__failed = 0
+        self.__in_flight = 0
+        self.__waiting = 0
+        self.__time_sum_ms = 0.0
+
+    async def hash(self, password: bytes) -> bytes:
+        """Hash password with a new salt.
+
+        Args:
+            password: Plain password.
+
+        Returns:
+            bcrypt hash of ``password``.
+        """
+        salt = bcrypt.gensalt(rounds=self.rounds)
+        hashed = await self.__run(bcrypt.hashpw, password, salt)
+        self.__hashed += 1
+        return hashed
+
+    async def verify(self, password: bytes, hashed: bytes) -> bool:
+        """Check password against the hash.
+
+        Args:
+            password: Plain password.
+            hashed: bcrypt hash made by :meth:`.hash`.
+
+        Returns:
+            ``True`` if ``password`` matches ``hashed``.
+        """
+        is_valid = await self.__run(bcrypt.checkpw, password, hashed)
+        self.__verified += 1
+        return is_valid
+
+    def metrics(self) -> PasswordHasherMetrics:
+        """Current counters of the hasher."""
+        return PasswordHasherMetrics(
+            hashed=self.__hashed,
+            verified=self.__verified,
+            failed=self.__failed,
+            in_flight=self.__in_flight,
+            waiting=self.__waiting,
+            time_sum_ms=self.__time_sum_ms,
+        )
+
+    def close(self) -> None:
+        """Shut down the pool, it is created again on the next call."""
+        if self.__executor is not None:
+            self.__executor.shutdown(wait=False, cancel_futures=True)
+        self.__executor = None
+        self.__semaphore = None
+
+    async def __run(self, fn, *args):
+        """Run bcrypt function in the pool within the concurrency cap."""
+        if self.__semaphore is None:
+            self.__semaphore = asyncio.Semaphore(self.concurrency)
+        semaphore = self.__semaphore
+
+        self.__waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self.__waiting -= 1
+
+        self.__in_flight += 1
+        started = time.perf_counter()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(
+                self.__pool(),
+                fn,
+                *args,
+            )
+        except Exception:
+            self.__failed += 1
+            raise
+        finally:
+            self.__time_sum_ms += (time.perf_counter() - started) * 1000
+            self.__in_flight -= 1
+            semaphore.release()
+
+    def __pool(self) -> futures.Executor:
+        """Create the pool on first use, so importing does not spawn workers."""
+        if self.__executor is None:
+            executor = (
+                futures.ProcessPoolExecutor
+                if self.use_processes
+                else futures.ThreadPoolExecutor
+            )
+            self.__executor = executor(max_workers=self.concurrency)
+        return self.__executor
+
+
+#: PasswordHasher: Hasher of :class:`.EncryptedSecretBytes` values.
+password_hasher = PasswordHasher(
+    rounds=settings.API.BCRYPT_ROUNDS,
+    concurrency=settings.API.BCRYPT_CONCURRENCY,
+    use_processes=settings.API.BCRYPT_USE_PROCESSES,
+)
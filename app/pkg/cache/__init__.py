@@ -0,0 +1,5 @@
+"""Generic caches of the application."""
+
+# ruff: noqa
+
+from app.pkg.cache.two_layer import CacheStorage, LocalCache, TwoLayerCache
@@ -0,0 +1,240 @@
+"""Two-layer cache: in-process LRU in front of redis.
+
+The local layer keeps hot values in memory of the worker process for a short
+time, the redis layer shares values between processes. Both layers bind
+values to entity tags, so writes of the entity drop every value built from it.
+
+Every tag has a version that is bumped on invalidation. Versions are read
+before the value is built and checked again when it is stored, so a value
+built from data read before a write is never stored after the write dropped
+the tag.
+
+Notes:
+    Tags are dropped from the local layer only in the process that made the
+    write. Other processes see the write after TTL of the local layer at
+    most.
+"""
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Iterable, Protocol, Sequence
+
+from redis.asyncio import RedisError
+
+from app.pkg.logger import get_logger
+
+__all__ = ["CacheStorage", "CacheVersions", "LocalCache", "TwoLayerCache"]
+
+logger = get_logger(__name__)
+
+
+class CacheStorage(Protocol):
+    """Shared layer of :class:`.TwoLayerCache`."""
+
+    async def create(
+        self,
+        redis_key: str,
+        value: bytes,
+        tags: Iterable[str],
+        expire_time: int,
+        versions: Sequence[int] | None = None,
+    ) -> bool: ...
+
+    async def read(self, redis_key: str) -> bytes | None: ...
+
+    async def read_versions(self, tags: Sequence[str]) -> list[int]: ...
+
+    async def delete_by_tags(self, tags: Iterable[str]) -> None: ...
+
+
+@dataclass(frozen=True)
+class CacheVersions:
+    """Versions of the tags read before the value is built.
+
+    Attributes:
+        local: Versions of the tags in the process.
+        shared: Versions of the tags in redis, ``None`` if redis was not
+            available.
+    """
+
+    local: tuple[int, ...]
+    shared: tuple[int, ...] | None
+
+
+class LocalCache:
+    """In-process LRU cache with TTL and entity tags.
+
+    Attributes:
+        max_size: Max count of stored values.
+        ttl: TTL of the values in seconds.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.__values: OrderedDict[str, tuple[float, frozenset[str], bytes]] = (
+            OrderedDict()
+        )
+
+    def get(self, key: str) -> bytes | None:
+        """Get value by key.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            Value or ``None`` if key does not exist or expired.
+        """
+        item = self.__values.get(key)
+        if item is None:
+            return None
+        expires_at, _, value = item
+        if expires_at <= time.monotonic():
+            del self.__values[key]
+            return None
+        self.__values.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: bytes, tags: Iterable[str]) -> None:
+        """Store value and bind it to the tags.
+
+        Args:
+            key: Key of the value.
+            value: Value to store.
+            tags: Entity tags of the value.
+        """
+        self.__values[key] = (time.monotonic() + self.ttl, frozenset(tags), value)
+        self.__values.move_to_end(key)
+        while len(self.__values) > self.max_size:
+            self.__values.popitem(last=False)
+
+    def delete_by_tags(self, tags: Iterable[str]) -> None:
+        """Drop all values bound to any of the tags.
+
+        Args:
+            tags: Entity tags.
+        """
+        tags = frozenset(tags)
+        for key in [
+            key for key, (_, item_tags, _) in self.__values.items() if item_tags & tags
+        ]:
+            del self.__values[key]
+
+
+class TwoLayerCache:
+    """Local cache in front of redis cache.
+
+    Errors of redis are logged and treated as a cache miss, so the cache never
+    breaks the request. Redis values are prefixed with comma separated tags
+    and a newline, so the local copy keeps the tags of the value.
+    """
+
+    def __init__(self, local: LocalCache, repository: CacheStorage):
+        self.local = local
+        self.repository = repository
+        self.__versions: dict[str, int] = {}
+
+    async def get(self, key: str) -> bytes | None:
+        """Get value from the local layer or from redis.
+
+        Args:
+            key: Key of the value.
+
+        Returns:
+            Value or ``None`` if it is not cached.
+        """
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        try:
+            stored = await self.repository.read(redis_key=key)
+        except RedisError:
+            logger.exception("Failed to read cached value.")
+            return None
+        if stored is None:
+            return None
+        tags, _, value = stored.partition(b"\n")
+        self.local.set(key, value, tags.decode().split(",") if tags else ())
+        return value
+
+    async def versions(self, tags: Sequence[str]) -> CacheVersions:
+        """Read versions of the tags before the value is built.
+
+        Args:
+            tags: Entity tags of the value.
+
+        Returns:
+            Versions to pass to :meth:`.set`.
+        """
+        try:
+            shared = tuple(await self.repository.read_versions(tags))
+        except RedisError:
+            logger.exception("Failed to read cache tag versions.")
+            shared = None
+        return CacheVersions(
+            local=tuple(self.__versions.get(tag, 0) for tag in tags),
+            shared=shared,
+        )
+
+    async def set(
+        self,
+        key: str,
+        value: bytes,
+        tags: Sequence[str],
+        ttl: int,
+        versions: CacheVersions | None = None,
+    ) -> bool:
+        """Store value in both layers.
+
+        Args:
+            key: Key of the value.
+            value: Value to store.
+            tags: Entity tags of the value.
+            ttl: TTL of the value in redis in seconds.
+            versions: Versions of the tags read by :meth:`.versions` before
+                the value was built. The value is not stored if any of the
+                tags was invalidated since then.
+
+        Returns:
+            ``True`` if the value was stored.
+        """
+        tags = tuple(tags)
+        if versions is not None and versions.local != tuple(
+            self.__versions.get(tag, 0) for tag in tags
+        ):
+            return False
+
+        # Without shared versions the value can not be checked against writes
+        # of other processes, so it is kept in the local layer only.
+        if versions is None or versions.shared is not None:
+            try:
+                is_stored = await self.repository.create(
+                    redis_key=key,
+                    value=",".join(tags).encode() + b"\n" + value,
+                    tags=tags,
+                    expire_time=ttl,
+                    versions=versions.shared if versions is not None else None,
+                )
+            except RedisError:
+                logger.exception("Failed to store cached value.")
+            else:
+                if not is_stored:
+                    return False
+        self.local.set(key, value, tags)
+        return True
+
+    async def invalidate(self, *tags: str) -> None:
+        """Drop values bound to the tags from both layers.
+
+        Args:
+            *tags: Entity tags.
+        """
+        for tag in tags:
+            self.__versions[tag] = self.__versions.get(tag, 0) + 1
+        self.local.delete_by_tags(tags)
+        try:
+            await self.repository.delete_by_tags(tags)
+        except RedisError:
+            logger.exception("Failed to invalidate cache tags %s.", tags)
+
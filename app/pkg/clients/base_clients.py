@@ -1,6 +1,7 @@
 """Request to API with HMAC encryption or X-ACCESS-TOKEN header
 authentication."""
 
+import asyncio
 import hashlib
 import hmac
 import json
@@ -11,6 +12,11 @@ import pydantic
 from pydantic.types import SecretStr
 from starlette import status
 
+from app.pkg.clients.bulkhead import Bulkhead, get_bulkhead
+from app.pkg.clients.circuit_breaker import CircuitBreaker, get_circuit_breaker
+from app.pkg.clients.hedging import HedgePolicy, get_hedger
+from app.pkg.clients.http_cache import HTTPCachePolicy, get_http_cache
+from app.pkg.clients.retry import RetryPolicy
 from app.pkg.logger import get_logger
 from app.pkg.models.base import BaseModel
 from app.pkg.models.v1.exceptions.base import (
@@ -27,20 +33,81 @@ from app.pkg.models.v1.exceptions.client import (
 
 __all__ = ["BaseClient"]
 
+#: Names of clients already warned about requests without a pooled client.
+_unpooled: set[str] = set()
+
 
 class BaseClient:
     """Request to API with HMAC encryption or X-ACCESS-TOKEN header
-    authentication."""
+    authentication.
+
+    Requests go through ``http_client``, the pooled client of
+    :class:`.HTTPClientResource` injected by the container, so connections
+    are reused between calls. Without it every request opens a new client
+    and a warning is logged once per client, register the client in
+    :class:`.Clients` with ``http_client=http_client_resource(...)``.
+
+    Failed attempts are retried by :class:`.RetryPolicy` of the method.
+    Transport errors and ``5xx`` responses are counted by the
+    :class:`.CircuitBreaker` shared by all instances with the same
+    ``client_name``, which fails fast with :class:`.CircuitOpen` while the
+    dependency is down. Every attempt takes a slot of the :class:`.Bulkhead`
+    of the client, so a slow dependency can not hold every coroutine and
+    connection of the process. With ``hedge_policy`` slow GET requests are hedged
+    by :class:`.Hedger`. With ``cache_policy`` GET responses are cached by
+    :class:`.HTTPCache` according to their ``Cache-Control`` and
+    revalidated by ``ETag`` and ``Last-Modified``.
+
+    Examples:
+        Never retry POST of the client and retry GET up to five times::
+
+            >>> class SomeClient(BaseClient):
+            ...     retry_policies = {
+            ...         "GET": RetryPolicy(attempts=5),
+            ...         "POST": RetryPolicy(attempts=1),
+            ...     }
+
+        Cache reference data of the client in redis::
+
+            >>> class SomeClient(BaseClient):
+            ...     cache_policy = HTTPCachePolicy(storage=CacheRepository())
+    """
 
     client_name: str
     token: pydantic.SecretStr
     hmac_encrypt_key: pydantic.SecretStr
     url: pydantic.AnyUrl
+    http_client: httpx.AsyncClient | None
+    circuit_breaker: CircuitBreaker
+    bulkhead: Bulkhead
+
+    #: Retry policies by HTTP method, other methods use :attr:`.retry_policy`.
+    retry_policies: dict[str, RetryPolicy] = {}
+    #: Default retry policy.
+    retry_policy: RetryPolicy = RetryPolicy()
+    #: Hedging policy of GET requests, ``None`` disables hedging.
+    hedge_policy: HedgePolicy | None = None
+    #: Cache policy of GET responses, ``None`` disables the cache.
+    cache_policy: HTTPCachePolicy | None = None
 
     def __init__(
         self,
+        http_client: httpx.AsyncClient | None = None,
     ):
         self.client_name = self.__class__.__name__
+        self.http_client = http_client
+        self.circuit_breaker = get_circuit_breaker(self.client_name)
+        self.bulkhead = get_bulkhead(self.client_name)
+        self.hedger = (
+            get_hedger(self.client_name, self.hedge_policy)
+            if self.hedge_policy is not None
+            else None
+        )
+        self.http_cache = (
+            get_http_cache(self.client_name, self.cache_policy)
+            if self.cache_policy is not None
+            else None
+        )
         self.__logger = get_logger(__name__)
 
     def _encrypt(self, model: Any, digestmod: hashlib = hashlib.sha256) -> SecretStr:
@@ -106,26 +173,110 @@ class BaseClient:
         """
         if headers is None:
             headers = {"X-ACCESS-TOKEN": self.token.get_secret_value()}
-        async with httpx.AsyncClient(
+        if self.http_client is not None:
+            return await self.__send(self.http_client, method, path, headers, **kwargs)
+
+        if self.client_name not in _unpooled:
+            _unpooled.add(self.client_name)
+            self.__logger.warning(
+                "Client %s has no pooled http_client, every request opens a "
+                "new connection. Inject http_client_resource() of Clients.",
+                self.client_name,
+            )
+        async with httpx.AsyncClient() as client:
+            return await self.__send(client, method, path, headers, **kwargs)
+
+    async def __send(
+        self,
+        client: httpx.AsyncClient,
+        method: str,
+        path: str | None,
+        headers: dict,
+        **kwargs: dict,
+    ) -> httpx.Response:
+        """Send request through the client, retry it by the policy of the
+        method and handle errors.
+
+        Args:
+            client: HTTP client.
+            method: HTTP method.
+            path: Path to API endpoint.
+            headers: Headers for request.
+            **kwargs: Other params for request.
+
+        Raises:
+            CircuitOpen: Circuit breaker of the client is open.
+            BulkheadFull: Too many requests of the client are running.
+
+        Returns:
+            Response from API.
+        """
+        url = f"{self.url}{path}"
+        send_kwargs = {
+            key: kwargs.pop(key)
+            for key in ("auth", "follow_redirects")
+            if key in kwargs
+        }
+        request = client.build_request(
+            method=method,
+            url=url,
             headers=headers,
-        ) as client:
+            **kwargs,
+        )
+        policy = self.retry_policies.get(method, self.retry_policy)
+
+        use_cache = self.http_cache is not None and method == "GET"
+        cached = await self.http_cache.lookup(request) if use_cache else None
+        if cached is not None:
+            if cached.is_fresh:
+                return cached.to_response(request)
+            request.headers.update(cached.validators())
+
+        attempt = 1
+        while True:
             try:
-                url = f"{self.url}{path}"
-                response = await client.request(
-                    method=method,
-                    url=url,
-                    **kwargs,
-                )
-                self.__logger.debug(
-                    "Request to %s was successful. Time elapsed: %s.",
-                    url,
-                    response.elapsed,
-                )
-            except httpx.ConnectError as ex:
-                self.handle_connection_error(ex)
+                async with self.bulkhead.acquire():
+                    self.circuit_breaker.check()
+                    if self.hedger is not None and method == "GET":
+                        response = await self.hedger.send(
+                            request.url.path,
+                            lambda: client.send(request, **send_kwargs),
+                        )
+                    else:
+                        response = await client.send(request, **send_kwargs)
             except httpx.HTTPError as ex:
-                self.handle_client_error(ex)
-            return self.handle_response(response)
+                self.circuit_breaker.record(success=False)
+                if not policy.should_retry(attempt, request, error=ex):
+                    if isinstance(ex, httpx.ConnectError):
+                        self.handle_connection_error(ex)
+                    self.handle_client_error(ex)
+                delay = policy.delay(attempt)
+            else:
+                self.circuit_breaker.record(success=response.status_code < 500)
+                if not policy.should_retry(attempt, request, response=response):
+                    if use_cache:
+                        response = await self.http_cache.update(
+                            request,
+                            response,
+                            cached,
+                        )
+                    self.__logger.debug(
+                        "Request to %s was successful. Time elapsed: %s.",
+                        url,
+                        response.elapsed,
+                    )
+                    return self.handle_response(response)
+                delay = policy.delay(attempt, response)
+                await response.aclose()
+
+            self.__logger.warning(
+                "Attempt %s of request to %s failed, retrying in %.3f s.",
+                attempt,
+                url,
+                delay,
+            )
+            await asyncio.sleep(delay)
+            attempt += 1
 
     def handle_connection_error(self, ex: Exception) -> None:
         raise BaseExceptionFromClient from ex
@@ -0,0 +1,123 @@
+"""Bulkhead of outbound clients."""
+
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, List
+
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.client import BulkheadFull
+from app.pkg.settings import settings
+
+__all__ = ["Bulkhead", "get_bulkhead", "read_bulkheads"]
+
+
+class Bulkhead:
+    """Cap count of requests of one client running at once.
+
+    At most ``max_concurrent`` requests run, at most ``max_queue`` more wait
+    for a free slot up to ``queue_timeout`` seconds. Requests over the queue
+    or out of time fail fast with :class:`.BulkheadFull`, so a slow
+    dependency holds a bounded share of coroutines and connections and
+    requests to other clients are not stuck behind it.
+
+    Attributes:
+        name: Name of the protected client.
+        max_concurrent: Max count of requests running at once.
+        max_queue: Max count of requests waiting for a free slot.
+        queue_timeout: Time in seconds a request waits for a free slot.
+
+    Examples:
+        Hold the slot while the request is sent::
+
+            >>> async with bulkhead.acquire():
+            ...     response = await client.send(request)
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrent: int,
+        max_queue: int,
+        queue_timeout: float,
+    ):
+        self.name = name
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.__semaphore = asyncio.Semaphore(max_concurrent)
+        self.__in_flight = 0
+        self.__waiting = 0
+        self.__rejected = 0
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Take a slot for the request and release it on exit.
+
+        Raises:
+            BulkheadFull: The queue is full or the slot was not freed in
+                ``queue_timeout``.
+        """
+        if self.__semaphore.locked():
+            if self.__waiting >= self.max_queue:
+                self.__rejected += 1
+                raise BulkheadFull
+            self.__waiting += 1
+            try:
+                await asyncio.wait_for(
+                    self.__semaphore.acquire(),
+                    timeout=self.queue_timeout,
+                )
+            except asyncio.TimeoutError:
+                self.__rejected += 1
+                raise BulkheadFull from None
+            finally:
+                self.__waiting -= 1
+        else:
+            await self.__semaphore.acquire()
+
+        self.__in_flight += 1
+        try:
+            yield
+        finally:
+            self.__in_flight -= 1
+            self.__semaphore.release()
+
+    def snapshot(self) -> models.BulkheadState:
+        """Current occupancy of the bulkhead."""
+        return models.BulkheadState(
+            name=self.name,
+            max_concurrent=self.max_concurrent,
+            max_queue=self.max_queue,
+            in_flight=self.__in_flight,
+            waiting=self.__waiting,
+            rejected=self.__rejected,
+        )
+
+
+#: Bulkheads by ``client_name``.
+_bulkheads: dict[str, Bulkhead] = {}
+
+
+def get_bulkhead(client_name: str) -> Bulkhead:
+    """Bulkhead shared by all instances of the client.
+
+    Args:
+        client_name: Name of the client.
+
+    Returns:
+        Bulkhead configured by :attr:`.Clients.HTTP`.
+    """
+    if client_name not in _bulkheads:
+        options = settings.CLIENTS.HTTP
+        _bulkheads[client_name] = Bulkhead(
+            name=client_name,
+            max_concurrent=options.BULKHEAD_MAX_CONCURRENT,
+            max_queue=options.BULKHEAD_MAX_QUEUE,
+            queue_timeout=options.BULKHEAD_QUEUE_TIMEOUT,
+        )
+    return _bulkheads[client_name]
+
+
+def read_bulkheads() -> List[models.BulkheadState]:
+    """Occupancy of bulkheads of all clients of the process."""
+    return [bulkhead.snapshot() for bulkhead in _bulkheads.values()]
@@ -0,0 +1,157 @@
+"""Circuit breaker of outbound clients."""
+
+import time
+from collections import deque
+from typing import Callable
+
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.app.circuit_breaker import CircuitStateEnum
+from app.pkg.models.v1.exceptions.client import CircuitOpen
+from app.pkg.settings import settings
+
+__all__ = ["CircuitBreaker", "get_circuit_breaker"]
+
+
+class CircuitBreaker:
+    """Fail fast while the dependency is down.
+
+    Results of calls are kept for ``window_seconds``. The breaker opens when
+    at least ``min_calls`` calls are in the window and the share of failed
+    ones reaches ``failure_ratio``. Open breaker rejects calls with
+    :class:`.CircuitOpen` for ``open_seconds``, then lets
+    ``half_open_calls`` trial calls through: success closes the breaker,
+    failure opens it again.
+
+    Attributes:
+        name: Name of the protected client.
+        failure_ratio: Share of failed calls in the window that opens the
+            breaker.
+        min_calls: Min count of calls in the window to judge the ratio.
+        window_seconds: Length of the rolling window in seconds.
+        open_seconds: Time in seconds the breaker stays open.
+        half_open_calls: Max count of trial calls in half-open state.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_ratio: float = 0.5,
+        min_calls: int = 10,
+        window_seconds: float = 30.0,
+        open_seconds: float = 15.0,
+        half_open_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.failure_ratio = failure_ratio
+        self.min_calls = min_calls
+        self.window_seconds = window_seconds
+        self.open_seconds = open_seconds
+        self.half_open_calls = half_open_calls
+        self.__clock = clock
+        self.__state = CircuitStateEnum.CLOSED
+        self.__opened_at = 0.0
+        self.__trials = 0
+        self.__calls: deque[tuple[float, bool]] = deque()
+        self.__failures = 0
+
+    @property
+    def state(self) -> CircuitStateEnum:
+        """Current state, open breaker turns half-open after
+        ``open_seconds``."""
+        if (
+            self.__state == CircuitStateEnum.OPEN
+            and self.__clock() - self.__opened_at >= self.open_seconds
+        ):
+            self.__state = CircuitStateEnum.HALF_OPEN
+            self.__trials = 0
+        return self.__state
+
+    def check(self) -> None:
+        """Take permission for the call.
+
+        Raises:
+            CircuitOpen: Breaker is open or all trial calls are taken.
+        """
+        state = self.state
+        if state == CircuitStateEnum.OPEN:
+            raise CircuitOpen
+        if state == CircuitStateEnum.HALF_OPEN:
+            if self.__trials >= self.half_open_calls:
+                raise CircuitOpen
+            self.__trials += 1
+
+    def record(self, success: bool) -> None:
+        """Record result of the call permitted by :meth:`.check`.
+
+        Args:
+            success: ``False`` if the dependency failed the call.
+        """
+        now = self.__clock()
+        if self.state == CircuitStateEnum.HALF_OPEN:
+            self.__trials = max(self.__trials - 1, 0)
+            if success:
+                self.__close()
+            else:
+                self.__open(now)
+            return
+
+        self.__calls.append((now, success))
+        self.__failures += not success
+        while self.__calls and now - self.__calls[0][0] > self.window_seconds:
+            _, is_success = self.__calls.popleft()
+            self.__failures -= not is_success
+
+        if (
+            self.__state == CircuitStateEnum.CLOSED
+            and len(self.__calls) >= self.min_calls
+            and self.__failures / len(self.__calls) >= self.failure_ratio
+        ):
+            self.__open(now)
+
+    def snapshot(self) -> models.CircuitBreakerState:
+        """Current state and counters of the rolling window."""
+        return models.CircuitBreakerState(
+            name=self.name,
+            state=self.state,
+            calls=len(self.__calls),
+            failures=self.__failures,
+        )
+
+    def __open(self, now: float) -> None:
+        """Reject calls for ``open_seconds``."""
+        self.__state = CircuitStateEnum.OPEN
+        self.__opened_at = now
+        self.__trials = 0
+
+    def __close(self) -> None:
+        """Let calls pass and start a new window."""
+        self.__state = CircuitStateEnum.CLOSED
+        self.__calls.clear()
+        self.__failures = 0
+
+
+#: Circuit breakers by ``client_name``.
+_breakers: dict[str, CircuitBreaker] = {}
+
+
+def get_circuit_breaker(client_name: str) -> CircuitBreaker:
+    """Circuit breaker shared by all instances of the client.
+
+    Args:
+        client_name: Name of the client.
+
+    Returns:
+        Breaker configured by :attr:`.Clients.HTTP`.
+    """
+    if client_name not in _breakers:
+        options = settings.CLIENTS.HTTP
+        _breakers[client_name] = CircuitBreaker(
+            name=client_name,
+            failure_ratio=options.BREAKER_FAILURE_RATIO,
+            min_calls=options.BREAKER_MIN_CALLS,
+            window_seconds=options.BREAKER_WINDOW_SECONDS,
+            open_seconds=options.BREAKER_OPEN_SECONDS,
+            half_open_calls=options.BREAKER_HALF_OPEN_CALLS,
+        )
+    return _breakers[client_name]
@@ -0,0 +1,193 @@
+"""Hedged requests of outbound clients."""
+
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Awaitable, Callable
+
+import httpx
+
+from app.pkg.settings import settings
+
+__all__ = ["HedgePolicy", "Hedger", "get_hedger"]
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """Hedging policy of GET requests of the client.
+
+    Attributes:
+        percentile: Latency percentile of the path after which the second
+            request is sent.
+        budget_ratio: Max share of requests that are hedged.
+        min_samples: Min count of latency samples of the path before it is
+            hedged.
+        window: Count of latest latency samples kept per path.
+        max_burst: Max count of hedges saved up by the budget.
+    """
+
+    percentile: float = settings.CLIENTS.HTTP.HEDGE_PERCENTILE
+    budget_ratio: float = settings.CLIENTS.HTTP.HEDGE_BUDGET_RATIO
+    min_samples: int = settings.CLIENTS.HTTP.HEDGE_MIN_SAMPLES
+    window: int = 1000
+    max_burst: int = 10
+
+
+class Hedger:
+    """Send the second request when the first one is slower than usual.
+
+    Latency of successful requests is tracked per path. When the request
+    runs longer than :attr:`.HedgePolicy.percentile` of its path, the same
+    request is sent again and the first successful response wins, the other
+    request is cancelled or its response is closed. Every request adds
+    ``budget_ratio`` to the budget and every hedge takes one from it, so
+    hedges stay a small share of traffic even when the upstream slows down
+    as a whole.
+
+    Attributes:
+        name: Name of the client.
+        policy: Hedging policy.
+    """
+
+    def __init__(self, name: str, policy: HedgePolicy):
+        self.name = name
+        self.policy = policy
+        self.requests = 0
+        self.hedged = 0
+        self.__budget = 0.0
+        self.__samples: dict[str, deque[float]] = {}
+        self.__thresholds: dict[str, float] = {}
+        self.__stale: dict[str, int] = {}
+
+    async def send(
+        self,
+        path: str,
+        send: Callable[[], Awaitable[httpx.Response]],
+    ) -> httpx.Response:
+        """Send request, hedging it if it is slow.
+
+        Args:
+            path: Path of the request, latency is tracked per path.
+            send: Function that sends the request once.
+
+        Returns:
+            First successful response.
+        """
+        self.requests += 1
+        self.__budget = min(
+            self.__budget + self.policy.budget_ratio,
+            self.policy.max_burst,
+        )
+        threshold = self.threshold(path)
+        started = time.perf_counter()
+        first = asyncio.ensure_future(send())
+        if threshold is not None:
+            try:
+                await asyncio.wait({first}, timeout=threshold)
+            except asyncio.CancelledError:
+                first.cancel()
+                raise
+        if threshold is None or first.done() or self.__budget < 1:
+            return self.__observe(path, started, await first)
+
+        self.__budget -= 1
+        self.hedged += 1
+        second = asyncio.ensure_future(send())
+        response = await self.__first_success(first, second)
+        return self.__observe(path, started, response)
+
+    def threshold(self, path: str) -> float | None:
+        """Latency in seconds after which the request of the path is hedged.
+
+        Args:
+            path: Path of the request.
+
+        Returns:
+            Threshold or ``None`` if the path has too few samples.
+        """
+        samples = self.__samples.get(path)
+        if not samples or len(samples) < self.policy.min_samples:
+            return None
+
+        # Sorting the window on every request is wasteful, the percentile
+        # is recalculated after every tenth of the window.
+        if (
+            path not in self.__thresholds
+            or self.__stale[path] >= max(self.policy.window // 10, 1)
+        ):
+            ordered = sorted(samples)
+            self.__thresholds[path] = ordered[
+                int(self.policy.percentile * (len(ordered) - 1))
+            ]
+            self.__stale[path] = 0
+        return self.__thresholds[path]
+
+    def __observe(
+        self,
+        path: str,
+        started: float,
+        response: httpx.Response,
+    ) -> httpx.Response:
+        """Add latency of the successful response to samples of the path."""
+        if response.is_success:
+            samples = self.__samples.setdefault(
+                path,
+                deque(maxlen=self.policy.window),
+            )
+            samples.append(time.perf_counter() - started)
+            self.__stale[path] = self.__stale.get(path, 0) + 1
+        return response
+
+    @staticmethod
+    async def __first_success(*tasks: asyncio.Future) -> httpx.Response:
+        """First successful response of the tasks, other tasks are cancelled.
+
+        Responses that lost are closed. When no response is successful the
+        first one is returned, so the caller sees its status.
+
+        Raises:
+            httpx.HTTPError: All tasks failed, error of the first one.
+        """
+        pending, responses, error, winner = set(tasks), [], None, None
+        try:
+            while pending and winner is None:
+                done, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                for task in sorted(done, key=tasks.index):
+                    if task.exception() is None:
+                        responses.append(task.result())
+                    else:
+                        error = error or task.exception()
+                winner = next((it for it in responses if it.is_success), None)
+            if not responses:
+                raise error
+            winner = winner or responses[0]
+            return winner
+        finally:
+            for task in pending:
+                task.cancel()
+            for response in responses:
+                if response is not winner:
+                    await response.aclose()
+
+
+#: Hedgers by ``client_name``.
+_hedgers: dict[str, Hedger] = {}
+
+
+def get_hedger(client_name: str, policy: HedgePolicy) -> Hedger:
+    """Hedger shared by all instances of the client.
+
+    Args:
+        client_name: Name of the client.
+        policy: Hedging policy of the client.
+
+    Returns:
+        Hedger of the client.
+    """
+    if client_name not in _hedgers:
+        _hedgers[client_name] = Hedger(name=client_name, policy=policy)
+    return _hedgers[client_name]
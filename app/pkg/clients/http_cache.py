@@ -0,0 +1,352 @@
+"""HTTP cache of GET responses of outbound clients."""
+
+import datetime
+import hashlib
+import json
+import time
+from dataclasses import dataclass
+from typing import Iterable
+
+import httpx
+
+from app.pkg.cache import CacheStorage, LocalCache, TwoLayerCache
+from app.pkg.settings import settings
+
+__all__ = ["CachedResponse", "HTTPCache", "HTTPCachePolicy", "get_http_cache"]
+
+#: Headers that describe the encoded body, cached body is already decoded.
+_BODY_HEADERS = frozenset(("content-encoding", "content-length", "transfer-encoding"))
+
+
+def _cache_control(headers: httpx.Headers) -> dict[str, str | None]:
+    """Directives of ``Cache-Control`` header by lowercase names."""
+    directives = {}
+    for directive in headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name:
+            directives[name.lower()] = value.strip('"') or None
+    return directives
+
+
+def _vary(headers: httpx.Headers) -> list[str]:
+    """Lowercase names of request headers listed in ``Vary`` header."""
+    return sorted(
+        {name.strip().lower() for name in headers.get("Vary", "").split(",")} - {""},
+    )
+
+
+@dataclass(frozen=True)
+class HTTPCachePolicy:
+    """Cache policy of GET requests of the client.
+
+    Attributes:
+        max_size: Max count of responses kept in memory of the process.
+        retention_seconds: Time in seconds a stale response is kept for
+            revalidation.
+        storage: Shared layer, e.g. :class:`.CacheRepository` of redis.
+            ``None`` keeps responses in memory of the process only.
+        auth_headers: Request headers with credentials of the caller,
+            responses are stored per their values. Add custom headers of
+            the client, e.g. HMAC signature.
+    """
+
+    max_size: int = settings.CLIENTS.HTTP.CACHE_MAX_SIZE
+    retention_seconds: int = settings.CLIENTS.HTTP.CACHE_RETENTION_SECONDS
+    storage: CacheStorage | None = None
+    auth_headers: tuple[str, ...] = ("Authorization", "X-ACCESS-TOKEN")
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """Stored response of GET request.
+
+    Attributes:
+        status_code: Status code of the response.
+        headers: Headers of the response without headers of body encoding.
+        content: Decoded body of the response.
+        expires_at: Unix time after which the response must be revalidated.
+    """
+
+    status_code: int
+    headers: list[tuple[str, str]]
+    content: bytes
+    expires_at: float
+
+    @property
+    def is_fresh(self) -> bool:
+        """Response may be served without asking the server."""
+        return self.expires_at > time.time()
+
+    def validators(self) -> dict[str, str]:
+        """Conditional headers that revalidate the response."""
+        headers = httpx.Headers(self.headers)
+        conditions = {}
+        if "ETag" in headers:
+            conditions["If-None-Match"] = headers["ETag"]
+        if "Last-Modified" in headers:
+            conditions["If-Modified-Since"] = headers["Last-Modified"]
+        return conditions
+
+    def to_response(
+        self,
+        request: httpx.Request,
+        elapsed: datetime.timedelta = datetime.timedelta(0),
+    ) -> httpx.Response:
+        """Build response of the request from the stored one.
+
+        Args:
+            request: Request the response is served to.
+            elapsed: Time spent on revalidation.
+        """
+        response = httpx.Response(
+            status_code=self.status_code,
+            headers=self.headers,
+            content=self.content,
+            request=request,
+        )
+        response.elapsed = elapsed
+        return response
+
+    def dump(self) -> bytes:
+        """Serialize response as JSON line of metadata followed by body."""
+        meta = {
+            "status_code": self.status_code,
+            "headers": self.headers,
+            "expires_at": self.expires_at,
+        }
+        return json.dumps(meta).encode() + b"\n" + self.content
+
+    @classmethod
+    def load(cls, value: bytes) -> "CachedResponse":
+        """Deserialize response made by :meth:`.dump`."""
+        meta, _, content = value.partition(b"\n")
+        meta = json.loads(meta)
+        return cls(
+            status_code=meta["status_code"],
+            headers=[tuple(header) for header in meta["headers"]],
+            content=content,
+            expires_at=meta["expires_at"],
+        )
+
+
+class HTTPCache:
+    """Cache of GET responses by ``Cache-Control``, ``ETag`` and
+    ``Last-Modified`` headers.
+
+    Successful responses are stored unless ``Cache-Control`` forbids it
+    with ``no-store``. Response is fresh for ``max-age`` seconds minus its
+    ``Age``, ``no-cache`` makes it stale at once. Fresh responses are served
+    without a request. Stale ones are kept for ``retention_seconds`` and
+    revalidated with ``If-None-Match`` and ``If-Modified-Since``: on ``304``
+    the stored response is served again and its freshness is renewed.
+    Responses without ``max-age`` and validators are never stored.
+
+    Responses are stored per credentials of the request, see
+    :attr:`.HTTPCachePolicy.auth_headers`, so instances of the client with
+    different tokens never share them. Responses with ``Vary`` are stored
+    per values of the listed request headers, names of the headers are
+    stored next to them by the URL. With
+    ``storage`` responses are shared between processes, except for
+    ``private`` ones, which stay in memory of the process.
+
+    Attributes:
+        name: Name of the client.
+        policy: Cache policy.
+    """
+
+    def __init__(self, name: str, policy: HTTPCachePolicy):
+        self.name = name
+        self.policy = policy
+        self.hits = 0
+        self.revalidated = 0
+        self.__local = LocalCache(
+            max_size=policy.max_size,
+            ttl=policy.retention_seconds,
+        )
+        self.__shared = (
+            TwoLayerCache(local=self.__local, repository=policy.storage)
+            if policy.storage is not None
+            else None
+        )
+
+    def key(self, request: httpx.Request, vary: Iterable[str] = ()) -> str:
+        """Cache key of the request.
+
+        Args:
+            request: GET request.
+            vary: Names of request headers listed in ``Vary`` of the response.
+
+        Returns:
+            Key by the URL and a digest of values of ``auth_headers`` of the
+            policy and of the ``vary`` headers. Responses are never served
+            to a caller with other credentials, the values are not kept in
+            plain text.
+        """
+        key = f"http-cache:{self.name}:{request.url}"
+        credentials = [
+            [name.lower(), request.headers[name]]
+            for name in self.policy.auth_headers
+            if name in request.headers
+        ]
+        varied = [[name, request.headers.get(name)] for name in sorted(vary)]
+        if not credentials and not varied:
+            return key
+        values = json.dumps([credentials, varied])
+        return f"{key}:{hashlib.sha256(values.encode()).hexdigest()}"
+
+    async def lookup(self, request: httpx.Request) -> CachedResponse | None:
+        """Stored response of the request.
+
+        Args:
+            request: GET request.
+
+        Returns:
+            Stored response, fresh or stale, or ``None`` if the request must
+            bypass the cache.
+        """
+        directives = _cache_control(request.headers)
+        if "no-store" in directives or "no-cache" in directives:
+            return None
+
+        vary = await self.__get(self.__vary_key(request))
+        value = await self.__get(
+            self.key(request, vary.decode().split(",") if vary else ()),
+        )
+        if value is None:
+            return None
+        cached = CachedResponse.load(value)
+        if cached.is_fresh:
+            self.hits += 1
+        return cached
+
+    async def update(
+        self,
+        request: httpx.Request,
+        response: httpx.Response,
+        cached: CachedResponse | None,
+    ) -> httpx.Response:
+        """Store the response of the server or serve the revalidated one.
+
+        Args:
+            request: Sent request.
+            response: Response of the server.
+            cached: Stored response found by :meth:`.lookup`.
+
+        Returns:
+            Stored response on ``304``, otherwise ``response``.
+        """
+        if response.status_code == httpx.codes.NOT_MODIFIED and cached is not None:
+            await response.aclose()
+            headers = httpx.Headers(cached.headers)
+            headers.update(
+                {
+                    name: value
+                    for name, value in response.headers.items()
+                    if name.lower() not in _BODY_HEADERS
+                },
+            )
+            entry = self.__entry(cached.status_code, headers, cached.content)
+            if entry is not None:
+                await self.__store(request, entry)
+            self.revalidated += 1
+            return (entry or cached).to_response(request, elapsed=response.elapsed)
+
+        if response.status_code == httpx.codes.OK:
+            await response.aread()
+            headers = httpx.Headers(
+                [
+                    (name, value)
+                    for name, value in response.headers.items()
+                    if name.lower() not in _BODY_HEADERS
+                ],
+            )
+            entry = self.__entry(response.status_code, headers, response.content)
+            if entry is not None:
+                await self.__store(request, entry)
+        return response
+
+    async def invalidate(self) -> None:
+        """Drop all stored responses of the client."""
+        self.__local.delete_by_tags((self.name,))
+        if self.__shared is not None:
+            await self.__shared.invalidate(self.name)
+
+    def __entry(
+        self,
+        status_code: int,
+        headers: httpx.Headers,
+        content: bytes,
+    ) -> CachedResponse | None:
+        """Build stored response, ``None`` if the response is not storable."""
+        directives = _cache_control(headers)
+        if "no-store" in directives or headers.get("Vary", "").strip() == "*":
+            return None
+
+        max_age = directives.get("max-age")
+        has_validators = "ETag" in headers or "Last-Modified" in headers
+        if "no-cache" in directives or max_age is None or not max_age.isdigit():
+            if not has_validators:
+                return None
+            freshness = 0
+        else:
+            age = headers.get("Age", "0")
+            freshness = int(max_age) - (int(age) if age.isdigit() else 0)
+        return CachedResponse(
+            status_code=status_code,
+            headers=list(headers.items()),
+            content=content,
+            expires_at=time.time() + freshness,
+        )
+
+    async def __store(self, request: httpx.Request, cached: CachedResponse) -> None:
+        """Store response in the local layer and in the shared one."""
+        headers = httpx.Headers(cached.headers)
+        vary = _vary(headers)
+        shared = "private" not in _cache_control(headers)
+        vary_key = self.__vary_key(request)
+        # Names of a previous response of the URL must not point lookups
+        # away from the response without ``Vary``.
+        if vary or await self.__get(vary_key) is not None:
+            await self.__set(vary_key, ",".join(vary).encode(), shared=shared)
+        await self.__set(self.key(request, vary), cached.dump(), shared=shared)
+
+    def __vary_key(self, request: httpx.Request) -> str:
+        """Key of names of ``Vary`` headers of the stored response."""
+        return f"{self.key(request)}:vary"
+
+    async def __get(self, key: str) -> bytes | None:
+        """Get value from the shared layer or from the local one."""
+        if self.__shared is not None:
+            return await self.__shared.get(key)
+        return self.__local.get(key)
+
+    async def __set(self, key: str, value: bytes, shared: bool) -> None:
+        """Store value in the local layer and, if ``shared``, in the shared one."""
+        if self.__shared is not None and shared:
+            await self.__shared.set(
+                key,
+                value,
+                tags=(self.name,),
+                ttl=self.policy.retention_seconds,
+            )
+        else:
+            self.__local.set(key, value, tags=(self.name,))
+
+
+#: HTTP caches by ``client_name``.
+_caches: dict[str, HTTPCache] = {}
+
+
+def get_http_cache(client_name: str, policy: HTTPCachePolicy) -> HTTPCache:
+    """HTTP cache shared by all instances of the client.
+
+    Args:
+        client_name: Name of the client.
+        policy: Cache policy of the client.
+
+    Returns:
+        HTTP cache of the client.
+    """
+    if client_name not in _caches:
+        _caches[client_name] = HTTPCache(name=client_name, policy=policy)
+    return _caches[client_name]
@@ -0,0 +1,112 @@
+"""Async resource with pooled HTTP client of :class:`.BaseClient`."""
+
+import httpx
+from dependency_injector import providers
+
+from app.pkg.connectors.resources import BaseAsyncResource
+from app.pkg.logger import get_logger
+from app.pkg.settings import settings
+
+__all__ = ["HTTPClientResource", "http_client_resource"]
+
+
+class HTTPClientResource(BaseAsyncResource):
+    """Shared ``httpx.AsyncClient``, one per ``client_name``.
+
+    Connections are kept alive between requests, so outbound calls do not
+    pay TCP and TLS setup every time.
+    """
+
+    async def init(
+        self,
+        client_name: str,
+        max_connections: int,
+        max_keepalive_connections: int,
+        keepalive_expiry: float,
+        http2: bool,
+        connect_timeout: float,
+        read_timeout: float,
+        write_timeout: float,
+        pool_timeout: float,
+        **kwargs,
+    ) -> httpx.AsyncClient:
+        """Create pooled client.
+
+        Args:
+            client_name: Name of the client in logs.
+            max_connections: Max count of connections.
+            max_keepalive_connections: Max count of idle connections.
+            keepalive_expiry: Time in seconds an idle connection is kept.
+            http2: Negotiate HTTP/2.
+            connect_timeout: Time in seconds to establish a connection.
+            read_timeout: Time in seconds to wait for a chunk of the response.
+            write_timeout: Time in seconds to send a chunk of the request.
+            pool_timeout: Time in seconds to wait for a free connection.
+            **kwargs: Other arguments of ``httpx.AsyncClient``.
+
+        Returns:
+            Created client.
+        """
+
+        get_logger(__name__).info("Open HTTP client %s.", client_name)
+        return httpx.AsyncClient(
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            timeout=httpx.Timeout(
+                connect=connect_timeout,
+                read=read_timeout,
+                write=write_timeout,
+                pool=pool_timeout,
+            ),
+            http2=http2,
+            **kwargs,
+        )
+
+    async def shutdown(self, resource: httpx.AsyncClient) -> None:
+        """Close connections of the client.
+
+        Args:
+            resource: Resource returned by :meth:`.HTTPClientResource.init()`
+                method.
+        """
+
+        await resource.aclose()
+
+
+def http_client_resource(client_name: str, **kwargs) -> providers.Resource:
+    """Provider of pooled client configured by :attr:`.Clients.HTTP`.
+
+    Args:
+        client_name: Name of the client in logs.
+        **kwargs: Other arguments of ``httpx.AsyncClient``.
+
+    Examples:
+        Every client gets own pool::
+
+            >>> class Clients(containers.DeclarativeContainer):
+            ...     centrifugo = providers.Factory(
+            ...         CentrifugoClient,
+            ...         http_client=http_client_resource("centrifugo"),
+            ...     )
+
+    Returns:
+        Resource provider, closed by ``shutdown_resources`` of the container.
+    """
+
+    options = settings.CLIENTS.HTTP
+    return providers.Resource(
+        HTTPClientResource,
+        client_name=client_name,
+        max_connections=options.MAX_CONNECTIONS,
+        max_keepalive_connections=options.MAX_KEEPALIVE_CONNECTIONS,
+        keepalive_expiry=options.KEEPALIVE_EXPIRY,
+        http2=options.HTTP2,
+        connect_timeout=options.CONNECT_TIMEOUT,
+        read_timeout=options.READ_TIMEOUT,
+        write_timeout=options.WRITE_TIMEOUT,
+        pool_timeout=options.POOL_TIMEOUT,
+        **kwargs,
+    )
@@ -0,0 +1,95 @@
+"""Retry policies of outbound clients."""
+
+import random
+from dataclasses import dataclass
+
+import httpx
+
+from app.pkg.settings import settings
+
+__all__ = ["RetryPolicy", "IDEMPOTENT_METHODS", "IDEMPOTENCY_KEY_HEADER"]
+
+#: Methods that can be repeated without changing the result.
+IDEMPOTENT_METHODS = frozenset(("GET", "HEAD", "OPTIONS", "PUT", "DELETE"))
+
+#: Header that makes non-idempotent request safe to repeat.
+IDEMPOTENCY_KEY_HEADER = "Idempotency-Key"
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retry policy of the method of the client.
+
+    Idempotent methods and requests with ``Idempotency-Key`` header are
+    retried on any transport error and on ``retry_statuses``. Other requests
+    are retried only if they surely did not reach the server, i.e. on
+    connection errors.
+
+    Attributes:
+        attempts: Max count of attempts, ``1`` disables retries.
+        base_delay_ms: Delay in milliseconds before the second attempt.
+        max_delay_ms: Max delay in milliseconds between attempts.
+        retry_statuses: Response statuses that are retried.
+    """
+
+    attempts: int = settings.CLIENTS.HTTP.RETRY_ATTEMPTS
+    base_delay_ms: int = settings.CLIENTS.HTTP.RETRY_BASE_DELAY_MS
+    max_delay_ms: int = settings.CLIENTS.HTTP.RETRY_MAX_DELAY_MS
+    retry_statuses: frozenset[int] = frozenset((429, 502, 503, 504))
+
+    def should_retry(
+        self,
+        attempt: int,
+        request: httpx.Request,
+        error: httpx.HTTPError | None = None,
+        response: httpx.Response | None = None,
+    ) -> bool:
+        """Check if the failed attempt may be repeated.
+
+        Args:
+            attempt: Number of the failed attempt, starts with ``1``.
+            request: Sent request.
+            error: Transport error of the attempt.
+            response: Response of the attempt.
+
+        Returns:
+            ``True`` if one more attempt is allowed.
+        """
+        if attempt >= self.attempts:
+            return False
+
+        if error is not None and isinstance(
+            error,
+            (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout),
+        ):
+            return True
+
+        is_idempotent = (
+            request.method in IDEMPOTENT_METHODS
+            or IDEMPOTENCY_KEY_HEADER in request.headers
+        )
+        if not is_idempotent:
+            return False
+        if error is not None:
+            return isinstance(error, httpx.TransportError)
+        return response is not None and response.status_code in self.retry_statuses
+
+    def delay(self, attempt: int, response: httpx.Response | None = None) -> float:
+        """Delay in seconds before the next attempt.
+
+        Exponential backoff with full jitter, ``Retry-After`` header of the
+        response is honored up to ``max_delay_ms``.
+
+        Args:
+            attempt: Number of the failed attempt, starts with ``1``.
+            response: Response of the failed attempt.
+
+        Returns:
+            Delay in seconds.
+        """
+        retry_after = response.headers.get("Retry-After") if response else None
+        if retry_after is not None and retry_after.isdigit():
+            return min(int(retry_after) * 1000, self.max_delay_ms) / 1000
+
+        cap = min(self.base_delay_ms * 2 ** (attempt - 1), self.max_delay_ms)
+        return random.uniform(0, cap) / 1000  # nosec B311
@@ -11,7 +11,12 @@ __all__ = [
 
 
 class Clients(containers.DeclarativeContainer):
-    """Declarative container with clients."""
+    """Declarative container with clients.
+
+    Every :class:`.BaseClient` subclass gets own pool from
+    :func:`.http_client_resource`, pools are closed on shutdown of the
+    application.
+    """
 
     configuration = providers.Configuration(name="settings")
     configuration.from_dict(settings.model_dump())
@@ -0,0 +1,11 @@
+"""Codecs of messages sent through queues."""
+
+# ruff: noqa
+
+from app.pkg.codec.message import (
+    CONTENT_TYPE_JSON,
+    ENCODING_DEFLATE,
+    UnsupportedMessageEncoding,
+    decode_message,
+    encode_message,
+)
@@ -0,0 +1,104 @@
+"""Serialize models to queue messages and back.
+
+Models are dumped to JSON bytes with the compiled pydantic serializer and
+validated back from bytes without intermediate dicts. Large payloads are
+compressed with deflate.
+
+Examples:
+    ::
+
+        >>> from app.pkg.models import v1 as models
+        >>> body, encoding = encode_message(
+        ...     models.CreateBidCommand(bid_name="bid"),
+        ...     compress_threshold=1024,
+        ... )
+        >>> decode_message(
+        ...     body,
+        ...     models.CreateBidCommand,
+        ...     content_type=CONTENT_TYPE_JSON,
+        ...     content_encoding=encoding,
+        ... )
+        CreateBidCommand(bid_name='bid')
+"""
+
+import zlib
+from typing import Type
+
+from app.pkg.models.base import Model
+
+__all__ = [
+    "CONTENT_TYPE_JSON",
+    "ENCODING_DEFLATE",
+    "UnsupportedMessageEncoding",
+    "decode_message",
+    "encode_message",
+]
+
+CONTENT_TYPE_JSON = "application/json"
+ENCODING_DEFLATE = "deflate"
+
+#: Encodings of uncompressed payloads.
+_IDENTITY_ENCODINGS = frozenset((None, "", "identity", "utf-8"))
+
+
+class UnsupportedMessageEncoding(ValueError):
+    """Content type or content encoding of the message is not supported."""
+
+
+def encode_message(
+    message: Model,
+    compress_threshold: int | None = None,
+) -> tuple[bytes, str | None]:
+    """Serialize model to the message body.
+
+    Args:
+        message: Model to serialize.
+        compress_threshold: Min size in bytes of the payload to compress.
+            ``None`` disables compression.
+
+    Returns:
+        Body of the message and its content encoding, ``None`` for plain JSON.
+    """
+
+    body = message.__pydantic_serializer__.to_json(message)
+    if compress_threshold is not None and len(body) >= compress_threshold:
+        return zlib.compress(body, 1), ENCODING_DEFLATE
+    return body, None
+
+
+def decode_message(
+    body: bytes,
+    model: Type[Model],
+    content_type: str | None = None,
+    content_encoding: str | None = None,
+) -> Model:
+    """Validate message body into the model.
+
+    Messages without content type are treated as JSON, so messages published
+    before content headers were added are still readable.
+
+    Args:
+        body: Body of the message.
+        model: Model of the message.
+        content_type: Content type of the body.
+        content_encoding: Content encoding of the body.
+
+    Raises:
+        UnsupportedMessageEncoding: Unknown content type or content encoding.
+        ValueError: Body is not a valid payload of the model.
+
+    Returns:
+        Validated model.
+    """
+
+    if content_encoding == ENCODING_DEFLATE:
+        try:
+            body = zlib.decompress(body)
+        except zlib.error as error:
+            raise ValueError("Malformed deflate payload.") from error
+    elif content_encoding not in _IDENTITY_ENCODINGS:
+        raise UnsupportedMessageEncoding(f"Unsupported encoding {content_encoding}.")
+
+    if content_type not in (None, "", CONTENT_TYPE_JSON):
+        raise UnsupportedMessageEncoding(f"Unsupported content type {content_type}.")
+    return model.model_validate_json(body)
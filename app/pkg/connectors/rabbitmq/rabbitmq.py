@@ -2,14 +2,22 @@
 
 from dependency_injector import containers, providers
 
-from app.pkg.connectors.rabbitmq.resource import RabbitMQ
+from app.pkg.connectors.rabbitmq.resource import (
+    RabbitMQ,
+    RabbitMQChannelPool,
+    RabbitMQConnection,
+)
 from app.pkg.settings import settings
 
 __all__ = ["RabbitMQContainer"]
 
 
 class RabbitMQContainer(containers.DeclarativeContainer):
-    """Declarative container with rabbitmq connector."""
+    """Declarative container with rabbitmq connector.
+
+    Publisher channels and consumers run on own dedicated connections, the
+    pool of connections serves short-lived operations only.
+    """
 
     configuration = providers.Configuration()
     configuration.from_dict(settings.model_dump())
@@ -19,3 +27,19 @@ class RabbitMQContainer(containers.DeclarativeContainer):
         dsn=configuration.RABBITMQ.DSN,
         max_size=configuration.RABBITMQ.MAX_CONNECTION,
     )
+
+    publisher_connection = providers.Resource(
+        RabbitMQConnection,
+        dsn=configuration.RABBITMQ.DSN,
+    )
+
+    channel_pool = providers.Resource(
+        RabbitMQChannelPool,
+        connection=publisher_connection,
+        max_size=configuration.RABBITMQ.MAX_CHANNEL,
+    )
+
+    consumer_connection = providers.Resource(
+        RabbitMQConnection,
+        dsn=configuration.RABBITMQ.DSN,
+    )
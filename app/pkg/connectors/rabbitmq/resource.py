@@ -4,7 +4,7 @@ import aio_pika
 
 from app.pkg.connectors.resources import BaseAsyncResource
 
-__all__ = ["RabbitMQ"]
+__all__ = ["RabbitMQ", "RabbitMQConnection", "RabbitMQChannelPool"]
 
 
 class RabbitMQ(BaseAsyncResource):
@@ -39,3 +39,80 @@ class RabbitMQ(BaseAsyncResource):
         """
 
         await resource.close()
+
+
+class RabbitMQConnection(BaseAsyncResource):
+    """Dedicated rabbitmq connection, not shared with the pool of
+    connections.
+
+    Long-lived users (publisher channels, consumers) keep their channels on
+    own connections, so they never wait for a free connection of the pool
+    and flow control of the broker on publishers does not stall consumers.
+    """
+
+    async def init(
+        self,
+        dsn: str,
+        *args,
+        **kwargs,
+    ) -> aio_pika.abc.AbstractRobustConnection:
+        """Open connection to RabbitMQ.
+
+        Args:
+            dsn: D.S.N - Data Source Name.
+
+        Returns:
+            Opened connection to RabbitMQ.
+        """
+
+        return await aio_pika.connect_robust(dsn, *args, **kwargs)
+
+    async def shutdown(self, resource: aio_pika.abc.AbstractRobustConnection):
+        """Close connection.
+
+        Args:
+            resource: Resource returned by :meth:`.RabbitMQConnection.init()`
+                method.
+        """
+
+        await resource.close()
+
+
+class RabbitMQChannelPool(BaseAsyncResource):
+    """Pool of rabbitmq channels over the dedicated connection of
+    publishers.
+
+    Channels are opened once in confirm mode and reused by publishers, so a
+    publish does not pay for ``Channel.Open`` round trip.
+    """
+
+    async def init(
+        self,
+        connection: aio_pika.abc.AbstractRobustConnection,
+        *args,
+        **kwargs,
+    ) -> aio_pika.pool.Pool:
+        """Create pool of channels.
+
+        Args:
+            connection: Connection returned by
+                :meth:`.RabbitMQConnection.init()`.
+
+        Returns:
+            Created pool of channels.
+        """
+
+        async def get_channel() -> aio_pika.abc.AbstractRobustChannel:
+            return await connection.channel(publisher_confirms=True)
+
+        return aio_pika.pool.Pool(get_channel, *args, **kwargs)
+
+    async def shutdown(self, resource: aio_pika.pool.Pool):
+        """Close all channels of the pool.
+
+        Args:
+            resource: Resource returned by :meth:`.RabbitMQChannelPool.init()`
+                method.
+        """
+
+        await resource.close()
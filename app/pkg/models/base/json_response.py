@@ -0,0 +1,99 @@
+"""Responses serialized by ``response_model`` straight to JSON bytes.
+
+By default FastAPI dumps the returned models to dicts, validates them again
+against ``response_model``, converts the result with ``jsonable_encoder``
+and only then encodes JSON. Routes marked with :func:`.direct_response`
+skip all of it: the returned value is validated by the cached
+:class:`~pydantic.TypeAdapter` of ``response_model`` (instances of the model
+pass without revalidation) and dumped with ``dump_json`` in one pass.
+
+Examples:
+    Mark the route with :func:`.direct_response`, any route class based on
+    :class:`.RequestIDRoute` honors the mark::
+
+        >>> @router.get("/", response_model=List[models.City])
+        ... @direct_response()
+        ... @inject
+        ... async def read_all_city(...):
+        ...     ...
+"""
+
+import asyncio
+from functools import wraps
+from typing import Any, Callable, TypeVar
+
+from pydantic import TypeAdapter
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import Response
+
+__all__ = ["JSONBytesResponse", "direct_response", "serialize_endpoint"]
+
+_T = TypeVar("_T", bound=Callable)
+
+
+class JSONBytesResponse(Response):
+    """JSON response with body serialized in advance."""
+
+    media_type = "application/json"
+
+
+def direct_response() -> Callable[[_T], _T]:
+    """Mark route as serialized straight to bytes.
+
+    Notes:
+        The decorator only marks the endpoint, the work is done by
+        :class:`.RequestIDRoute`.
+
+    Returns:
+        Decorator that returns the same endpoint.
+    """
+
+    def wrapper(endpoint: _T) -> _T:
+        endpoint.__direct_response__ = True
+        return endpoint
+
+    return wrapper
+
+
+def serialize_endpoint(
+    call: Callable[..., Any],
+    response_model: Any,
+    status_code: int,
+    **dump_options: Any,
+) -> Callable[..., Any]:
+    """Wrap endpoint to return :class:`.JSONBytesResponse`.
+
+    Args:
+        call: Endpoint of the route.
+        response_model: Response model of the route.
+        status_code: Status code of the response.
+        **dump_options: Options of :meth:`~pydantic.TypeAdapter.dump_json`,
+            e.g. ``by_alias`` and ``exclude_none`` of the route.
+
+    Returns:
+        Coroutine function with the same arguments as ``call``. Responses
+        returned by ``call`` are passed as is.
+    """
+
+    adapter = TypeAdapter(response_model)
+    is_coroutine = asyncio.iscoroutinefunction(call)
+
+    @wraps(call)
+    async def wrapper(**kwargs: Any) -> Response:
+        if is_coroutine:
+            content = await call(**kwargs)
+        else:
+            content = await run_in_threadpool(call, **kwargs)
+        if isinstance(content, Response):
+            return content
+
+        return JSONBytesResponse(
+            content=adapter.dump_json(
+                adapter.validate_python(content),
+                **dump_options,
+            ),
+            status_code=status_code,
+        )
+
+    wrapper.__serialized__ = True
+    return wrapper
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import functools
 import random
 import string
 import typing
 from datetime import date, datetime, time
 from decimal import Decimal
-from typing import Any, TypeVar
+from typing import Any, Callable, Optional, TypeVar
 from uuid import UUID
 
 import pydantic
@@ -17,10 +18,11 @@ from pydantic import ConfigDict, TypeAdapter
 from app.pkg.models.types import EncryptedSecretBytes, NotEmptySecretStr
 from app.pkg.models.types.strings import NotEmptyStr
 
-__all__ = ["BaseModel", "Model"]
+__all__ = ["BaseModel", "ReadModel", "Model"]
 
 Model = TypeVar("Model", bound="BaseModel")
-_T = TypeVar("_T")
+
+_Caster = Callable[[Any, bool], Any]
 
 
 class BaseModel(pydantic.BaseModel):
@@ -117,79 +119,8 @@ class BaseModel(pydantic.BaseModel):
             Dict object with reveal password filed.
         """
 
-        values = self.model_dump(**kwargs).items() if not values else values.items()
-        r = {}
-        for k, v in values:
-            v = self.__cast_values(v=v, show_secrets=show_secrets)
-            r[k] = v
-        return r
-
-    def __cast_values(self, v: _T, show_secrets: bool, **kwargs) -> _T:
-        """Cast value for dict object.
-
-        Args:
-            v:
-                Any value.
-            show_secrets:
-                If True, then the secret will be revealed.
-
-        Warnings:
-            This method is not memory optimized.
-        """
-
-        if isinstance(v, (list, tuple)):
-            return [
-                self.__cast_values(v=ve, show_secrets=show_secrets, **kwargs)
-                for ve in v
-            ]
-
-        elif isinstance(v, (pydantic.SecretBytes, pydantic.SecretStr)):
-            return self.__cast_secret(v=v, show_secrets=show_secrets)
-
-        elif isinstance(v, dict) and v:
-            return self.to_dict(show_secrets=show_secrets, values=v, **kwargs)
-
-        elif isinstance(v, (UUID, Decimal)):
-            return str(v)
-
-        elif isinstance(v, (datetime, date, time)):
-            return self.__cast_datetime_types(v=v)
-
-        return v
-
-    @staticmethod
-    def __cast_datetime_types(v: _T) -> _T:
-        """Cast datetime types to str.
-
-        Args:
-            v: Any value.
-
-        Returns:
-            str value of ``v``.
-        """
-
-        if isinstance(v, datetime):
-            return v.strftime("%Y-%m-%d %H:%M:%S")
-        elif isinstance(v, date):
-            return v.strftime("%Y-%m-%d")
-        elif isinstance(v, time):
-            return v.strftime("%H:%M:%S")
-
-    @staticmethod
-    def __cast_secret(v, show_secrets: bool) -> str:
-        """Cast secret value to str.
-
-        Args:
-            v: pydantic.Secret* object.
-            show_secrets: bool value. If True, then the secret will be revealed.
-
-        Returns: str value of ``v``.
-        """
-
-        if isinstance(v, pydantic.SecretBytes):
-            return v.get_secret_value().decode() if show_secrets else str(v)
-        elif isinstance(v, pydantic.SecretStr):
-            return v.get_secret_value() if show_secrets else str(v)
+        values = self.model_dump(**kwargs) if not values else values
+        return _cast_mapping(values, show_secrets)
 
     def delete_attribute(self, attr: str) -> BaseModel:
         """Delete some attribute field from a model.
@@ -298,26 +229,102 @@ class BaseModel(pydantic.BaseModel):
             pydantic model parsed from ``model``.
         """
 
-        self_dict_model = self.to_dict(show_secrets=True)
+        self_dict_model = self.__migrate_values(
+            model,
+            dump_all=random_fill,
+            match_keys=match_keys,
+            extra_fields=extra_fields,
+        )
+        if not random_fill:
+            return _adapter(model).validate_python(self_dict_model)
+
+        class Factory(ModelFactory[model]): ...
 
-        if not match_keys:
-            match_keys = {}
-        if not extra_fields:
-            extra_fields = {}
+        return Factory.build(factory_use_construct=True, **self_dict_model)
 
-        for key, value in match_keys.items():
-            self_dict_model[key] = self_dict_model.pop(value)
+    @classmethod
+    def migrate_many(
+        cls,
+        items: typing.Sequence[BaseModel],
+        model: type[Model],
+        match_keys: dict[str, str] | None = None,
+        extra_fields: typing.Sequence[dict[str, typing.Any]] | None = None,
+    ) -> list[Model]:
+        """Migrate list of models to another model in one validation pass.
 
-        for key, value in extra_fields.items():
-            self_dict_model[key] = value
+        Args:
+            items:
+                Models to migrate.
+            model:
+                Heir BaseModel object.
+            match_keys:
+                Same as ``match_keys`` of :meth:`.migrate`.
+            extra_fields:
+                Extra fields of every item, in order of ``items``.
 
-        adapter = TypeAdapter(model)
-        if not random_fill:
-            return adapter.validate_python(self_dict_model)
+        Examples:
+            Every country gets own list of cities::
 
-        class Factory(ModelFactory[model]): ...
+                >>> countries = await country_repository.read_all()
+                >>> models.Country.migrate_many(
+                ...     countries,
+                ...     models.CountryWithCities,
+                ...     extra_fields=[{"cities": []} for _ in countries],
+                ... )
 
-        return Factory.build(factory_use_construct=True, **self_dict_model)
+        Returns:
+            List of pydantic models parsed from ``model``.
+        """
+
+        if extra_fields is None:
+            extra_fields = [None] * len(items)
+        elif len(extra_fields) != len(items):
+            raise ValueError("extra_fields must have one item for every model.")
+
+        return _adapter(list[model]).validate_python(
+            [
+                item.__migrate_values(
+                    model,
+                    match_keys=match_keys,
+                    extra_fields=extra,
+                )
+                for item, extra in zip(items, extra_fields)
+            ],
+        )
+
+    def __migrate_values(
+        self,
+        model: type[BaseModel],
+        dump_all: bool = False,
+        match_keys: dict[str, str] | None = None,
+        extra_fields: dict[str, typing.Any] | None = None,
+    ) -> dict[str, typing.Any]:
+        """Values of the model for validation by ``model``.
+
+        Only fields accepted by ``model`` are dumped, see :func:`_migrate_plan`.
+
+        Args:
+            model: Heir BaseModel object.
+            dump_all: Dump all fields regardless of the plan.
+            match_keys: Same as ``match_keys`` of :meth:`.migrate`.
+            extra_fields: Same as ``extra_fields`` of :meth:`.migrate`.
+
+        Returns:
+            Dict object with revealed secrets.
+        """
+
+        include = None if dump_all else _migrate_plan(type(self), model)
+        if include is not None and match_keys:
+            include = include | set(match_keys.values())
+        self_dict_model = self.to_dict(show_secrets=True, include=include)
+
+        for key, value in (match_keys or {}).items():
+            self_dict_model[key] = self_dict_model.pop(value)
+
+        for key, value in (extra_fields or {}).items():
+            self_dict_model[key] = value
+
+        return self_dict_model
 
     @classmethod
     def factory(cls):
@@ -371,3 +378,181 @@ class BaseModel(pydantic.BaseModel):
                 return providers_map
 
         return Factory
+
+
+class ReadModel(BaseModel):
+    """Base model for responses and query results.
+
+    Instances are validated once, when they are read from the storage, and
+    never changed, so the read tier skips the per-instance costs of
+    :class:`.BaseModel`: assignment validation, whitespace stripping and
+    coercion of numbers to str. Instances are frozen; they are hashable
+    only while every field value is hashable, so models with list fields
+    such as :class:`.CountryWithCities` are not.
+
+    Examples:
+        Mix the tier into the output model, commands keep the mutable base::
+
+            >>> class City(_City, ReadModel):
+            ...     city_id: PositiveInt = CityFields.city_id
+            >>> class CreateCityCommand(_City): ...
+    """
+
+    model_config = ConfigDict(
+        frozen=True,
+        validate_assignment=False,
+        str_strip_whitespace=False,
+        coerce_numbers_to_str=False,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _adapter(tp: Any) -> TypeAdapter:
+    """Cached validator of the type."""
+
+    return TypeAdapter(tp)
+
+
+@functools.lru_cache(maxsize=1024)
+def _migrate_plan(
+    source: type[BaseModel],
+    target: type[BaseModel],
+) -> Optional[frozenset[str]]:
+    """Fields of ``source`` which are accepted by ``target``.
+
+    Other fields are ignored by validation of ``target``, so they are not
+    worth dumping.
+
+    Args:
+        source: Model to migrate from.
+        target: Model to migrate to.
+
+    Returns:
+        Names of fields to dump or ``None`` if all fields must be dumped,
+        because ``target`` does not ignore extra fields or ``source`` has
+        extra fields out of the plan.
+    """
+
+    if (
+        not issubclass(target, pydantic.BaseModel)
+        or target.model_config.get("extra", "ignore") != "ignore"
+        or source.model_config.get("extra") == "allow"
+    ):
+        return None
+
+    accepted = set()
+    for name, field in target.model_fields.items():
+        accepted.add(name)
+        if isinstance(field.alias, str):
+            accepted.add(field.alias)
+        if isinstance(field.validation_alias, str):
+            accepted.add(field.validation_alias)
+    return frozenset(
+        name
+        for name in (*source.model_fields, *source.model_computed_fields)
+        if name in accepted
+    )
+
+
+def _cast_value(v: Any, show_secrets: bool) -> Any:
+    """Cast value for dict object.
+
+    Caster is resolved once per type of the value, so the hot path is a
+    single dict lookup instead of the ``isinstance`` chain.
+
+    Args:
+        v: Any value.
+        show_secrets: If True, then the secret will be revealed.
+    """
+
+    try:
+        caster = _CASTERS[type(v)]
+    except KeyError:
+        caster = _CASTERS[type(v)] = _resolve_caster(type(v))
+    return v if caster is None else caster(v, show_secrets)
+
+
+def _cast_mapping(v: dict[Any, Any], show_secrets: bool) -> dict[Any, Any]:
+    """Cast values of the mapping, empty mapping is returned as is."""
+
+    if not v:
+        return v
+    return {key: _cast_value(value, show_secrets) for key, value in v.items()}
+
+
+def _cast_sequence(v: list | tuple, show_secrets: bool) -> list:
+    """Cast items of list or tuple to list."""
+
+    return [_cast_value(item, show_secrets) for item in v]
+
+
+def _cast_secret_bytes(v: pydantic.SecretBytes, show_secrets: bool) -> str:
+    """Cast secret bytes to str, masked unless ``show_secrets``."""
+
+    return v.get_secret_value().decode() if show_secrets else str(v)
+
+
+def _cast_secret_str(v: pydantic.SecretStr, show_secrets: bool) -> str:
+    """Cast secret str to str, masked unless ``show_secrets``."""
+
+    return v.get_secret_value() if show_secrets else str(v)
+
+
+def _cast_str(v: UUID | Decimal, _: bool) -> str:
+    """Cast value to str."""
+
+    return str(v)
+
+
+def _cast_datetime(v: datetime, _: bool) -> str:
+    """Cast datetime to str."""
+
+    return v.strftime("%Y-%m-%d %H:%M:%S")
+
+
+def _cast_date(v: date, _: bool) -> str:
+    """Cast date to str."""
+
+    return v.strftime("%Y-%m-%d")
+
+
+def _cast_time(v: time, _: bool) -> str:
+    """Cast time to str."""
+
+    return v.strftime("%H:%M:%S")
+
+
+def _resolve_caster(tp: type) -> Optional[_Caster]:
+    """Choose caster of the value type.
+
+    Order of checks matters for subclasses, e.g. ``datetime`` is a subclass
+    of ``date``.
+
+    Args:
+        tp: Type of the value.
+
+    Returns:
+        Caster of the type or ``None`` if the value is kept as is.
+    """
+
+    if issubclass(tp, (list, tuple)):
+        return _cast_sequence
+    if issubclass(tp, pydantic.SecretBytes):
+        return _cast_secret_bytes
+    if issubclass(tp, pydantic.SecretStr):
+        return _cast_secret_str
+    if issubclass(tp, dict):
+        return _cast_mapping
+    if issubclass(tp, (UUID, Decimal)):
+        return _cast_str
+    if issubclass(tp, datetime):
+        return _cast_datetime
+    if issubclass(tp, date):
+        return _cast_date
+    if issubclass(tp, time):
+        return _cast_time
+    return None
+
+
+#: Casters of value types met by :meth:`BaseModel.to_dict`.
+_CASTERS: dict[type, Optional[_Caster]] = {}
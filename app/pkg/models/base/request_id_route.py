@@ -6,6 +6,7 @@ from uuid import UUID, uuid4
 from starlette.requests import Request
 from starlette.responses import Response
 
+from app.pkg.models.base.json_response import serialize_endpoint
 from app.pkg.models.base.logger_api_route import LoggerRoute
 
 
@@ -15,6 +16,9 @@ class RequestIDRoute(LoggerRoute):
     Extends the LoggerRoute to add request IDs to the request body for write
     methods (`POST`, `PUT`, `PATCH`) and to include the request ID in the response
     headers for tracing purposes.
+
+    Endpoints marked with :func:`.direct_response` return the response model
+    serialized straight to bytes, see :mod:`.json_response`.
     """
 
     def get_route_handler(self) -> Callable:
@@ -23,6 +27,7 @@ class RequestIDRoute(LoggerRoute):
         Returns:
             Callable: The customized route handler with request ID logic.
         """
+        self.__serialize_directly()
         original_route_handler = super().get_route_handler()
 
         async def custom_route_handler(request: Request) -> Response:
@@ -43,3 +48,26 @@ class RequestIDRoute(LoggerRoute):
             return response
 
         return custom_route_handler
+
+    def __serialize_directly(self) -> None:
+        """Replace the endpoint call of the marked route with the one that
+        returns serialized response."""
+        call = self.dependant.call
+        if (
+            not getattr(self.endpoint, "__direct_response__", False)
+            or self.response_model is None
+            or getattr(call, "__serialized__", False)
+        ):
+            return
+
+        self.dependant.call = serialize_endpoint(
+            call,
+            self.response_model,
+            status_code=self.status_code or 200,
+            include=self.response_model_include,
+            exclude=self.response_model_exclude,
+            by_alias=self.response_model_by_alias,
+            exclude_unset=self.response_model_exclude_unset,
+            exclude_defaults=self.response_model_exclude_defaults,
+            exclude_none=self.response_model_exclude_none,
+        )
@@ -3,6 +3,9 @@ from app.pkg.models.base import BaseEnum
 
 __all__ = [
     "EnvironmentEnum",
+    "TransportEnum",
+    "OverflowEnum",
+    "ExchangeTypeEnum",
 ]
 
 
@@ -11,3 +14,29 @@ class EnvironmentEnum(BaseEnum):
 
     DEV = "dev"
     PROD = "prod"
+
+
+class TransportEnum(str, BaseEnum):
+    """Enum for message transport of the queue."""
+
+    RABBITMQ = "rabbitmq"
+    REDIS = "redis"
+
+
+class OverflowEnum(str, BaseEnum):
+    """Enum for behavior of the full publish buffer."""
+
+    #: Wait until the buffer has free space.
+    BLOCK = "block"
+    #: Respond with ``429 Too Many Requests``.
+    REJECT = "reject"
+    #: Write the message to the redis stream, it is replayed later.
+    SPILL = "spill"
+
+
+class ExchangeTypeEnum(str, BaseEnum):
+    """Enum for type of rabbitmq exchange."""
+
+    DIRECT = "direct"
+    TOPIC = "topic"
+    FANOUT = "fanout"
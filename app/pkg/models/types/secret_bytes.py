@@ -14,7 +14,13 @@ from pydantic.v1.validators import bytes_validator
 
 class EncryptedSecretBytes(SecretBytes):
     """Model for verify bytes range [6;100] and crypt than by bcrypt
-    algorithm."""
+    algorithm.
+
+    Validation keeps the plain value, bcrypt blocks for tens of milliseconds
+    and must not run on the event loop. Hash the value with :meth:`.encrypt`
+    right before it is stored, it runs in the pool of
+    :data:`.password_hasher`.
+    """
 
     min_length = 6
     max_length = 100
@@ -22,6 +28,23 @@ class EncryptedSecretBytes(SecretBytes):
     def __repr__(self) -> str:
         return f"EncryptedSecretBytes(b'{self}')"
 
+    async def encrypt(self) -> bytes:
+        """bcrypt hash of the value computed off the event loop."""
+        # Hasher depends on settings, which import models, so import lazily.
+        from app.pkg.async_helpers.password_hasher import password_hasher
+
+        return await password_hasher.hash(self.get_secret_value())
+
+    async def verify(self, hashed: bytes) -> bool:
+        """Check the value against bcrypt hash off the event loop.
+
+        Args:
+            hashed: Hash made by :meth:`.encrypt`.
+        """
+        from app.pkg.async_helpers.password_hasher import password_hasher
+
+        return await password_hasher.verify(self.get_secret_value(), hashed)
+
     @classmethod
     def validate(cls, value: Any) -> "EncryptedSecretBytes":
         if isinstance(value, cls):
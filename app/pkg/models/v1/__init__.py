@@ -1,6 +1,13 @@
 """Module to import all models in the v1 version of the application."""
 
 from app.pkg.models.v1.app.bid import *  # noqa
+from app.pkg.models.v1.app.bulkhead import *  # noqa
+from app.pkg.models.v1.app.circuit_breaker import *  # noqa
 from app.pkg.models.v1.app.city import *  # noqa
 from app.pkg.models.v1.app.consumer import *  # noqa
+from app.pkg.models.v1.app.consumer_metrics import *  # noqa
 from app.pkg.models.v1.app.country import *  # noqa
+from app.pkg.models.v1.app.idempotency import *  # noqa
+from app.pkg.models.v1.app.outbox import *  # noqa
+from app.pkg.models.v1.app.publish_buffer import *  # noqa
+from app.pkg.models.v1.app.topology import *  # noqa
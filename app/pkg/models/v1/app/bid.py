@@ -7,7 +7,9 @@ from app.pkg.models.base import BaseModel
 
 __all__ = [
     "Bid",
+    "BidStatus",
     "CreateBidCommand",
+    "ReadBidStatusQuery",
 ]
 
 
@@ -23,6 +25,10 @@ class BidFields:
         examples=["bid_name"],
         min_length=1,
     )
+    status: str = Field(
+        description="Status of the bid reported by the worker.",
+        examples=["accepted"],
+    )
 
 
 class _Bid(BaseBid):
@@ -32,5 +38,13 @@ class _Bid(BaseBid):
 class Bid(_Bid): ...
 
 
+class BidStatus(_Bid):
+    status: str = BidFields.status
+
+
 # Commands.
 class CreateBidCommand(_Bid): ...
+
+
+# Queries.
+class ReadBidStatusQuery(_Bid): ...
@@ -0,0 +1,51 @@
+"""Models of bulkhead object."""
+
+from pydantic.fields import Field
+from pydantic.types import NonNegativeInt, PositiveInt, StrictStr
+
+from app.pkg.models.base import BaseModel
+
+__all__ = ["BulkheadState"]
+
+
+class BaseBulkhead(BaseModel):
+    """Base model for bulkhead."""
+
+
+class BulkheadFields:
+    """Bulkhead fields."""
+
+    name: StrictStr = Field(
+        description="Name of the protected client.",
+        examples=["CentrifugoClient"],
+    )
+    max_concurrent: PositiveInt = Field(
+        description="Max count of requests of the client running at once.",
+        examples=[50],
+    )
+    max_queue: NonNegativeInt = Field(
+        description="Max count of requests waiting for a free slot.",
+        examples=[100],
+    )
+    in_flight: NonNegativeInt = Field(
+        description="Count of requests running now.",
+        examples=[12],
+    )
+    waiting: NonNegativeInt = Field(
+        description="Count of requests waiting for a free slot now.",
+        examples=[0],
+    )
+    rejected: NonNegativeInt = Field(
+        description="Count of requests rejected because the queue was full or "
+        "the wait timed out.",
+        examples=[3],
+    )
+
+
+class BulkheadState(BaseBulkhead):
+    name: StrictStr = BulkheadFields.name
+    max_concurrent: PositiveInt = BulkheadFields.max_concurrent
+    max_queue: NonNegativeInt = BulkheadFields.max_queue
+    in_flight: NonNegativeInt = BulkheadFields.in_flight
+    waiting: NonNegativeInt = BulkheadFields.waiting
+    rejected: NonNegativeInt = BulkheadFields.rejected
@@ -0,0 +1,54 @@
+"""Models of circuit breaker object."""
+
+from pydantic.fields import Field
+from pydantic.types import NonNegativeInt, StrictStr
+
+from app.pkg.models.base import BaseEnum, BaseModel
+
+__all__ = [
+    "CircuitStateEnum",
+    "CircuitBreakerState",
+]
+
+
+class CircuitStateEnum(str, BaseEnum):
+    """State of the circuit breaker."""
+
+    #: Calls pass, failures are counted.
+    CLOSED = "closed"
+    #: Calls fail fast.
+    OPEN = "open"
+    #: Limited count of trial calls pass.
+    HALF_OPEN = "half_open"
+
+
+class BaseCircuitBreaker(BaseModel):
+    """Base model for circuit breaker."""
+
+
+class CircuitBreakerFields:
+    """Circuit breaker fields."""
+
+    name: StrictStr = Field(
+        description="Name of the protected client.",
+        examples=["CentrifugoClient"],
+    )
+    state: CircuitStateEnum = Field(
+        description="State of the breaker.",
+        examples=[CircuitStateEnum.CLOSED],
+    )
+    calls: NonNegativeInt = Field(
+        description="Count of calls in the rolling window.",
+        examples=[20],
+    )
+    failures: NonNegativeInt = Field(
+        description="Count of failed calls in the rolling window.",
+        examples=[3],
+    )
+
+
+class CircuitBreakerState(BaseCircuitBreaker):
+    name: StrictStr = CircuitBreakerFields.name
+    state: CircuitStateEnum = CircuitBreakerFields.state
+    calls: NonNegativeInt = CircuitBreakerFields.calls
+    failures: NonNegativeInt = CircuitBreakerFields.failures
@@ -4,7 +4,7 @@ from pydantic import model_validator
 from pydantic.fields import Field
 from pydantic.types import PositiveInt, StrictStr
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.base import BaseModel, ReadModel
 from app.pkg.models.base.optional_field import OptionalField
 
 __all__ = [
@@ -57,7 +57,7 @@ class _City(BaseCity):
     country_code: StrictStr = CityFields.country_code
 
 
-class City(_City):
+class City(_City, ReadModel):
     city_id: PositiveInt = CityFields.city_id
 
 
@@ -1,10 +1,12 @@
 """Models of consumer object."""
 
-from typing import Callable, Type
+from typing import Callable, Optional, Type
 
 from pydantic.fields import Field
+from pydantic.types import PositiveInt
 
 from app.pkg.models.base import BaseModel
+from app.pkg.models.base.settings_enum import TransportEnum
 
 __all__ = [
     "ConsumerQueueData",
@@ -24,9 +26,62 @@ class ConsumerFields:
         title="Incoming model.",
         examples=["CreateMailCommand"],
     )
+    queue_transport: TransportEnum = Field(
+        default=TransportEnum.RABBITMQ,
+        title="Transport of the queue.",
+        examples=[TransportEnum.RABBITMQ],
+    )
+    prefetch_count: PositiveInt = Field(
+        default=1,
+        title="Count of unacknowledged messages delivered to the consumer.",
+        examples=[32],
+    )
+    concurrency: PositiveInt = Field(
+        default=1,
+        title="Count of callbacks running at the same time.",
+        examples=[32],
+    )
+    max_attempts: PositiveInt = Field(
+        default=5,
+        title="Count of attempts before the message goes to dead-letter queue.",
+        examples=[5],
+    )
+    retry_delay_ms: PositiveInt = Field(
+        default=1000,
+        title="Delay in milliseconds before the first retry, doubled per retry.",
+        examples=[1000],
+    )
+    queue_batch_callback: Optional[Callable] = Field(
+        default=None,
+        title="Callback function that gets list of messages.",
+        examples=["send_mails"],
+    )
+    batch_size: Optional[PositiveInt] = Field(
+        default=None,
+        title="Max count of messages in one batch. Enables batch mode.",
+        examples=[100],
+    )
+    batch_timeout_ms: PositiveInt = Field(
+        default=100,
+        title="Max time in milliseconds to fill the batch, RabbitMQ only.",
+        examples=[100],
+    )
 
 
 class ConsumerQueueData(BaseConsumer):
     queue_name: str = ConsumerFields.queue_name
     queue_callback: Callable = ConsumerFields.queue_callback
     queue_incoming_model: Type[BaseModel] = ConsumerFields.queue_incoming_model
+    queue_transport: TransportEnum = ConsumerFields.queue_transport
+    prefetch_count: PositiveInt = ConsumerFields.prefetch_count
+    concurrency: PositiveInt = ConsumerFields.concurrency
+    max_attempts: PositiveInt = ConsumerFields.max_attempts
+    retry_delay_ms: PositiveInt = ConsumerFields.retry_delay_ms
+    queue_batch_callback: Optional[Callable] = ConsumerFields.queue_batch_callback
+    batch_size: Optional[PositiveInt] = ConsumerFields.batch_size
+    batch_timeout_ms: PositiveInt = ConsumerFields.batch_timeout_ms
+
+    @property
+    def is_batch(self) -> bool:
+        """Messages are passed to ``queue_batch_callback`` in batches."""
+        return self.batch_size is not None and self.queue_batch_callback is not None
@@ -0,0 +1,91 @@
+"""Models of consumer metrics object."""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic.fields import Field
+from pydantic.types import NonNegativeFloat, NonNegativeInt, PositiveInt, StrictStr
+
+from app.pkg.models.base import BaseModel
+
+__all__ = [
+    "ConsumerQueueMetrics",
+    "ConsumerProcessMetrics",
+]
+
+
+class BaseConsumerMetrics(BaseModel):
+    """Base model for consumer metrics."""
+
+
+class ConsumerMetricsFields:
+    """Consumer metrics fields."""
+
+    queue_name: StrictStr = Field(description="Name of the queue.", examples=["mail"])
+    consumed: NonNegativeInt = Field(
+        description="Count of delivered messages.",
+        examples=[1000],
+    )
+    acked: NonNegativeInt = Field(
+        description="Count of acknowledged messages.",
+        examples=[990],
+    )
+    nacked: NonNegativeInt = Field(
+        description="Count of messages moved to retry or dead-letter queues.",
+        examples=[10],
+    )
+    in_flight: NonNegativeInt = Field(
+        description="Count of callbacks running now.",
+        examples=[4],
+    )
+    concurrency: PositiveInt = Field(
+        description="Max count of callbacks running at the same time.",
+        examples=[32],
+    )
+    depth: Optional[NonNegativeInt] = Field(
+        default=None,
+        description="Count of messages waiting in the queue. ``None`` if the "
+        "broker was not available.",
+        examples=[120],
+    )
+    processing_time_sum_ms: NonNegativeFloat = Field(
+        description="Total processing time of callbacks in milliseconds.",
+        examples=[15000.5],
+    )
+    processing_time_buckets: dict[str, NonNegativeInt] = Field(
+        description="Cumulative count of callbacks finished within the upper "
+        "bound in milliseconds.",
+        examples=[{"10": 800, "100": 990, "+Inf": 1000}],
+    )
+    process: StrictStr = Field(
+        description="Host and pid of the consumer process.",
+        examples=["worker-1-42"],
+    )
+    reported_at: datetime = Field(
+        description="Time of the report.",
+        examples=["2024-01-01T00:00:00Z"],
+    )
+
+
+class ConsumerQueueMetrics(BaseConsumerMetrics):
+    queue_name: StrictStr = ConsumerMetricsFields.queue_name
+    consumed: NonNegativeInt = ConsumerMetricsFields.consumed
+    acked: NonNegativeInt = ConsumerMetricsFields.acked
+    nacked: NonNegativeInt = ConsumerMetricsFields.nacked
+    in_flight: NonNegativeInt = ConsumerMetricsFields.in_flight
+    concurrency: PositiveInt = ConsumerMetricsFields.concurrency
+    depth: Optional[NonNegativeInt] = ConsumerMetricsFields.depth
+    processing_time_sum_ms: NonNegativeFloat = (
+        ConsumerMetricsFields.processing_time_sum_ms
+    )
+    processing_time_buckets: dict[str, NonNegativeInt] = (
+        ConsumerMetricsFields.processing_time_buckets
+    )
+
+
+class ConsumerProcessMetrics(BaseConsumerMetrics):
+    process: StrictStr = ConsumerMetricsFields.process
+    reported_at: datetime = ConsumerMetricsFields.reported_at
+    queues: List[ConsumerQueueMetrics] = Field(
+        description="Metrics of consumed queues.",
+    )
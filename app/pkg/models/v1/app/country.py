@@ -5,7 +5,7 @@ import typing
 from pydantic.fields import Field
 from pydantic.types import PositiveInt
 
-from app.pkg.models.base import BaseModel
+from app.pkg.models.base import BaseModel, ReadModel
 from app.pkg.models.v1.app.city import City
 
 __all__ = [
@@ -47,7 +47,7 @@ class _Country(BaseCountry):
     country_code: str = CountryFields.country_code
 
 
-class Country(_Country):
+class Country(_Country, ReadModel):
     country_id: PositiveInt = CountryFields.country_id
 
 
@@ -72,4 +72,5 @@ class CountryWithCities(Country):
     cities: typing.List[City] = CountryFields.cities
 
 
-class CreateCountyChangelogCommand(Country): ...
+class CreateCountyChangelogCommand(_Country):
+    country_id: PositiveInt = CountryFields.country_id
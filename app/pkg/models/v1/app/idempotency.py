@@ -0,0 +1,51 @@
+"""Models of idempotent request object."""
+
+from pydantic.fields import Field
+from pydantic.types import NonNegativeInt
+
+from app.pkg.models.base import BaseModel
+from app.pkg.models.base.optional_field import OptionalField
+
+__all__ = [
+    "IdempotentResponse",
+]
+
+
+class BaseIdempotency(BaseModel):
+    """Base model for idempotent request."""
+
+
+class IdempotencyFields:
+    """Idempotent request fields."""
+
+    fingerprint: str = Field(
+        description="SHA-256 of the request body bound to the idempotency key.",
+        examples=["9f86d081884c7d659a2feaa0c55ad015a3bf4f1b2b0b822cd15d6c15b0f00a08"],
+    )
+    completed: bool = Field(
+        description="Is the first request with this key already finished.",
+        examples=[True],
+    )
+    status_code: NonNegativeInt = Field(
+        description="Status code of the stored response.",
+        examples=[201],
+    )
+    body: str = Field(
+        description="Base64 encoded body of the stored response.",
+        examples=["eyJjaXR5X2lkIjogMX0="],
+    )
+    headers: dict[str, str] = Field(
+        description="Headers of the stored response.",
+        examples=[{"content-type": "application/json"}],
+    )
+
+
+class IdempotentResponse(BaseIdempotency):
+    fingerprint: str = IdempotencyFields.fingerprint
+    completed: bool = OptionalField(IdempotencyFields.completed, default=False)
+    status_code: NonNegativeInt = OptionalField(
+        IdempotencyFields.status_code,
+        default=0,
+    )
+    body: str = OptionalField(IdempotencyFields.body, default="")
+    headers: dict[str, str] = OptionalField(IdempotencyFields.headers, default={})
@@ -0,0 +1,41 @@
+"""Models of outbox event object."""
+
+from typing import Any
+
+from pydantic.fields import Field
+from pydantic.types import PositiveInt, StrictStr
+
+from app.pkg.models.base import BaseModel
+
+__all__ = [
+    "OutboxEvent",
+]
+
+
+class BaseOutbox(BaseModel):
+    """Base model for outbox event."""
+
+
+class OutboxFields:
+    """Outbox event fields."""
+
+    outbox_id: PositiveInt = Field(description="Internal outbox id.", examples=[1])
+    routing_key: StrictStr = Field(
+        description="Routing key of the event.",
+        examples=["entity_events"],
+    )
+    event_type: StrictStr = Field(
+        description="Type of the event.",
+        examples=["city.created"],
+    )
+    payload: dict[str, Any] = Field(
+        description="Body of the event.",
+        examples=[{"city_id": 1, "city_name": "Moscow"}],
+    )
+
+
+class OutboxEvent(BaseOutbox):
+    outbox_id: PositiveInt = OutboxFields.outbox_id
+    routing_key: StrictStr = OutboxFields.routing_key
+    event_type: StrictStr = OutboxFields.event_type
+    payload: dict[str, Any] = OutboxFields.payload
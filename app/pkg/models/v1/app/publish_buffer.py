@@ -0,0 +1,64 @@
+"""Models of publish buffer metrics object."""
+
+from pydantic.fields import Field
+from pydantic.types import NonNegativeInt, PositiveInt, StrictStr
+
+from app.pkg.models.base import BaseModel
+
+__all__ = [
+    "PublishBufferMetrics",
+]
+
+
+class BasePublishBuffer(BaseModel):
+    """Base model for publish buffer."""
+
+
+class PublishBufferFields:
+    """Publish buffer fields."""
+
+    name: StrictStr = Field(description="Name of the buffer.", examples=["bid"])
+    depth: NonNegativeInt = Field(
+        description="Count of messages waiting in the buffer.",
+        examples=[12],
+    )
+    max_size: PositiveInt = Field(
+        description="Max count of messages in the buffer.",
+        examples=[10000],
+    )
+    published: NonNegativeInt = Field(
+        description="Count of messages published by the drainer.",
+        examples=[1000],
+    )
+    failed: NonNegativeInt = Field(
+        description="Count of failed publish attempts of the drainer.",
+        examples=[0],
+    )
+    rejected: NonNegativeInt = Field(
+        description="Count of messages rejected because the buffer was full.",
+        examples=[0],
+    )
+    spilled: NonNegativeInt = Field(
+        description="Count of messages spilled to redis because the buffer was full.",
+        examples=[0],
+    )
+    replayed: NonNegativeInt = Field(
+        description="Count of spilled messages published from redis.",
+        examples=[0],
+    )
+    dropped: NonNegativeInt = Field(
+        description="Count of messages given up after max publish attempts.",
+        examples=[0],
+    )
+
+
+class PublishBufferMetrics(BasePublishBuffer):
+    name: StrictStr = PublishBufferFields.name
+    depth: NonNegativeInt = PublishBufferFields.depth
+    max_size: PositiveInt = PublishBufferFields.max_size
+    published: NonNegativeInt = PublishBufferFields.published
+    failed: NonNegativeInt = PublishBufferFields.failed
+    rejected: NonNegativeInt = PublishBufferFields.rejected
+    spilled: NonNegativeInt = PublishBufferFields.spilled
+    replayed: NonNegativeInt = PublishBufferFields.replayed
+    dropped: NonNegativeInt = PublishBufferFields.dropped
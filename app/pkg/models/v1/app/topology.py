@@ -0,0 +1,68 @@
+"""Models of rabbitmq topology object."""
+
+from typing import Any, List
+
+from pydantic.fields import Field
+from pydantic.types import StrictStr
+
+from app.pkg.models.base import BaseModel
+from app.pkg.models.base.settings_enum import ExchangeTypeEnum
+
+__all__ = [
+    "ExchangeDeclaration",
+    "QueueBinding",
+    "QueueDeclaration",
+]
+
+
+class BaseTopology(BaseModel):
+    """Base model for rabbitmq topology."""
+
+
+class TopologyFields:
+    """Rabbitmq topology fields."""
+
+    name: StrictStr = Field(description="Name of the entity.", examples=["bids"])
+    exchange_type: ExchangeTypeEnum = Field(
+        default=ExchangeTypeEnum.DIRECT,
+        description="Type of the exchange.",
+        examples=[ExchangeTypeEnum.DIRECT],
+    )
+    durable: bool = Field(
+        default=True,
+        description="Entity survives broker restart.",
+        examples=[True],
+    )
+    arguments: dict[str, Any] = Field(
+        default={},
+        description="Optional arguments of the declaration.",
+        examples=[{"x-max-length": 10000}],
+    )
+    exchange: StrictStr = Field(description="Name of the exchange.", examples=["bids"])
+    routing_key: StrictStr = Field(
+        description="Routing key of the binding.",
+        examples=["rabbit__channel"],
+    )
+    bindings: List["QueueBinding"] = Field(
+        default=[],
+        description="Bindings of the queue to exchanges.",
+    )
+
+
+class ExchangeDeclaration(BaseTopology):
+    name: StrictStr = TopologyFields.name
+    exchange_type: ExchangeTypeEnum = TopologyFields.exchange_type
+    durable: bool = TopologyFields.durable
+    arguments: dict[str, Any] = TopologyFields.arguments
+
+
+class QueueBinding(BaseTopology):
+    exchange: StrictStr = TopologyFields.exchange
+    routing_key: StrictStr = TopologyFields.routing_key
+
+
+class QueueDeclaration(BaseTopology):
+    name: StrictStr = TopologyFields.name
+    durable: bool = TopologyFields.durable
+    arguments: dict[str, Any] = TopologyFields.arguments
+    bindings: List[QueueBinding] = TopologyFields.bindings
@@ -10,6 +10,8 @@ __all__ = [
     "BaseExceptionFromClient",
     "BadRequestFromClient",
     "UnprocessableEntity",
+    "CircuitOpen",
+    "BulkheadFull",
 ]
 
 
@@ -33,3 +35,13 @@ class BadRequestFromClient(BaseAPIException):
 class UnprocessableEntity(BaseAPIException):
     message = "Unprocessable entity."
     status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class CircuitOpen(BaseAPIException):
+    message = "Service is not available now, requests to it are suspended."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+
+
+class BulkheadFull(BaseAPIException):
+    message = "Service is overloaded, request is rejected."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
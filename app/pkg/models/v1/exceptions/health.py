@@ -0,0 +1,12 @@
+"""Exceptions of health checks."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = ["ConsumersUnavailable"]
+
+
+class ConsumersUnavailable(BaseAPIException):
+    message = "No consumer process reported metrics recently."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -0,0 +1,17 @@
+"""Exceptions for requests with ``Idempotency-Key`` header."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = ["IdempotencyKeyReused", "IdempotentRequestInProgress"]
+
+
+class IdempotencyKeyReused(BaseAPIException):
+    message = "Idempotency-Key was already used with another request payload."
+    status_code = status.HTTP_422_UNPROCESSABLE_ENTITY
+
+
+class IdempotentRequestInProgress(BaseAPIException):
+    message = "Request with this Idempotency-Key is still in progress."
+    status_code = status.HTTP_409_CONFLICT
@@ -0,0 +1,12 @@
+"""Exceptions of the bounded publish buffer."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = ["PublishBufferFull"]
+
+
+class PublishBufferFull(BaseAPIException):
+    message = "Message broker is overloaded, try again later."
+    status_code = status.HTTP_429_TOO_MANY_REQUESTS
@@ -0,0 +1,17 @@
+"""Exceptions of rabbitmq RPC calls."""
+
+from starlette import status
+
+from app.pkg.models.base import BaseAPIException
+
+__all__ = ["RPCTimeout", "RPCUnroutable"]
+
+
+class RPCTimeout(BaseAPIException):
+    message = "Worker did not reply in time."
+    status_code = status.HTTP_504_GATEWAY_TIMEOUT
+
+
+class RPCUnroutable(BaseAPIException):
+    message = "No queue consumes requests of the call."
+    status_code = status.HTTP_503_SERVICE_UNAVAILABLE
@@ -9,16 +9,22 @@ from dotenv import find_dotenv
 from pydantic import (
     AmqpDsn,
     ClickHouseDsn,
+    Field,
     HttpUrl,
     PostgresDsn,
     RedisDsn,
     computed_field,
     model_validator,
 )
-from pydantic.types import PositiveInt, SecretStr
+from pydantic.types import NonNegativeInt, PositiveFloat, PositiveInt, SecretStr
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
-from app.pkg.models.base.settings_enum import EnvironmentEnum
+from app.pkg.models.base.settings_enum import (
+    EnvironmentEnum,
+    ExchangeTypeEnum,
+    OverflowEnum,
+    TransportEnum,
+)
 from app.pkg.models.core.logger import LoggerLevel
 
 __all__ = ["Settings", "get_settings"]
@@ -191,8 +197,84 @@ class RabbitMQ(_Settings):
     #: Connection DSN schema
     SCHEMA: str = "amqp"
 
+    #: PositiveInt: Max count of connections in the pool to rabbitmq for
+    #  short-lived operations. Publisher channels and consumers use own
+    #  dedicated connections, which are not counted here.
+    MAX_CONNECTION: PositiveInt = 2
+    #: PositiveInt: Max count of publisher channels on the publisher
+    #  connection to rabbitmq.
+    MAX_CHANNEL: PositiveInt = 16
+    #: PositiveInt: Max count of messages of one batch waiting for publisher
+    #  confirms at the same time.
+    PUBLISH_CONFIRM_WINDOW: PositiveInt = 256
+    #: PositiveInt: Min size in bytes of the message body to compress with
+    #  deflate. ``None`` disables compression.
+    PUBLISH_COMPRESS_THRESHOLD: PositiveInt | None = 65536
+    #: str: Exchange of bid queues, declared at startup. Queues are bound by
+    #  their names. Empty name publishes to the default exchange.
+    EXCHANGE_NAME: str = "bids"
+    #: ExchangeTypeEnum: Type of ``EXCHANGE_NAME``.
+    EXCHANGE_TYPE: ExchangeTypeEnum = ExchangeTypeEnum.DIRECT
+    #: PositiveInt: Time in milliseconds to wait for the reply of RPC call.
+    RPC_TIMEOUT_MS: PositiveInt = 5000
+    #: PositiveInt: Max count of bids buffered in memory before publishing.
+    PUBLISH_BUFFER_SIZE: PositiveInt = 10000
+    #: OverflowEnum: Behavior of the full publish buffer: ``block``, ``reject``
+    #  with ``429`` or ``spill`` to redis stream.
+    PUBLISH_BUFFER_OVERFLOW: OverflowEnum = OverflowEnum.BLOCK
+    #: PositiveInt: Max count of buffered bids published at once.
+    PUBLISH_BUFFER_BATCH_SIZE: PositiveInt = 256
+    #: PositiveInt: Delay in milliseconds before the failed publish of the
+    #  buffer is retried.
+    PUBLISH_BUFFER_RETRY_DELAY_MS: PositiveInt = 500
+    #: PositiveInt: Count of publish attempts of the buffered batch before it
+    #  is spilled to redis stream. Spilled messages are moved to the
+    #  ``.spill.dlq`` stream after as many replays.
+    PUBLISH_BUFFER_MAX_ATTEMPTS: PositiveInt = 5
+
     BID_QUEUE_NAME: str
     BID_QUEUE_NAME_SECOND: str
+    #: str: Queue of RPC requests for the status of the bid.
+    BID_STATUS_QUEUE_NAME: str = "bid_status"
+
+    #: PositiveInt: Prefetch count of ``BID_QUEUE_NAME`` consumer.
+    BID_QUEUE_PREFETCH_COUNT: PositiveInt = 32
+    #: PositiveInt: Max count of ``BID_QUEUE_NAME`` callbacks running at once.
+    BID_QUEUE_CONCURRENCY: PositiveInt = 32
+    #: PositiveInt: Max count of bids passed to the batch callback of
+    #  ``BID_QUEUE_NAME`` consumer. ``None`` passes bids one by one.
+    BID_QUEUE_BATCH_SIZE: PositiveInt | None = None
+    #: PositiveInt: Max time in milliseconds to wait for the batch to fill.
+    #  Applies to the ``rabbitmq`` transport only, a batch of redis stream is
+    #  the entries returned by one ``XREADGROUP``.
+    BID_QUEUE_BATCH_TIMEOUT_MS: PositiveInt = 100
+    #: PositiveInt: Prefetch count of ``BID_QUEUE_NAME_SECOND`` consumer.
+    BID_QUEUE_SECOND_PREFETCH_COUNT: PositiveInt = 64
+    #: PositiveInt: Max count of ``BID_QUEUE_NAME_SECOND`` callbacks running at
+    #  once.
+    BID_QUEUE_SECOND_CONCURRENCY: PositiveInt = 64
+
+    #: PositiveInt: Count of attempts of the message before it goes to the
+    #  dead-letter queue.
+    RETRY_MAX_ATTEMPTS: PositiveInt = 5
+    #: PositiveInt: Delay in milliseconds before the first retry, doubled for
+    #  every next retry.
+    RETRY_DELAY_MS: PositiveInt = 1000
+    #: str: Queue of entity events relayed from the outbox table.
+    OUTBOX_ROUTING_KEY: str = "entity_events"
+    #: PositiveInt: Max count of outbox rows relayed in one batch.
+    OUTBOX_BATCH_SIZE: PositiveInt = 100
+    #: PositiveInt: Delay in milliseconds between polls of the empty outbox.
+    OUTBOX_POLL_INTERVAL_MS: PositiveInt = 500
+    #: PositiveInt: Time in milliseconds outbox rows claimed by a relay are
+    #  hidden from other relays. Rows left by a dead relay are published again
+    #  after it.
+    OUTBOX_LEASE_MS: PositiveInt = 30000
+
+    #: TransportEnum: Transport of ``BID_QUEUE_NAME`` queue.
+    BID_QUEUE_TRANSPORT: TransportEnum = TransportEnum.RABBITMQ
+    #: TransportEnum: Transport of ``BID_QUEUE_NAME_SECOND`` queue.
+    BID_QUEUE_SECOND_TRANSPORT: TransportEnum = TransportEnum.RABBITMQ
 
     #: str: Concatenation all settings for Resource in one string. (DSN)
     #  Builds in `root_validator` method.
@@ -222,6 +304,19 @@ class Redis(_Settings):
     DB: int = 0
     DSN: str | None = None
 
+    # --- STREAMS SETTINGS ---
+    #: PositiveInt: Approximate max length of the stream (``XADD MAXLEN ~``).
+    STREAM_MAXLEN: PositiveInt = 100000
+    #: str: Consumer group of the stream consumers.
+    STREAM_GROUP: str = "workers"
+    #: PositiveInt: Max count of messages in one ``XREADGROUP`` batch.
+    STREAM_BATCH_SIZE: PositiveInt = 100
+    #: PositiveInt: Time in milliseconds to block on empty stream.
+    STREAM_BLOCK_MS: PositiveInt = 1000
+    #: PositiveInt: Idle time in milliseconds after which pending messages of
+    #  another consumer are claimed with ``XAUTOCLAIM``.
+    STREAM_CLAIM_IDLE_MS: PositiveInt = 60000
+
     @model_validator(mode="before")
     @classmethod
     def build_dsn(cls, values: dict) -> dict:
@@ -250,6 +345,20 @@ class Redis(_Settings):
         return values
 
 
+class Workers(_Settings):
+    """Settings of the standalone consumer processes."""
+
+    #: PositiveInt: Count of consumer processes. Default: count of CPUs.
+    PROCESSES: PositiveInt | None = None
+    #: PositiveInt: Time in seconds to finish in-flight messages on shutdown.
+    DRAIN_TIMEOUT: PositiveInt = 30
+    #: PositiveInt: Time in seconds before restart of the crashed process.
+    RESTART_DELAY: PositiveInt = 1
+    #: PositiveInt: Time in seconds between metrics reports of the process.
+    #  Report expires after three missed intervals.
+    METRICS_INTERVAL: PositiveInt = 5
+
+
 class Logging(_Settings):
     """Logging settings."""
 
@@ -274,6 +383,36 @@ class APIServer(_Settings):
 
     DEBUG_MODE: bool = False
 
+    #: bool: Run queue consumers inside the API process. Disable it when
+    #  consumers run in ``python -m app.workers``.
+    RUN_CONSUMERS: bool = True
+
+    # --- IDEMPOTENCY SETTINGS ---
+    #: PositiveInt: TTL in seconds of the stored response for ``Idempotency-Key``.
+    IDEMPOTENCY_KEY_TTL: PositiveInt = 86400
+    #: PositiveInt: TTL in seconds of the key while the first request is running.
+    IDEMPOTENCY_LOCK_TTL: PositiveInt = 60
+
+    # --- BATCH SETTINGS ---
+    #: PositiveInt: Max count of bids in one ``POST /bid/batch`` request.
+    BID_BATCH_MAX_SIZE: PositiveInt = 1000
+
+    # --- RESPONSE CACHE SETTINGS ---
+    #: PositiveInt: TTL in seconds of the cached response in redis.
+    RESPONSE_CACHE_TTL: PositiveInt = 60
+    #: PositiveInt: TTL in seconds of the cached response in memory of the process.
+    RESPONSE_CACHE_LOCAL_TTL: PositiveInt = 5
+    #: PositiveInt: Max count of cached responses in memory of the process.
+    RESPONSE_CACHE_LOCAL_MAX_SIZE: PositiveInt = 1024
+
+    # --- BCRYPT SETTINGS ---
+    #: PositiveInt: Cost factor of new bcrypt hashes.
+    BCRYPT_ROUNDS: PositiveInt = 12
+    #: PositiveInt: Max count of bcrypt hashes computed at once.
+    BCRYPT_CONCURRENCY: PositiveInt = 4
+    #: bool: Compute bcrypt hashes in a process pool instead of threads.
+    BCRYPT_USE_PROCESSES: bool = False
+
     # Now used only for logging level
     ENVIROMENT: EnvironmentEnum = EnvironmentEnum.DEV.value
 
@@ -368,12 +507,79 @@ class Centrifugo(_Settings):
         )
 
 
+class HTTPClient(_Settings):
+    """Settings of pooled HTTP clients of :class:`.BaseClient`."""
+
+    #: PositiveInt: Max count of connections of one client.
+    MAX_CONNECTIONS: PositiveInt = 100
+    #: PositiveInt: Max count of idle connections kept alive by one client.
+    MAX_KEEPALIVE_CONNECTIONS: PositiveInt = 20
+    #: PositiveFloat: Time in seconds an idle connection is kept alive.
+    KEEPALIVE_EXPIRY: PositiveFloat = 5.0
+    #: bool: Negotiate HTTP/2, requires ``httpx[http2]``.
+    HTTP2: bool = False
+    #: PositiveFloat: Time in seconds to establish a connection.
+    CONNECT_TIMEOUT: PositiveFloat = 5.0
+    #: PositiveFloat: Time in seconds to wait for a chunk of the response.
+    READ_TIMEOUT: PositiveFloat = 10.0
+    #: PositiveFloat: Time in seconds to send a chunk of the request.
+    WRITE_TIMEOUT: PositiveFloat = 10.0
+    #: PositiveFloat: Time in seconds to wait for a free connection of the pool.
+    POOL_TIMEOUT: PositiveFloat = 5.0
+
+    # --- RETRY SETTINGS ---
+    #: PositiveInt: Max count of attempts of one request.
+    RETRY_ATTEMPTS: PositiveInt = 3
+    #: PositiveInt: Delay in milliseconds before the second attempt, doubled
+    #: for every next one.
+    RETRY_BASE_DELAY_MS: PositiveInt = 100
+    #: PositiveInt: Max delay in milliseconds between attempts.
+    RETRY_MAX_DELAY_MS: PositiveInt = 2000
+
+    # --- CIRCUIT BREAKER SETTINGS ---
+    #: PositiveFloat: Share of failed calls in the window that opens the breaker.
+    BREAKER_FAILURE_RATIO: PositiveFloat = 0.5
+    #: PositiveInt: Min count of calls in the window to open the breaker.
+    BREAKER_MIN_CALLS: PositiveInt = 10
+    #: PositiveFloat: Length in seconds of the rolling window of calls.
+    BREAKER_WINDOW_SECONDS: PositiveFloat = 30.0
+    #: PositiveFloat: Time in seconds the open breaker rejects calls.
+    BREAKER_OPEN_SECONDS: PositiveFloat = 15.0
+    #: PositiveInt: Count of trial calls of the half-open breaker.
+    BREAKER_HALF_OPEN_CALLS: PositiveInt = 1
+
+    # --- HEDGING SETTINGS ---
+    #: PositiveFloat: Latency percentile of the path after which GET is hedged.
+    HEDGE_PERCENTILE: PositiveFloat = 0.95
+    #: PositiveFloat: Max share of requests of the client that are hedged.
+    HEDGE_BUDGET_RATIO: PositiveFloat = 0.05
+    #: PositiveInt: Min count of latency samples of the path to hedge it.
+    HEDGE_MIN_SAMPLES: PositiveInt = 20
+
+    # --- RESPONSE CACHE SETTINGS ---
+    #: PositiveInt: Max count of GET responses of the client kept in memory.
+    CACHE_MAX_SIZE: PositiveInt = 1024
+    #: PositiveInt: Time in seconds a stale response is kept for revalidation.
+    CACHE_RETENTION_SECONDS: PositiveInt = 3600
+
+    # --- BULKHEAD SETTINGS ---
+    #: PositiveInt: Max count of requests of one client running at once.
+    BULKHEAD_MAX_CONCURRENT: PositiveInt = 50
+    #: NonNegativeInt: Max count of requests waiting for a free slot.
+    BULKHEAD_MAX_QUEUE: NonNegativeInt = 100
+    #: PositiveFloat: Time in seconds a request waits for a free slot.
+    BULKHEAD_QUEUE_TIMEOUT: PositiveFloat = 1.0
+
+
 class Clients(_Settings):
     """Clients settings."""
 
     #: Centrifugo
     CENTRIFUGO: Centrifugo
 
+    #: HTTPClient: Connection pool of outbound HTTP clients.
+    HTTP: HTTPClient = Field(default_factory=HTTPClient)
+
 
 class Settings(_Settings):
     """Server settings.
@@ -397,6 +603,9 @@ class Settings(_Settings):
     #: Redis
     REDIS: Redis
 
+    #: Workers: Settings of the standalone consumer processes.
+    WORKERS: Workers = Field(default_factory=Workers)
+
     #: Clients
     CLIENTS: Clients
 
@@ -0,0 +1,9 @@
+"""Standalone entry point of queue consumers.
+
+Consumers run in separate processes, outside the event loop of the API
+server::
+
+    $ python -m app.workers --processes 4
+
+Set ``API__RUN_CONSUMERS=False`` for the API server in this case.
+"""
@@ -0,0 +1,38 @@
+"""Run queue consumers in several processes.
+
+Examples:
+    ::
+
+        $ python -m app.workers --processes 4
+"""
+
+import argparse
+import os
+
+from app.pkg.settings import settings
+from app.workers.process import run_process
+from app.workers.supervisor import Supervisor
+
+
+def main() -> None:
+    """Parse arguments and start supervisor."""
+
+    parser = argparse.ArgumentParser(description="Run queue consumers.")
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=settings.WORKERS.PROCESSES or os.cpu_count() or 1,
+        help="Count of consumer processes. Default: count of CPUs.",
+    )
+    args = parser.parse_args()
+
+    Supervisor(
+        target=run_process,
+        processes=args.processes,
+        drain_timeout=settings.WORKERS.DRAIN_TIMEOUT,
+        restart_delay=settings.WORKERS.RESTART_DELAY,
+    ).run()
+
+
+if __name__ == "__main__":
+    main()
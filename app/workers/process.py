@@ -0,0 +1,81 @@
+"""Consumer process."""
+
+import asyncio
+import os
+import signal
+
+from dependency_injector.wiring import Provide, inject
+
+from app.configuration import __containers__
+from app.internal.repository.v1.rabbitmq.topology import Topology
+from app.internal.services import Services
+from app.internal.workers import Worker, Workers
+from app.pkg.logger import get_logger
+from app.pkg.settings import settings
+
+__all__ = ["run_process"]
+
+logger = get_logger(__name__)
+
+
+@inject
+async def consume(
+    worker: Worker = Provide[Workers.worker],
+    topology: Topology = Provide[Services.v1.rabbitmq_repositories.topology],
+) -> None:
+    """Declare topology, consume queues until ``SIGTERM``, then drain
+    in-flight messages.
+
+    Args:
+        worker: Runner of all queue consumers.
+        topology: Rabbitmq topology of the application.
+    """
+
+    await topology.declare()
+    task = asyncio.create_task(worker.task())
+    stop = asyncio.Event()
+    asyncio.get_running_loop().add_signal_handler(signal.SIGTERM, stop.set)
+
+    stopping = asyncio.create_task(stop.wait())
+    await asyncio.wait((task, stopping), return_when=asyncio.FIRST_COMPLETED)
+    if task.done():
+        stopping.cancel()
+        task.result()
+        return
+
+    logger.info("Draining consumer process %s.", os.getpid())
+    task.cancel()
+    try:
+        await asyncio.wait_for(task, timeout=settings.WORKERS.DRAIN_TIMEOUT)
+    except (asyncio.CancelledError, asyncio.TimeoutError):
+        pass
+
+
+async def shutdown_resources() -> None:
+    """Close connections and clients opened by resources of the process."""
+
+    for container in __containers__.__wired_containers__.values():
+        closing = container.shutdown_resources()
+        if closing is not None:
+            await closing
+
+
+async def serve() -> None:
+    """Consume queues and close resources of the process on exit."""
+
+    try:
+        await consume()
+    finally:
+        await shutdown_resources()
+
+
+def run_process() -> None:
+    """Entry point of the consumer process.
+
+    Every process has its own event loop and its own connections.
+    """
+
+    # Supervisor sends SIGTERM to the processes on Ctrl+C.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    __containers__.wire_packages()
+    asyncio.run(serve())
@@ -0,0 +1,110 @@
+"""Supervisor of consumer processes."""
+
+import multiprocessing
+import signal
+import time
+from multiprocessing.context import SpawnProcess
+from typing import Callable
+
+from app.pkg.logger import get_logger
+
+__all__ = ["Supervisor"]
+
+logger = get_logger(__name__)
+
+
+class Supervisor:
+    """Run ``target`` in several processes and keep them alive.
+
+    Crashed processes are restarted after ``restart_delay``. On ``SIGTERM``
+    or ``SIGINT`` every process gets ``SIGTERM`` and ``drain_timeout`` seconds
+    to finish in-flight messages, then it is killed.
+
+    Attributes:
+        target: Function that runs in every process.
+        processes: Count of processes.
+        drain_timeout: Time in seconds to wait for graceful exit of processes.
+        restart_delay: Time in seconds before restart of crashed process.
+    """
+
+    def __init__(
+        self,
+        target: Callable[[], None],
+        processes: int,
+        drain_timeout: int,
+        restart_delay: int,
+    ):
+        self.target = target
+        self.processes = processes
+        self.drain_timeout = drain_timeout
+        self.restart_delay = restart_delay
+        self.__context = multiprocessing.get_context("spawn")
+        self.__children: list[SpawnProcess | None] = [None] * processes
+        self.__stopping = False
+
+    def run(self) -> None:
+        """Start processes and supervise them until the stop signal."""
+
+        signal.signal(signal.SIGTERM, self.__stop)
+        signal.signal(signal.SIGINT, self.__stop)
+
+        for index in range(self.processes):
+            self.__start(index)
+
+        while not self.__stopping:
+            for index, child in enumerate(self.__children):
+                if child is None or child.is_alive():
+                    continue
+                logger.warning(
+                    "Consumer process %s exited with code %s, restarting.",
+                    child.pid,
+                    child.exitcode,
+                )
+                child.close()
+                self.__children[index] = None
+                time.sleep(self.restart_delay)
+                if not self.__stopping:
+                    self.__start(index)
+            time.sleep(0.5)
+
+        self.__drain()
+
+    def __start(self, index: int) -> None:
+        """Start process in the slot.
+
+        Args:
+            index: Slot of the process.
+        """
+        child = self.__context.Process(
+            target=self.target,
+            name=f"consumer-{index}",
+            daemon=False,
+        )
+        child.start()
+        self.__children[index] = child
+        logger.info("Consumer process %s started.", child.pid)
+
+    def __stop(self, signum: int, _) -> None:
+        """Signal handler of the supervisor.
+
+        Args:
+            signum: Number of the received signal.
+        """
+        logger.info("Received signal %s, draining consumers.", signum)
+        self.__stopping = True
+
+    def __drain(self) -> None:
+        """Stop all processes gracefully, kill the ones that hang."""
+
+        children = [child for child in self.__children if child is not None]
+        for child in children:
+            if child.is_alive():
+                child.terminate()
+
+        deadline = time.monotonic() + self.drain_timeout
+        for child in children:
+            child.join(max(deadline - time.monotonic(), 0))
+            if child.is_alive():
+                logger.warning("Consumer process %s killed.", child.pid)
+                child.kill()
+                child.join()
@@ -0,0 +1 @@
+"""Micro benchmarks of hot paths of API server."""
@@ -0,0 +1,79 @@
+"""Benchmark serialization of list responses by FastAPI against
+:func:`.serialize_endpoint`.
+
+Run::
+
+    python -m benchmarks.json_response
+"""
+
+import asyncio
+import timeit
+from typing import List
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.pkg.models import v1 as models
+from app.pkg.models.base.json_response import serialize_endpoint
+
+NUMBER = 50
+
+
+def build_cities(rows: int) -> List[models.City]:
+    """Cities as they are returned by the city service."""
+
+    return [
+        models.City(
+            city_id=i + 1,
+            city_name=f"City {i}",
+            city_code="MSK",
+            country_code="RUS",
+        )
+        for i in range(rows)
+    ]
+
+
+#: Response field that FastAPI creates once per route.
+FIELD = create_model_field(
+    name="Response",
+    type_=List[models.City],
+    mode="serialization",
+)
+
+
+async def fastapi_default(cities: List[models.City]) -> bytes:
+    """Serialization done by FastAPI for ``response_model``."""
+
+    content = await serialize_response(field=FIELD, response_content=cities)
+    return JSONResponse(content).body
+
+
+def main() -> None:
+    loop = asyncio.new_event_loop()
+    for rows in (10, 1000, 10000):
+        cities = build_cities(rows)
+
+        async def endpoint():
+            return cities
+
+        direct = serialize_endpoint(endpoint, List[models.City], 200, by_alias=True)
+        default = timeit.timeit(
+            lambda: loop.run_until_complete(fastapi_default(cities)),
+            number=NUMBER,
+        )
+        current = timeit.timeit(
+            lambda: loop.run_until_complete(direct()),
+            number=NUMBER,
+        )
+        print(
+            f"rows={rows:<6} "
+            f"fastapi={default / NUMBER * 1000:8.2f}ms "
+            f"direct={current / NUMBER * 1000:8.2f}ms "
+            f"speedup={default / current:.1f}x",
+        )
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
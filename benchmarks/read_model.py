@@ -0,0 +1,74 @@
+"""Benchmark construction time and memory of 10k-row lists of
+:class:`.ReadModel` against :class:`.BaseModel`.
+
+Run::
+
+    python -m benchmarks.read_model
+"""
+
+import gc
+import time
+import tracemalloc
+from typing import List
+
+from pydantic import TypeAdapter
+from pydantic.types import PositiveInt
+
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.app.city import CityFields, _City
+
+ROWS = 10_000
+REPEAT = 5
+
+
+class MutableCity(_City):
+    """:class:`.City` on the mutable base, as it was before the read tier."""
+
+    city_id: PositiveInt = CityFields.city_id
+
+
+def build_rows() -> List[dict]:
+    """Rows as they are returned by the city repository."""
+
+    return [
+        {
+            "city_id": i + 1,
+            "city_name": f"City {i}",
+            "city_code": "MSK",
+            "country_code": "RUS",
+        }
+        for i in range(ROWS)
+    ]
+
+
+def measure(model: type, rows: List[dict]) -> tuple[float, float]:
+    """Best construction time in ms and retained memory in MiB of the list."""
+
+    adapter = TypeAdapter(List[model])
+    best = float("inf")
+    for _ in range(REPEAT):
+        started = time.perf_counter()
+        adapter.validate_python(rows)
+        best = min(best, time.perf_counter() - started)
+
+    gc.collect()
+    tracemalloc.start()
+    items = adapter.validate_python(rows)
+    memory, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del items
+    return best * 1000, memory / 2**20
+
+
+def main() -> None:
+    rows = build_rows()
+    for model in (MutableCity, models.City):
+        elapsed, memory = measure(model, rows)
+        print(
+            f"{model.__name__:<12} rows={ROWS} "
+            f"time={elapsed:7.2f}ms mem={memory:6.2f}MiB",
+        )
+
+
+if __name__ == "__main__":
+    main()
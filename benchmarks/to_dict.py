@@ -0,0 +1,113 @@
+"""Benchmark :meth:`.BaseModel.to_dict` against the ``isinstance`` walk it
+replaced.
+
+Run::
+
+    python -m benchmarks.to_dict
+"""
+
+import datetime
+import decimal
+import timeit
+import uuid
+from typing import Any, List
+
+import pydantic
+
+from app.pkg.models.base import BaseModel
+
+NUMBER = 2000
+
+
+class Item(BaseModel):
+    item_id: uuid.UUID
+    price: decimal.Decimal
+    name: str
+    quantity: int
+    created_at: datetime.datetime
+    token: pydantic.SecretStr
+
+
+class Order(BaseModel):
+    order_id: uuid.UUID
+    customer: str
+    day: datetime.date
+    password: pydantic.SecretBytes
+    items: List[Item]
+    tags: List[str]
+    extra: dict
+
+
+def legacy_to_dict(
+    model: BaseModel,
+    show_secrets: bool = False,
+    values: dict | None = None,
+) -> dict:
+    """Previous implementation of :meth:`.BaseModel.to_dict`."""
+
+    values = model.model_dump().items() if not values else values.items()
+    return {k: _legacy_cast(model, v, show_secrets) for k, v in values}
+
+
+def _legacy_cast(model: BaseModel, v: Any, show_secrets: bool) -> Any:
+    if isinstance(v, (list, tuple)):
+        return [_legacy_cast(model, ve, show_secrets) for ve in v]
+    elif isinstance(v, pydantic.SecretBytes):
+        return v.get_secret_value().decode() if show_secrets else str(v)
+    elif isinstance(v, pydantic.SecretStr):
+        return v.get_secret_value() if show_secrets else str(v)
+    elif isinstance(v, dict) and v:
+        return legacy_to_dict(model, show_secrets=show_secrets, values=v)
+    elif isinstance(v, (uuid.UUID, decimal.Decimal)):
+        return str(v)
+    elif isinstance(v, datetime.datetime):
+        return v.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(v, datetime.date):
+        return v.strftime("%Y-%m-%d")
+    elif isinstance(v, datetime.time):
+        return v.strftime("%H:%M:%S")
+    return v
+
+
+def build_order(items: int) -> Order:
+    """Order with ``items`` nested models and nested dicts."""
+
+    now = datetime.datetime.now()
+    return Order(
+        order_id=uuid.uuid4(),
+        customer="customer",
+        day=now.date(),
+        password=b"password",
+        items=[
+            Item(
+                item_id=uuid.uuid4(),
+                price=decimal.Decimal("10.50"),
+                name=f"item-{i}",
+                quantity=i,
+                created_at=now,
+                token="token",
+            )
+            for i in range(items)
+        ],
+        tags=[f"tag-{i}" for i in range(items)],
+        extra={"source": "web", "meta": {"at": now, "ids": [uuid.uuid4()]}},
+    )
+
+
+def main() -> None:
+    for items in (1, 10, 100):
+        order = build_order(items)
+        for show_secrets in (False, True):
+            assert order.to_dict(show_secrets) == legacy_to_dict(order, show_secrets)
+        legacy = timeit.timeit(lambda: legacy_to_dict(order), number=NUMBER)
+        current = timeit.timeit(lambda: order.to_dict(), number=NUMBER)
+        print(
+            f"items={items:<4} "
+            f"legacy={legacy / NUMBER * 1e6:8.1f}us "
+            f"current={current / NUMBER * 1e6:8.1f}us "
+            f"speedup={legacy / current:.2f}x",
+        )
+
+
+if __name__ == "__main__":
+    main()
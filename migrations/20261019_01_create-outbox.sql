@@ -0,0 +1,12 @@
+-- Outbox of events written in the same transaction as entity mutations.
+-- Relayed rows are claimed for a lease and deleted after publish.
+-- depends:
+
+create table if not exists outbox (
+    outbox_id     bigserial primary key,
+    routing_key   text        not null,
+    event_type    text        not null,
+    payload       jsonb       not null,
+    created_at    timestamptz not null default now(),
+    claimed_until timestamptz
+);
@@ -0,0 +1,107 @@
+"""Testing the :class:`IdempotencyRoute`."""
+
+import asyncio
+
+import httpx
+import pytest
+from dependency_injector import providers
+from fastapi import APIRouter, FastAPI
+
+from app.internal.pkg.middlewares import idempotency
+from app.internal.pkg.middlewares.idempotency import IdempotencyRoute, idempotent
+from app.internal.services import Services
+from app.pkg.models import v1 as models
+
+
+class InMemoryIdempotencyRepository:
+    def __init__(self):
+        self.values: dict[str, models.IdempotentResponse] = {}
+
+    async def create(self, redis_key, cmd, expire_time) -> bool:
+        if redis_key in self.values:
+            return False
+        self.values[redis_key] = cmd
+        return True
+
+    async def update(self, redis_key, cmd, expire_time) -> None:
+        self.values[redis_key] = cmd
+
+    async def read(self, redis_key):
+        return self.values.get(redis_key)
+
+    async def delete(self, redis_key) -> None:
+        self.values.pop(redis_key, None)
+
+
+@pytest.fixture()
+def repository():
+    repository = InMemoryIdempotencyRepository()
+    container = Services()
+    container.v1.redis_repositories.idempotency_repository.override(
+        providers.Object(repository),
+    )
+    container.wire(modules=[idempotency])
+    yield repository
+    container.unwire()
+
+
+@pytest.fixture()
+async def client(repository):
+    calls = []
+    release = asyncio.Event()
+    release.set()
+
+    router = APIRouter(route_class=IdempotencyRoute)
+
+    @router.post("/bid/", status_code=201)
+    @idempotent()
+    async def create_bid(bid: dict):
+        calls.append(bid)
+        await release.wait()
+        return {"call": len(calls)}
+
+    app = FastAPI()
+    app.include_router(router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://api") as http:
+        http.calls = calls
+        http.release = release
+        yield http
+
+
+async def test_replay_stored_response(client):
+    headers = {"Idempotency-Key": "key"}
+
+    first = await client.post("/bid/", json={"bid_name": "a"}, headers=headers)
+    second = await client.post("/bid/", json={"bid_name": "a"}, headers=headers)
+
+    assert first.status_code == second.status_code == 201
+    assert first.json() == second.json() == {"call": 1}
+    assert second.headers["Idempotent-Replayed"] == "true"
+    assert len(client.calls) == 1
+
+
+async def test_conflict_while_in_progress(client):
+    headers = {"Idempotency-Key": "key"}
+    client.release.clear()
+
+    first = asyncio.create_task(
+        client.post("/bid/", json={"bid_name": "a"}, headers=headers),
+    )
+    while not client.calls:
+        await asyncio.sleep(0)
+    second = await client.post("/bid/", json={"bid_name": "a"}, headers=headers)
+    client.release.set()
+
+    assert second.status_code == 409
+    assert (await first).status_code == 201
+
+
+async def test_reused_key_with_another_body(client):
+    headers = {"Idempotency-Key": "key"}
+
+    await client.post("/bid/", json={"bid_name": "a"}, headers=headers)
+    response = await client.post("/bid/", json={"bid_name": "b"}, headers=headers)
+
+    assert response.status_code == 422
+    assert len(client.calls) == 1
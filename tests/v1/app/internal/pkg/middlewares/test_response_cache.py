@@ -0,0 +1,125 @@
+"""Testing the :class:`ResponseCacheRoute`."""
+
+import asyncio
+from typing import Iterable, Sequence
+
+import httpx
+import pytest
+from fastapi import APIRouter, FastAPI
+
+from app.internal.pkg.middlewares import response_cache as response_cache_module
+from app.internal.pkg.middlewares.response_cache import (
+    RESPONSE_CACHE_HEADER,
+    ResponseCacheRoute,
+    cached,
+)
+from app.internal.repository.v1.postgresql.handlers import invalidate_cache as handler
+from app.internal.repository.v1.postgresql.handlers.invalidate_cache import (
+    invalidate_cache,
+)
+from app.pkg.cache import LocalCache, TwoLayerCache
+
+
+class InMemoryStorage:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.tags: dict[str, set[str]] = {}
+        self.versions: dict[str, int] = {}
+
+    async def create(
+        self,
+        redis_key: str,
+        value: bytes,
+        tags: Iterable[str],
+        expire_time: int,
+        versions: Sequence[int] | None = None,
+    ) -> bool:
+        tags = tuple(tags)
+        if versions is not None and list(versions) != await self.read_versions(tags):
+            return False
+        self.values[redis_key] = value
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(redis_key)
+        return True
+
+    async def read(self, redis_key: str) -> bytes | None:
+        return self.values.get(redis_key)
+
+    async def read_versions(self, tags: Sequence[str]) -> list[int]:
+        return [self.versions.get(tag, 0) for tag in tags]
+
+    async def delete_by_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.versions[tag] = self.versions.get(tag, 0) + 1
+            for key in self.tags.pop(tag, set()):
+                self.values.pop(key, None)
+
+
+class CityTable:
+    """Table with one city name, writes drop cached responses."""
+
+    def __init__(self):
+        self.name = "Moscow"
+        self.read_started = asyncio.Event()
+        self.write_done = asyncio.Event()
+        self.write_done.set()
+
+    async def read(self) -> str:
+        name = self.name
+        self.read_started.set()
+        await self.write_done.wait()
+        return name
+
+    @invalidate_cache("city")
+    async def update(self, name: str) -> None:
+        self.name = name
+
+
+@pytest.fixture()
+def cache(monkeypatch) -> TwoLayerCache:
+    cache = TwoLayerCache(LocalCache(max_size=10, ttl=60), InMemoryStorage())
+    monkeypatch.setattr(response_cache_module, "response_cache", cache)
+    monkeypatch.setattr(handler, "response_cache", cache)
+    return cache
+
+
+@pytest.fixture()
+async def table(cache):
+    table = CityTable()
+    router = APIRouter(route_class=ResponseCacheRoute)
+
+    @router.get("/city/")
+    @cached(tags=("city",))
+    async def read_city():
+        return {"city_name": await table.read()}
+
+    app = FastAPI()
+    app.include_router(router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://api") as http:
+        table.http = http
+        yield table
+
+
+async def test_write_drops_cached_response(table):
+    first = await table.http.get("/city/")
+    await table.update("Kazan")
+    second = await table.http.get("/city/")
+
+    assert first.headers[RESPONSE_CACHE_HEADER] == "MISS"
+    assert second.headers[RESPONSE_CACHE_HEADER] == "MISS"
+    assert second.json() == {"city_name": "Kazan"}
+
+
+async def test_response_read_before_write_is_not_stored(table):
+    table.write_done.clear()
+    stale = asyncio.create_task(table.http.get("/city/"))
+    await table.read_started.wait()
+
+    await table.update("Kazan")
+    table.write_done.set()
+
+    assert (await stale).json() == {"city_name": "Moscow"}
+    fresh = await table.http.get("/city/")
+    assert fresh.headers[RESPONSE_CACHE_HEADER] == "MISS"
+    assert fresh.json() == {"city_name": "Kazan"}
@@ -0,0 +1,108 @@
+"""Module for testing relay of the transactional outbox."""
+
+import asyncio
+from typing import List
+
+import pytest
+
+from app.internal.repository.v1.postgresql import connection
+from app.internal.repository.v1.postgresql.city import CityRepository
+from app.internal.repository.v1.postgresql.outbox import OutboxRepository
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.city import DuplicateCityCode
+
+#: Lease of claimed rows in tests.
+LEASE_MS = 30000
+
+
+async def read_outbox() -> List[dict]:
+    async with connection.get_connection() as cur:
+        await cur.execute(
+            "select outbox_id, event_type, claimed_until from outbox "
+            "order by outbox_id;",
+        )
+        return await cur.fetchall()
+
+
+@pytest.mark.postgresql
+async def test_rolled_back_write_leaves_no_event(
+    city_repository: CityRepository,
+    country_inserter,
+) -> None:
+    country, _ = await country_inserter()
+    cmd = models.CreateCityCommand.factory().build(country_code=country.country_code)
+    await city_repository.create(cmd=cmd)
+
+    with pytest.raises(DuplicateCityCode):
+        await city_repository.create(cmd=cmd.copy(update={"city_name": "Other"}))
+
+    assert [row["event_type"] for row in await read_outbox()] == ["city.created"]
+
+
+@pytest.mark.postgresql
+async def test_delete_after_confirmed_publish(
+    outbox_repository: OutboxRepository,
+    city_repository: CityRepository,
+    country_inserter,
+) -> None:
+    country, _ = await country_inserter()
+    cmd = models.CreateCityCommand.factory().build(country_code=country.country_code)
+    city = await city_repository.create(cmd=cmd)
+    published: List[models.OutboxEvent] = []
+
+    async def publish(events: List[models.OutboxEvent]) -> None:
+        published.extend(events)
+
+    assert await outbox_repository.relay(publish, 10, LEASE_MS) == 1
+    assert [(event.event_type, event.payload["city_id"]) for event in published] == [
+        ("city.created", city.city_id),
+    ]
+    assert await read_outbox() == []
+
+
+@pytest.mark.postgresql
+async def test_failed_publish_keeps_events(
+    outbox_repository: OutboxRepository,
+    city_repository: CityRepository,
+    country_inserter,
+) -> None:
+    country, _ = await country_inserter()
+    cmd = models.CreateCityCommand.factory().build(country_code=country.country_code)
+    await city_repository.create(cmd=cmd)
+
+    async def publish(events: List[models.OutboxEvent]) -> None:
+        raise ConnectionError(len(events))
+
+    with pytest.raises(ConnectionError):
+        await outbox_repository.relay(publish, 10, LEASE_MS)
+
+    [row] = await read_outbox()
+    assert row["claimed_until"] is None
+
+
+@pytest.mark.postgresql
+async def test_publish_outside_of_claim_transaction(
+    outbox_repository: OutboxRepository,
+    city_repository: CityRepository,
+    country_inserter,
+) -> None:
+    country, _ = await country_inserter()
+    cmd = models.CreateCityCommand.factory().build(country_code=country.country_code)
+    await city_repository.create(cmd=cmd)
+    publishing, release = asyncio.Event(), asyncio.Event()
+
+    async def publish(events: List[models.OutboxEvent]) -> None:
+        publishing.set()
+        await release.wait()
+
+    relay = asyncio.create_task(outbox_repository.relay(publish, 10, LEASE_MS))
+    await publishing.wait()
+
+    # Claim is committed, other relays skip the row without waiting for a lock.
+    [row] = await read_outbox()
+    assert row["claimed_until"] is not None
+    assert await outbox_repository.relay(publish, 10, LEASE_MS) == 0
+
+    release.set()
+    assert await relay == 1
+    assert await read_outbox() == []
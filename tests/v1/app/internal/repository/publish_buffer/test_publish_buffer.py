@@ -0,0 +1,349 @@
+"""Testing the :class:`PublishBuffer`."""
+
+import asyncio
+
+import pytest
+
+from app.internal.repository.publish_buffer import PublishBuffer
+from app.internal.repository.v1.redis.stream import StreamRepository
+from app.internal.repository.transport import Transport
+from app.pkg.models import v1 as models
+from app.pkg.models.base.settings_enum import OverflowEnum
+from app.pkg.models.v1.exceptions.publish_buffer import PublishBufferFull
+
+
+class SlowTransport(Transport):
+    def __init__(self, failures: int = 0):
+        self.entered = asyncio.Event()
+        self.released = asyncio.Event()
+        self.failures = failures
+        self.published = []
+
+    async def create(self, message, routing_key):
+        return (await self.create_many([message], routing_key))[0]
+
+    async def create_many(self, messages, routing_key):
+        self.entered.set()
+        await self.released.wait()
+        if self.failures:
+            self.failures -= 1
+            raise ConnectionError("broker is blocked")
+        self.published.append((routing_key, list(messages)))
+        return messages
+
+
+def encode_fields(message) -> dict[bytes, bytes]:
+    fields = StreamRepository(maxlen=100)._build_fields(message)
+    return {
+        key.encode(): value.encode() if isinstance(value, str) else value
+        for key, value in fields.items()
+    }
+
+
+class SpillRepository:
+    """Redis streams of spilled messages with one consumer group."""
+
+    parse_fields = staticmethod(StreamRepository.parse_fields)
+
+    def __init__(self):
+        self.streams: dict[str, list] = {}
+        self.pending: dict[bytes, int] = {}
+        self.dead: dict[str, list] = {}
+        self.read: dict[str, int] = {}
+
+    async def create(self, message, routing_key):
+        await self.create_many([message], routing_key)
+        return message
+
+    async def create_many(self, messages, routing_key):
+        entries = self.streams.setdefault(routing_key, [])
+        for message in messages:
+            entry_id = f"{routing_key}-{len(entries)}".encode()
+            entries.append((entry_id, encode_fields(message)))
+        return messages
+
+    async def create_group(self, stream, group):
+        return None
+
+    async def claim(self, stream, group, consumer, min_idle_time, count):
+        claimed = [
+            entry
+            for entry in self.streams.get(stream, [])
+            if entry[0] in self.pending
+        ][:count]
+        for entry_id, _ in claimed:
+            self.pending[entry_id] += 1
+        return claimed
+
+    async def read_group(self, stream, group, consumer, count, block):
+        start = self.read.get(stream, 0)
+        entries = self.streams.get(stream, [])[start : start + count]
+        self.read[stream] = start + len(entries)
+        for entry_id, _ in entries:
+            self.pending[entry_id] = 1
+        return entries
+
+    async def deliveries(self, stream, group, *entry_ids):
+        return [self.pending.get(entry_id, 0) for entry_id in entry_ids]
+
+    async def dead_letter(self, stream, group, entries):
+        self.dead.setdefault(f"{stream}.dlq", []).extend(entries)
+        await self.ack(stream, group, *[entry_id for entry_id, _ in entries])
+
+    async def ack(self, stream, group, *entry_ids):
+        for entry_id in entry_ids:
+            self.pending.pop(entry_id)
+
+
+def bid(name: str) -> models.CreateBidCommand:
+    return models.CreateBidCommand(bid_name=name)
+
+
+async def wait_until(condition) -> None:
+    async def poll():
+        while not condition():
+            await asyncio.sleep(0.001)
+
+    await asyncio.wait_for(poll(), timeout=1)
+
+
+async def test_create_returns_before_publish():
+    transport = SlowTransport()
+    buffer = PublishBuffer(name="bid", transport=transport, max_size=10)
+
+    await buffer.create_many([bid("a"), bid("b")], routing_key="bids")
+
+    assert transport.published == []
+
+    transport.released.set()
+    await buffer.close(timeout=1)
+
+    assert [key for key, _ in transport.published] == ["bids"]
+    assert buffer.metrics().published == 2
+
+
+async def test_reject_when_full():
+    transport = SlowTransport()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=1,
+        overflow=OverflowEnum.REJECT,
+        batch_size=1,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await transport.entered.wait()
+    await buffer.create(bid("b"), routing_key="bids")
+
+    with pytest.raises(PublishBufferFull):
+        await buffer.create(bid("c"), routing_key="bids")
+    assert buffer.metrics().rejected == 1
+
+    transport.released.set()
+    await buffer.close(timeout=1)
+
+
+async def test_reject_batch_as_a_whole():
+    transport = SlowTransport()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=2,
+        overflow=OverflowEnum.REJECT,
+        batch_size=1,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await transport.entered.wait()
+
+    with pytest.raises(PublishBufferFull):
+        await buffer.create_many([bid("b"), bid("c"), bid("d")], routing_key="bids")
+    metrics = buffer.metrics()
+    assert metrics.depth == 0
+    assert metrics.rejected == 3
+
+    await buffer.create_many([bid("b"), bid("c")], routing_key="bids")
+    transport.released.set()
+    await buffer.close(timeout=1)
+
+    assert [messages for _, messages in transport.published] == [
+        [bid("a")],
+        [bid("b")],
+        [bid("c")],
+    ]
+
+
+async def test_block_when_full():
+    transport = SlowTransport()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=1,
+        batch_size=1,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await transport.entered.wait()
+    await buffer.create(bid("b"), routing_key="bids")
+    blocked = asyncio.create_task(buffer.create(bid("c"), routing_key="bids"))
+    await asyncio.sleep(0.01)
+    assert not blocked.done()
+
+    transport.released.set()
+    await blocked
+    await buffer.close(timeout=1)
+
+    assert buffer.metrics().published == 3
+
+
+async def test_failed_batch_is_retried():
+    transport = SlowTransport(failures=2)
+    transport.released.set()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=10,
+        retry_delay_ms=1,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await buffer.close(timeout=1)
+
+    metrics = buffer.metrics()
+    assert metrics.failed == 2
+    assert metrics.published == 1
+    assert metrics.depth == 0
+
+
+async def test_spill_when_full_and_replay():
+    transport = SlowTransport()
+    spill = SpillRepository()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=1,
+        overflow=OverflowEnum.SPILL,
+        batch_size=1,
+        retry_delay_ms=1,
+        spill=spill,
+        model=models.CreateBidCommand,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await transport.entered.wait()
+    await buffer.create(bid("b"), routing_key="bids")
+    await buffer.create(bid("c"), routing_key="bids")
+
+    assert len(spill.streams["bids.spill"]) == 1
+    assert buffer.metrics().spilled == 1
+
+    transport.released.set()
+    await wait_until(lambda: buffer.metrics().replayed == 1)
+    await buffer.close(timeout=1)
+
+    assert [messages for _, messages in transport.published] == [
+        [bid("a")],
+        [bid("b")],
+        [bid("c")],
+    ]
+    assert spill.pending == {}
+
+
+async def test_spill_batch_after_max_attempts():
+    transport = SlowTransport(failures=2)
+    transport.released.set()
+    spill = SpillRepository()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=10,
+        retry_delay_ms=1,
+        max_attempts=2,
+        spill=spill,
+        model=models.CreateBidCommand,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await buffer.close(timeout=1)
+
+    metrics = buffer.metrics()
+    assert metrics.failed == 2
+    assert metrics.spilled == 1
+    assert metrics.published == 0
+    assert len(spill.streams["bids.spill"]) == 1
+
+
+async def test_drop_batch_after_max_attempts_without_spill():
+    transport = SlowTransport(failures=10)
+    transport.released.set()
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=10,
+        retry_delay_ms=1,
+        max_attempts=3,
+    )
+
+    await buffer.create(bid("a"), routing_key="bids")
+    await buffer.close(timeout=1)
+
+    metrics = buffer.metrics()
+    assert metrics.failed == 3
+    assert metrics.dropped == 1
+    assert metrics.depth == 0
+
+
+async def test_dead_letter_spilled_message_after_max_attempts():
+    transport = SlowTransport(failures=100)
+    transport.released.set()
+    spill = SpillRepository()
+    await spill.create(bid("a"), routing_key="bids.spill")
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=10,
+        retry_delay_ms=1,
+        max_attempts=2,
+        spill=spill,
+        model=models.CreateBidCommand,
+        routing_keys=["bids"],
+    )
+
+    # Any buffered message starts the drainer, it fails and is spilled too.
+    await buffer.create(bid("b"), routing_key="bids")
+    await wait_until(lambda: buffer.metrics().dropped == 2)
+    await buffer.close(timeout=1)
+
+    assert [
+        spill.parse_fields(fields, models.CreateBidCommand)
+        for _, fields in spill.dead["bids.spill.dlq"]
+    ] == [bid("a"), bid("b")]
+    assert spill.pending == {}
+    assert transport.published == []
+
+
+async def test_replay_spilled_messages_under_load():
+    transport = SlowTransport()
+    transport.released.set()
+    spill = SpillRepository()
+    await spill.create(bid("spilled"), routing_key="bids.spill")
+    buffer = PublishBuffer(
+        name="bid",
+        transport=transport,
+        max_size=10,
+        batch_size=1,
+        retry_delay_ms=50,
+        spill=spill,
+        model=models.CreateBidCommand,
+        routing_keys=["bids"],
+    )
+
+    # The buffer is never idle for retry_delay_ms.
+    for i in range(10):
+        await buffer.create(bid(f"{i}"), routing_key="bids")
+        await asyncio.sleep(0.005)
+
+    assert buffer.metrics().replayed == 1
+    await buffer.close(timeout=1)
+    assert ("bids", [bid("spilled")]) in transport.published
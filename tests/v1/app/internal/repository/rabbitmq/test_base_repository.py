@@ -0,0 +1,66 @@
+"""Testing batched publishing of the :class:`BaseRepository`."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq import base_repository
+from app.internal.repository.v1.rabbitmq.base_repository import BaseRepository
+from app.pkg.codec import decode_message
+from app.pkg.models import v1 as models
+
+
+class Exchange:
+    """Exchange which confirms publishes after a yield to the loop."""
+
+    def __init__(self):
+        self.published = []
+        self.waiting = 0
+        self.max_waiting = 0
+
+    async def publish(self, message, routing_key):
+        self.waiting += 1
+        self.max_waiting = max(self.max_waiting, self.waiting)
+        await asyncio.sleep(0)
+        self.waiting -= 1
+        self.published.append((routing_key, message))
+
+
+class Channel:
+    def __init__(self):
+        self.default_exchange = Exchange()
+
+
+@pytest.fixture()
+def channels(monkeypatch) -> list:
+    acquired = []
+
+    @asynccontextmanager
+    async def get_connection():
+        acquired.append(Channel())
+        yield acquired[-1]
+
+    monkeypatch.setattr(base_repository, "get_connection", get_connection)
+    return acquired
+
+
+async def test_create_many_on_one_channel(channels: list):
+    repository = BaseRepository(confirm_window=2)
+    bids = [models.CreateBidCommand(bid_name=f"bid-{i}") for i in range(5)]
+
+    assert await repository.create_many(bids, routing_key="bids") == bids
+
+    [channel] = channels
+    exchange = channel.default_exchange
+    assert exchange.max_waiting == 2
+    assert [routing_key for routing_key, _ in exchange.published] == ["bids"] * 5
+    assert [
+        decode_message(
+            message.body,
+            models.CreateBidCommand,
+            content_type=message.content_type,
+            content_encoding=message.content_encoding,
+        )
+        for _, message in exchange.published
+    ] == bids
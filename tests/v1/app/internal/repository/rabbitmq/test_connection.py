@@ -0,0 +1,126 @@
+"""Testing connections of rabbitmq publishers and consumers."""
+
+import asyncio
+
+import aio_pika
+import pytest
+
+from app.internal.repository.v1.rabbitmq import connection
+from app.internal.repository.v1.rabbitmq.connection import get_connection
+from app.internal.workers.rabbitmq_consumer import RabbitMQConsumer
+from app.pkg.connectors import Connectors
+from app.pkg.models import v1 as models
+
+
+class Exchange:
+    def __init__(self):
+        self.published = []
+
+    async def publish(self, message, routing_key):
+        self.published.append(routing_key)
+
+
+class Queue:
+    def __init__(self, consuming: asyncio.Event):
+        self.consuming = consuming
+
+    def iterator(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        self.consuming.set()
+        await asyncio.Event().wait()
+
+
+class Channel:
+    def __init__(self, consuming: asyncio.Event):
+        self.consuming = consuming
+        self.default_exchange = Exchange()
+        self.is_closed = False
+
+    async def set_qos(self, prefetch_count):
+        return None
+
+    async def declare_queue(self, name, durable, arguments=None):
+        return Queue(self.consuming)
+
+    async def close(self):
+        self.is_closed = True
+
+
+class Connection:
+    def __init__(self, opened: list):
+        self.channels = []
+        opened.append(self)
+
+    async def channel(self, publisher_confirms=True):
+        self.channels.append(Channel(asyncio.Event()))
+        return self.channels[-1]
+
+    async def close(self):
+        return None
+
+
+@pytest.fixture()
+async def connections(monkeypatch):
+    opened = []
+
+    async def connect_robust(url, *args, **kwargs):
+        return Connection(opened)
+
+    monkeypatch.setattr(aio_pika, "connect_robust", connect_robust)
+    container = Connectors()
+    container.rabbitmq.configuration.RABBITMQ.MAX_CONNECTION.from_value(2)
+    container.wire(modules=[connection])
+    yield opened
+    await container.rabbitmq.shutdown_resources()
+    container.unwire()
+
+
+async def callback(cmd):
+    _ = cmd
+
+
+async def test_publish_while_consumers_run(connections):
+    consumers = [
+        RabbitMQConsumer(
+            models.ConsumerQueueData(
+                queue_name=queue_name,
+                queue_callback=callback,
+                queue_incoming_model=models.CreateBidCommand,
+            ),
+        )
+        for queue_name in ("bids", "bids_second")
+    ]
+    tasks = [asyncio.create_task(consumer.consume()) for consumer in consumers]
+
+    async def consuming():
+        while sum(
+            channel.consuming.is_set()
+            for opened in connections
+            for channel in opened.channels
+        ) < len(consumers):
+            await asyncio.sleep(0)
+
+    await asyncio.wait_for(consuming(), timeout=1)
+
+    async def publish():
+        async with get_connection() as channel:
+            await channel.default_exchange.publish(None, routing_key="bids")
+            return channel
+
+    channel = await asyncio.wait_for(publish(), timeout=1)
+
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    assert channel.default_exchange.published == ["bids"]
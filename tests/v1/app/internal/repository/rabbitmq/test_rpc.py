@@ -0,0 +1,156 @@
+"""Testing the :class:`RPCRepository`."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import aio_pika
+import pytest
+from aiormq.abc import DeliveredMessage
+from pamqp.commands import Basic
+
+from app.internal.repository.v1.rabbitmq import rpc
+from app.internal.repository.v1.rabbitmq.rpc import REPLY_TO, RPCRepository
+from app.pkg.codec import encode_message
+from app.pkg.models import v1 as models
+from app.pkg.models.v1.exceptions.rpc import RPCTimeout, RPCUnroutable
+
+
+class Reply:
+    def __init__(self, correlation_id, body):
+        self.correlation_id = correlation_id
+        self.body = body
+        self.content_type = "application/json"
+        self.content_encoding = None
+
+
+class Channel:
+    def __init__(self, replies: bool, routed: bool = True):
+        self.replies = replies
+        self.routed = routed
+        self.on_return_raises = False
+        self.is_closed = False
+        self.on_reply = None
+        self.published = []
+        self.default_exchange = self
+
+    async def get_queue(self, name, ensure):
+        assert name == REPLY_TO
+        return self
+
+    async def consume(self, callback, no_ack):
+        self.on_reply = callback
+
+    async def publish(self, message, routing_key, mandatory=False):
+        self.published.append((routing_key, message))
+        if mandatory and not self.routed and self.on_return_raises:
+            returned = Basic.Return(reply_text="NO_ROUTE", routing_key=routing_key)
+            raise aio_pika.exceptions.PublishError(
+                DeliveredMessage(returned, None, message.body, None),
+                returned,
+            )
+        if self.replies:
+            body, _ = encode_message(models.CreateBidCommand(bid_name="reply"))
+            asyncio.get_running_loop().call_soon(
+                asyncio.ensure_future,
+                self.on_reply(Reply(message.correlation_id, body)),
+            )
+
+    async def close(self):
+        self.is_closed = True
+
+
+class Connection:
+    def __init__(self, channel):
+        self.opened = channel
+
+    async def channel(self, on_return_raises=False):
+        self.opened.on_return_raises = on_return_raises
+        return self.opened
+
+
+def patch_connection(monkeypatch, channel: Channel):
+    @asynccontextmanager
+    async def get_consumer_connection():
+        yield Connection(channel)
+
+    monkeypatch.setattr(rpc, "get_consumer_connection", get_consumer_connection)
+
+
+async def test_call_returns_reply(monkeypatch):
+    channel = Channel(replies=True)
+    patch_connection(monkeypatch, channel)
+    repository = RPCRepository(timeout_ms=1000)
+
+    reply = await repository.call(
+        models.CreateBidCommand(bid_name="request"),
+        routing_key="bids",
+        response_model=models.CreateBidCommand,
+    )
+
+    assert reply.bid_name == "reply"
+    [(routing_key, request)] = channel.published
+    assert routing_key == "bids"
+    assert request.reply_to == REPLY_TO
+    assert request.correlation_id
+
+
+async def test_call_timeout(monkeypatch):
+    channel = Channel(replies=False)
+    patch_connection(monkeypatch, channel)
+    repository = RPCRepository(timeout_ms=10)
+
+    with pytest.raises(RPCTimeout):
+        await repository.call(
+            models.CreateBidCommand(bid_name="request"),
+            routing_key="bids",
+            response_model=models.CreateBidCommand,
+        )
+
+
+async def test_late_reply_is_dropped(monkeypatch):
+    channel = Channel(replies=False)
+    patch_connection(monkeypatch, channel)
+    repository = RPCRepository(timeout_ms=10)
+
+    with pytest.raises(RPCTimeout):
+        await repository.call(
+            models.CreateBidCommand(bid_name="request"),
+            routing_key="bids",
+            response_model=models.CreateBidCommand,
+        )
+    [(_, request)] = channel.published
+
+    await channel.on_reply(Reply(request.correlation_id, b"{}"))
+
+
+async def test_unroutable_call_fails_fast(monkeypatch):
+    channel = Channel(replies=False, routed=False)
+    patch_connection(monkeypatch, channel)
+    repository = RPCRepository(timeout_ms=60000)
+
+    with pytest.raises(RPCUnroutable):
+        await asyncio.wait_for(
+            repository.call(
+                models.CreateBidCommand(bid_name="request"),
+                routing_key="bid_status",
+                response_model=models.CreateBidCommand,
+            ),
+            timeout=1,
+        )
+
+
+@pytest.mark.parametrize("timeout_ms", [1, 999, 1001, 1003, 5000, 60001])
+async def test_request_expires_with_call(monkeypatch, timeout_ms: int):
+    channel = Channel(replies=True)
+    patch_connection(monkeypatch, channel)
+    repository = RPCRepository()
+
+    await repository.call(
+        models.CreateBidCommand(bid_name="request"),
+        routing_key="bids",
+        response_model=models.CreateBidCommand,
+        timeout_ms=timeout_ms,
+    )
+
+    [(_, request)] = channel.published
+    assert request.properties.expiration == str(timeout_ms)
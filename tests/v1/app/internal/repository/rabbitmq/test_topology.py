@@ -0,0 +1,95 @@
+"""Testing the :class:`Topology`."""
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq.topology import Topology
+from app.pkg.models import v1 as models
+
+
+class Exchange:
+    def __init__(self, name):
+        self.name = name
+
+
+class Queue:
+    def __init__(self, name, bindings):
+        self.name = name
+        self.bindings = bindings
+
+    async def bind(self, exchange, routing_key):
+        self.bindings.append((exchange, routing_key, self.name))
+
+
+class Channel:
+    def __init__(self):
+        self.default_exchange = Exchange("")
+        self.exchanges = []
+        self.queues = []
+        self.bindings = []
+        self.lookups = 0
+
+    async def declare_exchange(self, name, type, durable, arguments):
+        self.exchanges.append(name)
+        return Exchange(name)
+
+    async def declare_queue(self, name, durable, arguments):
+        self.queues.append(name)
+        return Queue(name, self.bindings)
+
+    async def get_exchange(self, name, ensure):
+        self.lookups += 1
+        return Exchange(name)
+
+
+@pytest.fixture()
+def topology() -> Topology:
+    return Topology(
+        exchanges=[
+            models.ExchangeDeclaration(name="bids"),
+            models.ExchangeDeclaration(name=""),
+        ],
+        queues=[
+            models.QueueDeclaration(
+                name="bids.created",
+                bindings=[
+                    models.QueueBinding(exchange="bids", routing_key="created"),
+                ],
+            ),
+            models.QueueDeclaration(name="events"),
+        ],
+    )
+
+
+async def test_declare(topology: Topology):
+    channel = Channel()
+
+    await topology.declare(channel)
+
+    assert channel.exchanges == ["bids"]
+    assert channel.queues == ["bids.created", "events"]
+    assert channel.bindings == [("bids", "created", "bids.created")]
+
+
+async def test_exchange_is_cached(topology: Topology):
+    channel = Channel()
+
+    first = await topology.exchange(channel, "bids")
+    second = await topology.exchange(channel, "bids")
+
+    assert first is second
+    assert channel.lookups == 1
+
+
+async def test_declared_exchange_is_cached(topology: Topology):
+    channel = Channel()
+
+    await topology.declare(channel)
+    await topology.exchange(channel, "bids")
+
+    assert channel.lookups == 0
+
+
+async def test_default_exchange(topology: Topology):
+    channel = Channel()
+
+    assert await topology.exchange(channel, "") is channel.default_exchange
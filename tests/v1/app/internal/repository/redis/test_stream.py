@@ -0,0 +1,142 @@
+"""Testing the :class:`StreamRepository`."""
+
+from contextlib import asynccontextmanager
+
+import pytest
+from redis.exceptions import ResponseError
+
+from app.internal.repository.v1.redis import stream
+from app.internal.repository.v1.redis.stream import StreamRepository
+from app.pkg.models import v1 as models
+
+
+class Pipeline:
+    def __init__(self, redis):
+        self.redis = redis
+        self.commands = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def xadd(self, name, fields, maxlen, approximate):
+        self.commands.append((name, fields, maxlen, approximate))
+
+    async def execute(self):
+        for command in self.commands:
+            await self.redis.xadd(*command)
+        self.redis.pipelines += 1
+
+
+class Redis:
+    def __init__(self):
+        self.entries: dict[str, list] = {}
+        self.trims = []
+        self.pipelines = 0
+        self.group_error = None
+
+    async def xadd(self, name, fields, maxlen, approximate):
+        entries = self.entries.setdefault(name, [])
+        entries.append(
+            (
+                f"{len(entries)}-0".encode(),
+                {
+                    key.encode(): value.encode() if isinstance(value, str) else value
+                    for key, value in fields.items()
+                },
+            ),
+        )
+        self.trims.append((maxlen, approximate))
+
+    def pipeline(self, transaction):
+        assert not transaction
+        return Pipeline(self)
+
+    async def xgroup_create(self, name, group, id, mkstream):
+        if self.group_error:
+            raise ResponseError(self.group_error)
+
+    async def xreadgroup(self, group, consumer, streams, count, block):
+        [(name, _)] = streams.items()
+        entries = self.entries.get(name, [])[:count]
+        return [[name.encode(), entries]] if entries else []
+
+    async def xautoclaim(self, name, group, consumer, min_idle_time, count):
+        # Entries trimmed by ``MAXLEN`` are returned without fields.
+        return [b"0-0", [(b"0-0", None), *self.entries.get(name, [])[:count]], []]
+
+
+@pytest.fixture()
+def redis(monkeypatch) -> Redis:
+    client = Redis()
+
+    @asynccontextmanager
+    async def get_connection():
+        yield client
+
+    monkeypatch.setattr(stream, "get_connection", get_connection)
+    return client
+
+
+async def test_create_many_in_one_pipeline(redis: Redis):
+    repository = StreamRepository(maxlen=100, compress_threshold=64)
+    bids = [
+        models.CreateBidCommand(bid_name="short"),
+        models.CreateBidCommand(bid_name="long" * 50),
+    ]
+
+    await repository.create_many(bids, routing_key="bids")
+
+    assert redis.pipelines == 1
+    assert redis.trims == [(100, True), (100, True)]
+    [short, long] = redis.entries["bids"]
+    assert b"content_encoding" not in short[1]
+    assert long[1][b"content_encoding"] == b"deflate"
+    assert [
+        repository.parse_fields(fields, models.CreateBidCommand)
+        for _, fields in redis.entries["bids"]
+    ] == bids
+
+
+async def test_read_group(redis: Redis):
+    repository = StreamRepository(maxlen=100)
+    assert await repository.read_group("bids", "group", "consumer", 10, None) == []
+
+    await repository.create(models.CreateBidCommand(bid_name="bid"), "bids")
+    [(entry_id, fields)] = await repository.read_group(
+        "bids",
+        "group",
+        "consumer",
+        10,
+        None,
+    )
+
+    assert entry_id == b"0-0"
+    assert repository.parse_fields(fields, models.CreateBidCommand).bid_name == "bid"
+
+
+async def test_claim_skips_trimmed_entries(redis: Redis):
+    repository = StreamRepository(maxlen=100)
+    await repository.create(models.CreateBidCommand(bid_name="bid"), "bids")
+
+    entries = await repository.claim("bids", "group", "consumer", 1000, 10)
+
+    assert [fields is not None for _, fields in entries] == [True]
+
+
+async def test_create_existing_group(redis: Redis):
+    repository = StreamRepository(maxlen=100)
+
+    redis.group_error = "BUSYGROUP Consumer Group name already exists"
+    await repository.create_group("bids", "group")
+
+    redis.group_error = "WRONGTYPE Operation against a key"
+    with pytest.raises(ResponseError):
+        await repository.create_group("bids", "group")
+
+
+def test_parse_malformed_fields():
+    with pytest.raises(KeyError):
+        StreamRepository.parse_fields({}, models.CreateBidCommand)
@@ -0,0 +1,82 @@
+"""Testing bid routes."""
+
+from typing import List
+
+import httpx
+import pytest
+from dependency_injector import providers
+from fastapi import FastAPI
+
+from app.internal.routes.v1 import bid
+from app.internal.services import Services
+from app.pkg.models import v1 as models
+from app.pkg.settings import settings
+
+
+class BidService:
+    def __init__(self):
+        self.batches: List[List[models.CreateBidCommand]] = []
+
+    async def create_bids(self, cmds: List[models.CreateBidCommand]) -> None:
+        self.batches.append(cmds)
+
+    async def read_bid_status(
+        self,
+        query: models.ReadBidStatusQuery,
+    ) -> models.BidStatus:
+        return models.BidStatus(bid_name=query.bid_name, status="accepted")
+
+
+@pytest.fixture()
+def bid_service() -> BidService:
+    service = BidService()
+    container = Services()
+    container.v1.bid_service.override(providers.Object(service))
+    container.wire(modules=[bid])
+    yield service
+    container.unwire()
+
+
+@pytest.fixture()
+async def client(bid_service):
+    app = FastAPI()
+    app.include_router(bid.router)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://api") as http:
+        yield http
+
+
+async def test_create_bids(client, bid_service: BidService):
+    response = await client.post(
+        "/bid/batch",
+        json=[{"bid_name": "first"}, {"bid_name": "second"}],
+    )
+
+    assert response.status_code == 204
+    assert bid_service.batches == [
+        [
+            models.CreateBidCommand(bid_name="first"),
+            models.CreateBidCommand(bid_name="second"),
+        ],
+    ]
+
+
+@pytest.mark.parametrize(
+    "size",
+    [0, settings.API.BID_BATCH_MAX_SIZE + 1],
+)
+async def test_create_bids_out_of_bounds(client, bid_service: BidService, size):
+    response = await client.post(
+        "/bid/batch",
+        json=[{"bid_name": "bid"}] * size,
+    )
+
+    assert response.status_code == 422
+    assert bid_service.batches == []
+
+
+async def test_read_bid_status(client):
+    response = await client.get("/bid/status/bid")
+
+    assert response.status_code == 200
+    assert response.json() == {"bid_name": "bid", "status": "accepted"}
@@ -0,0 +1,49 @@
+"""Testing the :class:`ConsumerMetrics`."""
+
+import pytest
+
+from app.internal.workers.metrics import BUCKETS_MS, ConsumerMetrics
+
+
+@pytest.fixture()
+def metrics() -> ConsumerMetrics:
+    return ConsumerMetrics("bids", concurrency=4)
+
+
+def test_counters(metrics: ConsumerMetrics):
+    metrics.delivered(3)
+    metrics.ack(2)
+    metrics.nack()
+
+    snapshot = metrics.snapshot(depth=10)
+
+    assert (snapshot.consumed, snapshot.acked, snapshot.nacked) == (3, 2, 1)
+    assert snapshot.depth == 10
+    assert snapshot.concurrency == 4
+
+
+def test_track_counts_in_flight(metrics: ConsumerMetrics):
+    with metrics.track():
+        assert metrics.snapshot().in_flight == 1
+
+    assert metrics.snapshot().in_flight == 0
+    assert metrics.snapshot().processing_time_buckets["+Inf"] == 1
+
+
+def test_track_failed_callback(metrics: ConsumerMetrics):
+    with pytest.raises(RuntimeError):
+        with metrics.track():
+            raise RuntimeError
+
+    assert metrics.snapshot().in_flight == 0
+
+
+def test_histogram_is_cumulative(metrics: ConsumerMetrics):
+    metrics.observe(1)
+    metrics.observe(BUCKETS_MS[-1] + 1)
+
+    buckets = metrics.snapshot().processing_time_buckets
+
+    assert buckets[str(BUCKETS_MS[0])] == 1
+    assert buckets[str(BUCKETS_MS[-1])] == 1
+    assert buckets["+Inf"] == 2
@@ -0,0 +1,235 @@
+"""Testing the :class:`RabbitMQConsumer`."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.internal.repository.v1.rabbitmq.rpc import REPLY_TO
+from app.internal.workers import rabbitmq_consumer
+from app.internal.workers.rabbitmq_consumer import RabbitMQConsumer
+from app.internal.workers.retry import ATTEMPTS_HEADER
+from app.pkg.codec import CONTENT_TYPE_JSON, decode_message, encode_message
+from app.pkg.models import v1 as models
+
+
+class Exchange:
+    def __init__(self):
+        self.published = []
+        self.replies = []
+
+    async def publish(self, message, routing_key):
+        if message.correlation_id:
+            self.replies.append((routing_key, message))
+            return
+        self.published.append((routing_key, message.headers))
+
+
+class Queue:
+    def __init__(self):
+        self.messages = asyncio.Queue()
+
+    def iterator(self):
+        return self
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return None
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        return await self.messages.get()
+
+
+class Channel:
+    def __init__(self):
+        self.default_exchange = Exchange()
+        self.queue = Queue()
+        self.is_closed = False
+
+    async def set_qos(self, prefetch_count):
+        return None
+
+    async def declare_queue(self, name, durable, arguments=None):
+        return self.queue
+
+    async def close(self):
+        self.is_closed = True
+
+
+class Connection:
+    def __init__(self, channel: Channel):
+        self._channel = channel
+
+    async def channel(self):
+        return self._channel
+
+
+class Message:
+    def __init__(self, bid_name: str, reply_to=None):
+        self.body, self.content_encoding = encode_message(
+            models.CreateBidCommand(bid_name=bid_name),
+        )
+        self.headers = {}
+        self.content_type = CONTENT_TYPE_JSON
+        self.reply_to = reply_to
+        self.correlation_id = "correlation" if reply_to else None
+        self.message_id = self.correlation_id
+        self.priority = None
+        self.expiration = None
+        self.acked = asyncio.Event()
+
+        self.multiple = False
+
+    async def ack(self, multiple=False):
+        self.multiple = multiple
+        self.acked.set()
+
+
+@pytest.fixture()
+def channel(monkeypatch) -> Channel:
+    channel = Channel()
+
+    @asynccontextmanager
+    async def get_consumer_connection():
+        yield Connection(channel)
+
+    monkeypatch.setattr(
+        rabbitmq_consumer,
+        "get_consumer_connection",
+        get_consumer_connection,
+    )
+    return channel
+
+
+async def unused(cmd):
+    raise AssertionError(cmd)
+
+
+@asynccontextmanager
+async def consuming(callback, concurrency=1, batch_callback=None, batch_size=None):
+    consumer = RabbitMQConsumer(
+        models.ConsumerQueueData(
+            queue_name="bids",
+            queue_callback=callback,
+            queue_batch_callback=batch_callback,
+            queue_incoming_model=models.CreateBidCommand,
+            concurrency=concurrency,
+            max_attempts=3,
+            batch_size=batch_size,
+            batch_timeout_ms=10,
+        ),
+    )
+    task = asyncio.create_task(consumer.consume())
+    try:
+        yield consumer
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_ack_processed_message(channel: Channel):
+    received = []
+
+    async def callback(cmd):
+        received.append(cmd.bid_name)
+
+    message = Message("bid")
+    async with consuming(callback) as consumer:
+        await channel.queue.messages.put(message)
+        await asyncio.wait_for(message.acked.wait(), timeout=1)
+
+    assert received == ["bid"]
+    assert channel.default_exchange.published == []
+    assert consumer.metrics.acked == 1
+
+
+async def test_retry_failed_message(channel: Channel):
+    async def callback(cmd):
+        raise RuntimeError(cmd.bid_name)
+
+    message = Message("bid")
+    async with consuming(callback):
+        await channel.queue.messages.put(message)
+        await asyncio.wait_for(message.acked.wait(), timeout=1)
+
+    assert channel.default_exchange.published == [
+        ("bids.retry.1", {ATTEMPTS_HEADER: 1}),
+    ]
+
+
+async def test_slow_message_does_not_block_others(channel: Channel):
+    release = asyncio.Event()
+
+    async def callback(cmd):
+        if cmd.bid_name == "slow":
+            await release.wait()
+
+    slow, fast = Message("slow"), Message("fast")
+    async with consuming(callback, concurrency=2):
+        await channel.queue.messages.put(slow)
+        await channel.queue.messages.put(fast)
+        await asyncio.wait_for(fast.acked.wait(), timeout=1)
+
+        assert not slow.acked.is_set()
+        release.set()
+        await asyncio.wait_for(slow.acked.wait(), timeout=1)
+
+
+async def test_ack_batch_with_one_multi_ack(channel: Channel):
+    batches = []
+
+    async def batch_callback(cmds):
+        batches.append([cmd.bid_name for cmd in cmds])
+
+    messages = [Message("first"), Message("second"), Message("third")]
+    async with consuming(callback=unused, batch_callback=batch_callback, batch_size=2):
+        for message in messages:
+            await channel.queue.messages.put(message)
+        await asyncio.wait_for(messages[-1].acked.wait(), timeout=1)
+
+    assert batches == [["first", "second"], ["third"]]
+    assert [message.acked.is_set() for message in messages] == [False, True, True]
+    assert messages[1].multiple
+
+
+async def test_retry_failed_batch(channel: Channel):
+    async def batch_callback(cmds):
+        raise RuntimeError(len(cmds))
+
+    messages = [Message("first"), Message("second")]
+    async with consuming(callback=unused, batch_callback=batch_callback, batch_size=2):
+        for message in messages:
+            await channel.queue.messages.put(message)
+        for message in messages:
+            await asyncio.wait_for(message.acked.wait(), timeout=1)
+
+    assert channel.default_exchange.published == [
+        ("bids.retry.1", {ATTEMPTS_HEADER: 1}),
+        ("bids.retry.1", {ATTEMPTS_HEADER: 1}),
+    ]
+    assert not any(message.multiple for message in messages)
+
+
+async def test_reply_to_rpc_request(channel: Channel):
+    async def callback(query):
+        return models.BidStatus(bid_name=query.bid_name, status="accepted")
+
+    message = Message("bid", reply_to=REPLY_TO)
+    async with consuming(callback):
+        await channel.queue.messages.put(message)
+        await asyncio.wait_for(message.acked.wait(), timeout=1)
+
+    [(routing_key, reply)] = channel.default_exchange.replies
+    assert routing_key == REPLY_TO
+    assert reply.correlation_id == "correlation"
+    assert decode_message(
+        reply.body,
+        models.BidStatus,
+        content_type=reply.content_type,
+        content_encoding=reply.content_encoding,
+    ) == models.BidStatus(bid_name="bid", status="accepted")
@@ -0,0 +1,258 @@
+"""Testing the :class:`StreamConsumer`."""
+
+import asyncio
+from contextlib import asynccontextmanager
+
+import pytest
+
+from app.internal.repository.v1.redis.stream import StreamRepository
+from app.internal.workers.redis_stream import StreamConsumer
+from app.pkg.models import v1 as models
+
+
+def entry(entry_id: bytes, bid_name: str):
+    fields = StreamRepository(maxlen=100)._build_fields(
+        models.CreateBidCommand(bid_name=bid_name),
+    )
+    return entry_id, {
+        key.encode(): value.encode() if isinstance(value, str) else value
+        for key, value in fields.items()
+    }
+
+
+class Repository:
+    """Stream with pending entries of one consumer group."""
+
+    parse_fields = staticmethod(StreamRepository.parse_fields)
+
+    def __init__(self):
+        self.new = asyncio.Queue()
+        self.pending: dict[bytes, tuple] = {}
+        self.times_delivered: dict[bytes, int] = {}
+        self.claimable: list[bytes] = []
+        self.acked: list[bytes] = []
+        self.dead: list[bytes] = []
+
+    async def create_group(self, stream, group):
+        return None
+
+    async def claim(self, stream, group, consumer, min_idle_time, count):
+        claimed, self.claimable = self.claimable[:count], self.claimable[count:]
+        for entry_id in claimed:
+            self.times_delivered[entry_id] += 1
+        return [self.pending[entry_id] for entry_id in claimed]
+
+    async def read_group(self, stream, group, consumer, count, block):
+        try:
+            read = [await asyncio.wait_for(self.new.get(), timeout=0.01)]
+        except asyncio.TimeoutError:
+            return []
+        while len(read) < count and not self.new.empty():
+            read.append(self.new.get_nowait())
+        for new in read:
+            self.pending[new[0]] = new
+            self.times_delivered[new[0]] = 1
+        return read
+
+    async def deliveries(self, stream, group, *entry_ids):
+        return [self.times_delivered.get(entry_id, 0) for entry_id in entry_ids]
+
+    async def dead_letter(self, stream, group, entries):
+        for entry_id, _ in entries:
+            self.pending.pop(entry_id)
+            self.dead.append(entry_id)
+
+    async def ack(self, stream, group, *entry_ids):
+        for entry_id in entry_ids:
+            self.pending.pop(entry_id)
+            self.acked.append(entry_id)
+
+    @staticmethod
+    async def wait(condition):
+        async def poll():
+            while not condition():
+                await asyncio.sleep(0)
+
+        await asyncio.wait_for(poll(), timeout=1)
+
+
+@pytest.fixture()
+def repository() -> Repository:
+    return Repository()
+
+
+async def unused(cmd):
+    raise AssertionError(cmd)
+
+
+@asynccontextmanager
+async def consuming(
+    repository,
+    callback,
+    concurrency=1,
+    batch_callback=None,
+    batch_size=None,
+):
+    consumer = StreamConsumer(
+        repository=repository,
+        queue=models.ConsumerQueueData(
+            queue_name="bids",
+            queue_callback=callback,
+            queue_batch_callback=batch_callback,
+            queue_incoming_model=models.CreateBidCommand,
+            concurrency=concurrency,
+            max_attempts=2,
+            batch_size=batch_size,
+        ),
+        group="workers",
+        batch_size=10,
+        block_ms=10,
+        claim_idle_ms=10,
+    )
+    task = asyncio.create_task(consumer.consume())
+    try:
+        yield consumer
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+
+async def test_ack_processed_entry(repository: Repository):
+    received = []
+
+    async def callback(cmd):
+        received.append(cmd.bid_name)
+
+    async with consuming(repository, callback) as consumer:
+        await repository.new.put(entry(b"1-0", "bid"))
+        await repository.wait(lambda: repository.acked)
+
+    assert received == ["bid"]
+    assert repository.pending == {}
+    assert consumer.metrics.acked == 1
+
+
+async def test_retry_claimed_entry(repository: Repository):
+    attempts = []
+
+    async def callback(cmd):
+        attempts.append(cmd.bid_name)
+        if len(attempts) == 1:
+            raise RuntimeError(cmd.bid_name)
+
+    async with consuming(repository, callback) as consumer:
+        await repository.new.put(entry(b"1-0", "bid"))
+        await repository.wait(lambda: consumer.metrics.nacked == 1)
+        repository.claimable.append(b"1-0")
+        await repository.wait(lambda: repository.acked)
+
+    assert attempts == ["bid", "bid"]
+    assert repository.acked == [b"1-0"]
+
+
+async def test_dead_letter_exhausted_entry(repository: Repository):
+    attempts = []
+
+    async def callback(cmd):
+        attempts.append(cmd.bid_name)
+        raise RuntimeError(cmd.bid_name)
+
+    async with consuming(repository, callback) as consumer:
+        await repository.new.put(entry(b"1-0", "bid"))
+        for count in (1, 2):
+            await repository.wait(lambda: consumer.metrics.nacked == count)
+            repository.claimable.append(b"1-0")
+        await repository.wait(lambda: repository.dead)
+
+    assert attempts == ["bid", "bid"]
+    assert repository.dead == [b"1-0"]
+    assert repository.acked == []
+    assert consumer.metrics.nacked == 3
+
+
+async def test_slow_entry_does_not_block_others(repository: Repository):
+    release = asyncio.Event()
+
+    async def callback(cmd):
+        if cmd.bid_name == "slow":
+            await release.wait()
+
+    async with consuming(repository, callback, concurrency=2):
+        await repository.new.put(entry(b"1-0", "slow"))
+        await repository.new.put(entry(b"2-0", "fast"))
+        await repository.new.put(entry(b"3-0", "next"))
+        await repository.wait(lambda: len(repository.acked) == 2)
+
+        assert repository.acked == [b"2-0", b"3-0"]
+        release.set()
+        await repository.wait(lambda: len(repository.acked) == 3)
+
+
+async def test_in_flight_entry_is_not_claimed(repository: Repository):
+    release = asyncio.Event()
+    attempts = []
+
+    async def callback(cmd):
+        attempts.append(cmd.bid_name)
+        await release.wait()
+
+    async with consuming(repository, callback, concurrency=2):
+        await repository.new.put(entry(b"1-0", "slow"))
+        await repository.wait(lambda: attempts)
+        repository.claimable.append(b"1-0")
+        while repository.claimable:
+            await asyncio.sleep(0)
+        release.set()
+        await repository.wait(lambda: repository.acked)
+
+    assert attempts == ["slow"]
+
+
+async def test_batch_of_one_read(repository: Repository):
+    batches = []
+
+    async def batch_callback(cmds):
+        batches.append([cmd.bid_name for cmd in cmds])
+
+    for entry_id, bid_name in ((b"1-0", "first"), (b"2-0", "second")):
+        repository.new.put_nowait(entry(entry_id, bid_name))
+    async with consuming(
+        repository,
+        callback=unused,
+        batch_callback=batch_callback,
+        batch_size=10,
+    ):
+        await repository.wait(lambda: len(repository.acked) == 2)
+
+    assert batches == [["first", "second"]]
+
+
+async def test_dead_letter_malformed_entry(repository: Repository):
+    async with consuming(repository, unused) as consumer:
+        await repository.new.put((b"1-0", {b"junk": b"1"}))
+        await repository.wait(lambda: repository.dead)
+
+    assert repository.dead == [b"1-0"]
+    assert repository.acked == []
+    assert consumer.metrics.nacked == 1
+
+
+async def test_dead_letter_malformed_entry_of_batch(repository: Repository):
+    batches = []
+
+    async def batch_callback(cmds):
+        batches.append([cmd.bid_name for cmd in cmds])
+
+    repository.new.put_nowait(entry(b"1-0", "first"))
+    repository.new.put_nowait((b"2-0", {b"junk": b"1"}))
+    async with consuming(
+        repository,
+        callback=unused,
+        batch_callback=batch_callback,
+        batch_size=10,
+    ):
+        await repository.wait(lambda: repository.acked and repository.dead)
+
+    assert batches == [["first"]]
+    assert repository.acked == [b"1-0"]
+    assert repository.dead == [b"2-0"]
@@ -0,0 +1,133 @@
+"""Testing the :class:`RetryTopology`."""
+
+import pytest
+
+from app.internal.workers.retry import ATTEMPTS_HEADER, ERROR_HEADER, RetryTopology
+from app.pkg.models import v1 as models
+
+
+class Exchange:
+    def __init__(self):
+        self.published = []
+        self.messages = []
+
+    async def publish(self, message, routing_key):
+        self.published.append((routing_key, message.headers))
+        self.messages.append(message)
+
+
+class Channel:
+    def __init__(self):
+        self.default_exchange = Exchange()
+        self.declared = {}
+
+    async def declare_queue(self, name, durable, arguments=None):
+        self.declared[name] = arguments
+
+
+class Message:
+    def __init__(self, headers):
+        self.headers = headers
+        self.body = b"{}"
+        self.content_type = None
+        self.content_encoding = None
+        self.priority = None
+        self.correlation_id = None
+        self.reply_to = None
+        self.expiration = None
+        self.message_id = None
+        self.acked = False
+
+    async def ack(self):
+        self.acked = True
+
+
+async def callback(cmd):
+    _ = cmd
+
+
+@pytest.fixture()
+def topology() -> RetryTopology:
+    return RetryTopology(
+        models.ConsumerQueueData(
+            queue_name="bids",
+            queue_callback=callback,
+            queue_incoming_model=models.CreateBidCommand,
+            max_attempts=3,
+            retry_delay_ms=100,
+        ),
+    )
+
+
+async def test_declare(topology: RetryTopology):
+    channel = Channel()
+
+    await topology.declare(channel)
+
+    assert channel.declared == {
+        "bids.retry.1": {
+            "x-message-ttl": 100,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "bids",
+        },
+        "bids.retry.2": {
+            "x-message-ttl": 200,
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": "bids",
+        },
+        "bids.dlq": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "attempts,routing_key",
+    [(0, "bids.retry.1"), (1, "bids.retry.2"), (2, "bids.dlq")],
+)
+async def test_retry(topology: RetryTopology, attempts: int, routing_key: str):
+    channel = Channel()
+    message = Message({ATTEMPTS_HEADER: attempts})
+
+    await topology.retry(channel, message, RuntimeError("failed"))
+
+    assert message.acked
+    [(published_to, headers)] = channel.default_exchange.published
+    assert published_to == routing_key
+    assert headers[ATTEMPTS_HEADER] == attempts + 1
+
+
+async def test_retry_malformed_message(topology: RetryTopology):
+    channel = Channel()
+    message = Message({})
+
+    await topology.retry(channel, message)
+
+    [(published_to, headers)] = channel.default_exchange.published
+    assert published_to == "bids.dlq"
+    assert ERROR_HEADER in headers
+
+
+@pytest.mark.parametrize(
+    "attempts,expiration",
+    [(0, 5.0), (2, None)],
+)
+async def test_retry_keeps_rpc_properties(
+    topology: RetryTopology,
+    attempts: int,
+    expiration: float | None,
+):
+    channel = Channel()
+    message = Message({ATTEMPTS_HEADER: attempts})
+    message.correlation_id = "correlation"
+    message.reply_to = "amq.rabbitmq.reply-to"
+    message.message_id = "correlation"
+    message.priority = 5
+    message.expiration = 5.0
+
+    await topology.retry(channel, message, RuntimeError("failed"))
+
+    [published] = channel.default_exchange.messages
+    assert published.correlation_id == "correlation"
+    assert published.reply_to == "amq.rabbitmq.reply-to"
+    assert published.message_id == "correlation"
+    assert published.priority == 5
+    assert published.expiration == expiration
@@ -0,0 +1,51 @@
+"""Testing the :class:`Worker`."""
+
+import asyncio
+
+import pytest
+
+from app.internal.workers import worker
+from app.internal.workers.worker import Worker
+from app.pkg.models import v1 as models
+
+
+async def unused(cmd):
+    raise AssertionError(cmd)
+
+
+class Consumer:
+    """Consumer whose consume loop ends at once, as on broker cancel."""
+
+    started = 0
+
+    def __init__(self, queue, metrics):
+        self.queue = queue
+
+    async def consume(self) -> None:
+        Consumer.started += 1
+
+
+async def test_restart_stopped_consumer_after_delay(monkeypatch):
+    delays = []
+
+    async def sleep(delay):
+        delays.append(delay)
+        if len(delays) == 2:
+            raise asyncio.CancelledError
+
+    monkeypatch.setattr(worker.asyncio, "sleep", sleep)
+    queue = models.ConsumerQueueData(
+        queue_name="bids",
+        queue_callback=unused,
+        queue_incoming_model=models.CreateBidCommand,
+    )
+
+    with pytest.raises(asyncio.CancelledError):
+        await Worker(
+            queues=[queue],
+            rabbitmq_consumer=Consumer,
+            stream_consumer=Consumer,
+        ).task()
+
+    assert Consumer.started == 2
+    assert delays == [1, 1]
@@ -0,0 +1,63 @@
+"""Tests for :class:`.PasswordHasher`."""
+
+import asyncio
+
+import bcrypt
+import pytest
+
+from app.pkg.async_helpers.password_hasher import PasswordHasher
+from app.pkg.models.types import EncryptedSecretBytes
+
+
+@pytest.fixture()
+def hasher():
+    hasher = PasswordHasher(rounds=4, concurrency=2)
+    yield hasher
+    hasher.close()
+
+
+async def test_hash_and_verify(hasher: PasswordHasher):
+    hashed = await hasher.hash(b"password")
+
+    assert bcrypt.checkpw(b"password", hashed)
+    assert await hasher.verify(b"password", hashed)
+    assert not await hasher.verify(b"another", hashed)
+
+    metrics = hasher.metrics()
+    assert metrics.hashed == 1
+    assert metrics.verified == 2
+    assert metrics.in_flight == 0
+    assert metrics.waiting == 0
+
+
+async def test_concurrency_cap(hasher: PasswordHasher, monkeypatch):
+    running, peak = 0, 0
+    original_hashpw = bcrypt.hashpw
+
+    def hashpw(password: bytes, salt: bytes) -> bytes:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        try:
+            return original_hashpw(password, salt)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(bcrypt, "hashpw", hashpw)
+    await asyncio.gather(*[hasher.hash(b"password") for _ in range(6)])
+
+    assert peak <= hasher.concurrency
+    assert hasher.metrics().hashed == 6
+
+
+async def test_failed_call(hasher: PasswordHasher):
+    with pytest.raises(ValueError):
+        await hasher.verify(b"password", b"not a hash")
+
+    assert hasher.metrics().failed == 1
+
+
+async def test_encrypted_secret_bytes():
+    value = EncryptedSecretBytes(b"password")
+
+    assert await value.verify(await value.encrypt())
@@ -0,0 +1,121 @@
+"""Testing the :class:`LocalCache` and :class:`TwoLayerCache`."""
+
+from typing import Iterable, Sequence
+
+from app.pkg.cache import LocalCache, TwoLayerCache
+
+
+class InMemoryStorage:
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+        self.tags: dict[str, set[str]] = {}
+        self.versions: dict[str, int] = {}
+
+    async def create(
+        self,
+        redis_key: str,
+        value: bytes,
+        tags: Iterable[str],
+        expire_time: int,
+        versions: Sequence[int] | None = None,
+    ) -> bool:
+        tags = tuple(tags)
+        if versions is not None and list(versions) != await self.read_versions(tags):
+            return False
+        self.values[redis_key] = value
+        for tag in tags:
+            self.tags.setdefault(tag, set()).add(redis_key)
+        return True
+
+    async def read(self, redis_key: str) -> bytes | None:
+        return self.values.get(redis_key)
+
+    async def read_versions(self, tags: Sequence[str]) -> list[int]:
+        return [self.versions.get(tag, 0) for tag in tags]
+
+    async def delete_by_tags(self, tags: Iterable[str]) -> None:
+        for tag in tags:
+            self.versions[tag] = self.versions.get(tag, 0) + 1
+            for key in self.tags.pop(tag, set()):
+                self.values.pop(key, None)
+
+
+async def test_local_cache_evicts_least_recently_used():
+    cache = LocalCache(max_size=2, ttl=60)
+    cache.set("a", b"1", ())
+    cache.set("b", b"2", ())
+    assert cache.get("a") == b"1"
+
+    cache.set("c", b"3", ())
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert cache.get("c") == b"3"
+
+
+async def test_local_cache_expires_values():
+    cache = LocalCache(max_size=2, ttl=0)
+    cache.set("a", b"1", ())
+
+    assert cache.get("a") is None
+
+
+async def test_local_cache_delete_by_tags():
+    cache = LocalCache(max_size=10, ttl=60)
+    cache.set("a", b"1", ("city",))
+    cache.set("b", b"2", ("country",))
+
+    cache.delete_by_tags(("city",))
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+
+
+async def test_two_layer_cache_reads_shared_layer_with_tags():
+    storage = InMemoryStorage()
+    writer = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+    reader = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+
+    await writer.set("a", b"1\n2", tags=("city", "country"), ttl=60)
+
+    assert await reader.get("a") == b"1\n2"
+
+    reader.local.delete_by_tags(("country",))
+    assert reader.local.get("a") is None
+
+
+async def test_two_layer_cache_invalidate():
+    storage = InMemoryStorage()
+    cache = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+    await cache.set("a", b"1", tags=("city",), ttl=60)
+    await cache.set("b", b"2", tags=("country",), ttl=60)
+
+    await cache.invalidate("city")
+
+    assert await cache.get("a") is None
+    assert await cache.get("b") == b"2"
+
+
+async def test_two_layer_cache_skips_value_built_before_invalidation():
+    storage = InMemoryStorage()
+    cache = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+
+    versions = await cache.versions(("city",))
+    await cache.invalidate("city")
+    is_stored = await cache.set("a", b"stale", ("city",), ttl=60, versions=versions)
+
+    assert not is_stored
+    assert await cache.get("a") is None
+
+
+async def test_two_layer_cache_skips_value_after_write_of_other_process():
+    storage = InMemoryStorage()
+    cache = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+    writer = TwoLayerCache(LocalCache(max_size=10, ttl=60), storage)
+
+    versions = await cache.versions(("city",))
+    await writer.invalidate("city")
+
+    assert not await cache.set("a", b"stale", ("city",), ttl=60, versions=versions)
+    assert cache.local.get("a") is None
+    assert "a" not in storage.values
@@ -0,0 +1,248 @@
+"""Tests for pooled HTTP client of :class:`.BaseClient`."""
+
+import asyncio
+import json
+
+import httpx
+import pydantic
+import pytest
+
+from app.pkg.clients.base_clients import BaseClient
+from app.pkg.clients.hedging import HedgePolicy
+from app.pkg.clients.http_cache import HTTPCachePolicy
+from app.pkg.clients.resource import HTTPClientResource
+from app.pkg.clients.retry import RetryPolicy
+from app.pkg.models.v1.exceptions.base import NotFoundError
+from app.pkg.models.v1.exceptions.client import (
+    BaseExceptionFromClient,
+    BulkheadFull,
+    CircuitOpen,
+)
+
+
+class SomeClient(BaseClient):
+    token = pydantic.SecretStr("token")
+    url = "http://service"
+
+
+def json_response(status_code: int, body: dict) -> httpx.Response:
+    # Streamed body, so httpx measures ``elapsed`` as for a real server.
+    return httpx.Response(
+        status_code,
+        headers={"Content-Type": "application/json"},
+        stream=httpx.ByteStream(json.dumps(body).encode()),
+    )
+
+
+def handler(request: httpx.Request) -> httpx.Response:
+    if request.url.path == "/missing/":
+        return json_response(404, {"detail": "missing"})
+    return json_response(200, {"token": request.headers["X-ACCESS-TOKEN"]})
+
+
+@pytest.fixture()
+async def http_client():
+    resource = HTTPClientResource()
+    client = await resource.init(
+        client_name="some",
+        max_connections=10,
+        max_keepalive_connections=5,
+        keepalive_expiry=5.0,
+        http2=False,
+        connect_timeout=1.0,
+        read_timeout=1.0,
+        write_timeout=1.0,
+        pool_timeout=1.0,
+        transport=httpx.MockTransport(handler),
+    )
+    yield client
+    await resource.shutdown(client)
+    assert client.is_closed
+
+
+async def test_request_through_shared_client(http_client: httpx.AsyncClient):
+    client = SomeClient(http_client=http_client)
+
+    first = await client.do_request("GET", "/first/")
+    second = await client.do_request("GET", "/second/")
+
+    assert first.json() == second.json() == {"token": "token"}
+    assert not http_client.is_closed
+    assert http_client.timeout.read == 1.0
+
+
+async def test_error_response(http_client: httpx.AsyncClient):
+    client = SomeClient(http_client=http_client)
+
+    with pytest.raises(NotFoundError):
+        await client.do_request("GET", "/missing/")
+
+
+async def test_retry_idempotent_request():
+    statuses = iter([503, 502, 200])
+
+    def flaky(request: httpx.Request) -> httpx.Response:
+        return json_response(next(statuses), {"method": request.method})
+
+    class FlakyClient(SomeClient):
+        retry_policy = RetryPolicy(attempts=3, base_delay_ms=1, max_delay_ms=1)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(flaky)) as http:
+        response = await FlakyClient(http_client=http).do_request("GET", "/")
+
+    assert response.json() == {"method": "GET"}
+
+
+async def test_no_retry_of_non_idempotent_request():
+    calls = 0
+
+    def unavailable(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        return json_response(503, {})
+
+    class UnavailableClient(SomeClient):
+        retry_policy = RetryPolicy(attempts=3, base_delay_ms=1, max_delay_ms=1)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(unavailable)) as http:
+        with pytest.raises(BaseExceptionFromClient):
+            await UnavailableClient(http_client=http).do_request("POST", "/")
+
+    assert calls == 1
+
+
+async def test_open_circuit_fails_fast():
+    calls = 0
+
+    def down(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        raise httpx.ConnectError("down", request=request)
+
+    class DownClient(SomeClient):
+        retry_policy = RetryPolicy(attempts=1)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(down)) as http:
+        client = DownClient(http_client=http)
+        client.circuit_breaker.min_calls = 2
+        for _ in range(2):
+            with pytest.raises(BaseExceptionFromClient):
+                await client.do_request("GET", "/")
+        with pytest.raises(CircuitOpen):
+            await client.do_request("GET", "/")
+
+    assert calls == 2
+
+
+async def test_hedged_get():
+    calls = 0
+
+    async def slow_first(request: httpx.Request) -> httpx.Response:
+        nonlocal calls
+        calls += 1
+        if calls == 1:
+            await asyncio.sleep(1)
+        return json_response(200, {"call": calls})
+
+    class HedgedClient(SomeClient):
+        hedge_policy = HedgePolicy(
+            percentile=0.5,
+            budget_ratio=1.0,
+            min_samples=1,
+            window=10,
+        )
+
+    transport = httpx.MockTransport(slow_first)
+    async with httpx.AsyncClient(transport=transport) as http:
+        client = HedgedClient(http_client=http)
+        # Fast sample of the path, so the slow request is hedged.
+        calls = 1
+        await client.do_request("GET", "/")
+
+        calls = 0
+        response = await asyncio.wait_for(client.do_request("GET", "/"), 0.5)
+
+    assert response.json() == {"call": 2}
+    assert client.hedger.hedged == 1
+
+
+async def test_cached_get():
+    calls = []
+
+    def reference(request: httpx.Request) -> httpx.Response:
+        calls.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(
+                304,
+                headers={"ETag": '"v1"'},
+                stream=httpx.ByteStream(b""),
+            )
+        return httpx.Response(
+            200,
+            headers={"ETag": '"v1"', "Cache-Control": "max-age=0"},
+            stream=httpx.ByteStream(b'{"code": "RU"}'),
+        )
+
+    class CachedClient(SomeClient):
+        cache_policy = HTTPCachePolicy()
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(reference)) as http:
+        client = CachedClient(http_client=http)
+        first = await client.do_request("GET", "/countries/")
+        second = await client.do_request("GET", "/countries/")
+
+    assert first.json() == second.json() == {"code": "RU"}
+    assert calls == [None, '"v1"']
+    assert client.http_cache.revalidated == 1
+
+
+async def test_bulkhead_rejects_requests_of_slow_client():
+    release = asyncio.Event()
+
+    async def slow(request: httpx.Request) -> httpx.Response:
+        await release.wait()
+        return json_response(200, {})
+
+    class SlowClient(SomeClient):
+        retry_policy = RetryPolicy(attempts=1)
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(slow)) as http:
+        client = SlowClient(http_client=http)
+        client.bulkhead.max_queue = 0
+        running = [
+            asyncio.create_task(client.do_request("GET", "/"))
+            for _ in range(client.bulkhead.max_concurrent)
+        ]
+        await asyncio.sleep(0)
+
+        with pytest.raises(BulkheadFull):
+            await client.do_request("GET", "/")
+
+        release.set()
+        await asyncio.gather(*running)
+
+    assert client.bulkhead.snapshot().in_flight == 0
+
+
+async def test_warn_once_without_pooled_client(monkeypatch, caplog):
+    mocked = httpx.AsyncClient
+
+    class UnpooledClient(SomeClient): ...
+
+    monkeypatch.setattr(
+        httpx,
+        "AsyncClient",
+        lambda: mocked(transport=httpx.MockTransport(handler)),
+    )
+    client = UnpooledClient()
+
+    for _ in range(2):
+        response = await client.do_request("GET", "/")
+        assert response.json() == {"token": "token"}
+
+    warnings = [
+        record
+        for record in caplog.records
+        if record.levelname == "WARNING" and "UnpooledClient" in record.getMessage()
+    ]
+    assert len(warnings) == 1
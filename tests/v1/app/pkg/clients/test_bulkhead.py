@@ -0,0 +1,53 @@
+"""Tests for :class:`.Bulkhead`."""
+
+import asyncio
+
+import pytest
+
+from app.pkg.clients.bulkhead import Bulkhead
+from app.pkg.models.v1.exceptions.client import BulkheadFull
+
+
+async def test_waits_for_free_slot():
+    bulkhead = Bulkhead("wait", max_concurrent=1, max_queue=1, queue_timeout=1.0)
+    release = asyncio.Event()
+
+    async def hold():
+        async with bulkhead.acquire():
+            await release.wait()
+
+    holder = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+    waiter = asyncio.create_task(hold())
+    await asyncio.sleep(0)
+
+    state = bulkhead.snapshot()
+    assert (state.in_flight, state.waiting) == (1, 1)
+
+    release.set()
+    await asyncio.gather(holder, waiter)
+    state = bulkhead.snapshot()
+    assert (state.in_flight, state.waiting, state.rejected) == (0, 0, 0)
+
+
+async def test_rejects_over_queue():
+    bulkhead = Bulkhead("full", max_concurrent=1, max_queue=0, queue_timeout=1.0)
+
+    async with bulkhead.acquire():
+        with pytest.raises(BulkheadFull):
+            async with bulkhead.acquire():
+                pass
+
+    assert bulkhead.snapshot().rejected == 1
+
+
+async def test_rejects_after_queue_timeout():
+    bulkhead = Bulkhead("slow", max_concurrent=1, max_queue=1, queue_timeout=0.01)
+
+    async with bulkhead.acquire():
+        with pytest.raises(BulkheadFull):
+            async with bulkhead.acquire():
+                pass
+
+    state = bulkhead.snapshot()
+    assert (state.in_flight, state.waiting, state.rejected) == (0, 0, 1)
@@ -0,0 +1,78 @@
+"""Tests for :class:`.CircuitBreaker`."""
+
+import pytest
+
+from app.pkg.clients.circuit_breaker import CircuitBreaker
+from app.pkg.models.v1.app.circuit_breaker import CircuitStateEnum
+from app.pkg.models.v1.exceptions.client import CircuitOpen
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture()
+def clock() -> Clock:
+    return Clock()
+
+
+@pytest.fixture()
+def breaker(clock: Clock) -> CircuitBreaker:
+    return CircuitBreaker(
+        name="test",
+        failure_ratio=0.5,
+        min_calls=4,
+        window_seconds=10,
+        open_seconds=5,
+        half_open_calls=1,
+        clock=clock,
+    )
+
+
+def fail(breaker: CircuitBreaker, count: int, success: bool = False) -> None:
+    for _ in range(count):
+        breaker.check()
+        breaker.record(success=success)
+
+
+async def test_opens_on_failure_ratio(breaker: CircuitBreaker):
+    fail(breaker, 2, success=True)
+    fail(breaker, 1)
+    assert breaker.state == CircuitStateEnum.CLOSED
+
+    fail(breaker, 1)
+    assert breaker.state == CircuitStateEnum.OPEN
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+
+async def test_old_failures_leave_window(breaker: CircuitBreaker, clock: Clock):
+    fail(breaker, 3)
+    clock.now = 11
+    fail(breaker, 1)
+
+    assert breaker.state == CircuitStateEnum.CLOSED
+    assert breaker.snapshot().calls == 1
+
+
+async def test_half_open(breaker: CircuitBreaker, clock: Clock):
+    fail(breaker, 4)
+    clock.now = 5
+
+    assert breaker.state == CircuitStateEnum.HALF_OPEN
+    breaker.check()
+    with pytest.raises(CircuitOpen):
+        breaker.check()
+
+    breaker.record(success=False)
+    assert breaker.state == CircuitStateEnum.OPEN
+
+    clock.now = 10
+    breaker.check()
+    breaker.record(success=True)
+    assert breaker.state == CircuitStateEnum.CLOSED
+    assert breaker.snapshot().failures == 0
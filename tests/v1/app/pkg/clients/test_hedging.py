@@ -0,0 +1,96 @@
+"""Tests for :class:`.Hedger`."""
+
+import asyncio
+
+import httpx
+
+from app.pkg.clients.hedging import HedgePolicy, Hedger
+
+
+def build_send(delays: list[float]):
+    async def send() -> httpx.Response:
+        await asyncio.sleep(delays.pop(0))
+        return httpx.Response(200)
+
+    return send
+
+
+async def test_threshold_by_percentile():
+    hedger = Hedger("test", HedgePolicy(percentile=0.5, min_samples=3, window=10))
+
+    for _ in range(2):
+        await hedger.send("/", build_send([0]))
+    assert hedger.threshold("/") is None
+
+    await hedger.send("/", build_send([0.02]))
+    assert 0 <= hedger.threshold("/") < 0.02
+
+
+async def test_budget_limits_hedges():
+    hedger = Hedger(
+        "test",
+        HedgePolicy(percentile=0.0, budget_ratio=0.5, min_samples=1, window=10),
+    )
+    await hedger.send("/", build_send([0]))
+
+    for _ in range(4):
+        await hedger.send("/", build_send([0.01, 0]))
+
+    # Budget grows by half a hedge per request.
+    assert hedger.hedged == 2
+    assert hedger.requests == 5
+
+
+class Stream(httpx.AsyncByteStream):
+    """Body of the response which records that it was closed."""
+
+    def __init__(self):
+        self.closed = False
+
+    async def __aiter__(self):
+        yield b""
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+def hedged_policy() -> HedgePolicy:
+    return HedgePolicy(percentile=0.0, budget_ratio=1.0, min_samples=1, window=10)
+
+
+async def test_hedge_skips_failed_response():
+    hedger = Hedger("test", hedged_policy())
+    await hedger.send("/", build_send([0]))
+    streams = []
+
+    async def send() -> httpx.Response:
+        # The first request fails after the hedge is sent, the hedge succeeds.
+        calls, stream = len(streams), Stream()
+        streams.append(stream)
+        await asyncio.sleep([0.02, 0.05][calls])
+        return httpx.Response([503, 200][calls], stream=stream)
+
+    response = await hedger.send("/", send)
+
+    assert hedger.hedged == 1
+    assert response.status_code == 200
+    assert [stream.closed for stream in streams] == [True, False]
+
+
+async def test_hedge_closes_response_finished_in_same_round():
+    hedger = Hedger("test", hedged_policy())
+    await hedger.send("/", build_send([0]))
+    hedged, streams = asyncio.Event(), []
+
+    async def send() -> httpx.Response:
+        stream = Stream()
+        streams.append(stream)
+        if len(streams) == 2:
+            hedged.set()
+        await hedged.wait()
+        return httpx.Response(200, stream=stream)
+
+    response = await hedger.send("/", send)
+
+    assert response.stream is streams[0]
+    assert [stream.closed for stream in streams] == [False, True]
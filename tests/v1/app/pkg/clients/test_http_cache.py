@@ -0,0 +1,192 @@
+"""Tests for :class:`.HTTPCache`."""
+
+import datetime
+from typing import Iterable, Sequence
+
+import httpx
+
+from app.pkg.clients.http_cache import CachedResponse, HTTPCache, HTTPCachePolicy
+
+URL = "http://service/countries/"
+
+
+class Storage:
+    """Shared layer of the cache, e.g. redis."""
+
+    def __init__(self):
+        self.values: dict[str, bytes] = {}
+
+    async def create(
+        self,
+        redis_key: str,
+        value: bytes,
+        tags: Iterable[str],
+        expire_time: int,
+        versions: Sequence[int] | None = None,
+    ) -> bool:
+        self.values[redis_key] = value
+        return True
+
+    async def read(self, redis_key: str) -> bytes | None:
+        return self.values.get(redis_key)
+
+    async def read_versions(self, tags: Sequence[str]) -> list[int]:
+        return [0 for _ in tags]
+
+    async def delete_by_tags(self, tags: Iterable[str]) -> None:
+        self.values.clear()
+
+
+def server_response(status_code: int, headers: dict) -> httpx.Response:
+    response = httpx.Response(
+        status_code,
+        headers=headers,
+        stream=httpx.ByteStream(b'["RU"]' if status_code == 200 else b""),
+        request=httpx.Request("GET", URL),
+    )
+    # Set by ``httpx.AsyncClient`` when the response is closed.
+    response.elapsed = datetime.timedelta(milliseconds=5)
+    return response
+
+
+async def test_fresh_response_is_served():
+    cache = HTTPCache(name="fresh", policy=HTTPCachePolicy())
+    request = httpx.Request("GET", URL)
+
+    await cache.update(
+        request,
+        server_response(200, {"Cache-Control": "max-age=60"}),
+        cached=None,
+    )
+    cached = await cache.lookup(request)
+
+    assert cached.is_fresh
+    assert cached.to_response(request).content == b'["RU"]'
+    assert cache.hits == 1
+
+
+async def test_stale_response_is_revalidated():
+    cache = HTTPCache(name="stale", policy=HTTPCachePolicy())
+    request = httpx.Request("GET", URL)
+
+    await cache.update(
+        request,
+        server_response(200, {"ETag": '"v1"', "Cache-Control": "no-cache"}),
+        cached=None,
+    )
+    cached = await cache.lookup(request)
+    assert not cached.is_fresh
+    assert cached.validators() == {"If-None-Match": '"v1"'}
+
+    response = await cache.update(
+        request,
+        server_response(304, {"ETag": '"v1"', "Cache-Control": "max-age=60"}),
+        cached=cached,
+    )
+
+    assert response.status_code == 200
+    assert response.content == b'["RU"]'
+    assert (await cache.lookup(request)).is_fresh
+    assert cache.revalidated == 1
+
+
+async def test_response_is_not_stored():
+    cache = HTTPCache(name="no-store", policy=HTTPCachePolicy())
+    request = httpx.Request("GET", URL)
+
+    for headers in ({"Cache-Control": "no-store, max-age=60"}, {}):
+        await cache.update(request, server_response(200, headers), cached=None)
+
+    assert await cache.lookup(request) is None
+
+
+async def test_invalidate():
+    cache = HTTPCache(name="invalidate", policy=HTTPCachePolicy())
+    request = httpx.Request("GET", URL)
+    await cache.update(
+        request,
+        server_response(200, {"Cache-Control": "max-age=60"}),
+        cached=None,
+    )
+
+    await cache.invalidate()
+
+    assert await cache.lookup(request) is None
+
+
+async def test_response_is_stored_per_vary_headers():
+    cache = HTTPCache(name="vary", policy=HTTPCachePolicy())
+    english = httpx.Request("GET", URL, headers={"Accept-Language": "en"})
+    russian = httpx.Request("GET", URL, headers={"Accept-Language": "ru"})
+
+    await cache.update(
+        english,
+        server_response(
+            200,
+            {"Cache-Control": "max-age=60", "Vary": "Accept-Language"},
+        ),
+        cached=None,
+    )
+
+    assert await cache.lookup(russian) is None
+    assert (await cache.lookup(english)).is_fresh
+    assert cache.key(english, ["accept-language"]) != cache.key(
+        russian,
+        ["accept-language"],
+    )
+
+
+async def test_private_response_is_not_shared():
+    storage = Storage()
+    policy = HTTPCachePolicy(storage=storage)
+    cache = HTTPCache(name="private", policy=policy)
+    request = httpx.Request("GET", URL)
+
+    await cache.update(
+        request,
+        server_response(200, {"Cache-Control": "private, max-age=60"}),
+        cached=None,
+    )
+
+    assert storage.values == {}
+    assert (await cache.lookup(request)).is_fresh
+    # Cache of another process shares the storage only.
+    assert await HTTPCache(name="private", policy=policy).lookup(request) is None
+
+    await cache.update(
+        request,
+        server_response(200, {"Cache-Control": "max-age=60"}),
+        cached=None,
+    )
+
+    assert list(storage.values) == [cache.key(request)]
+
+
+async def test_response_is_stored_per_token():
+    storage = Storage()
+    cache = HTTPCache(name="token", policy=HTTPCachePolicy(storage=storage))
+    first = httpx.Request("GET", URL, headers={"X-ACCESS-TOKEN": "first"})
+    second = httpx.Request("GET", URL, headers={"X-ACCESS-TOKEN": "second"})
+
+    await cache.update(
+        first,
+        server_response(200, {"Cache-Control": "max-age=60"}),
+        cached=None,
+    )
+
+    assert (await cache.lookup(first)).is_fresh
+    assert await cache.lookup(second) is None
+    assert await cache.lookup(httpx.Request("GET", URL)) is None
+    assert list(storage.values) == [cache.key(first)]
+    assert "first" not in cache.key(first)
+
+
+def test_dump_and_load():
+    cached = CachedResponse(
+        status_code=200,
+        headers=[("ETag", '"v1"')],
+        content=b"line\nline",
+        expires_at=1.5,
+    )
+
+    assert CachedResponse.load(cached.dump()) == cached
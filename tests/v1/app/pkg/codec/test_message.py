@@ -0,0 +1,66 @@
+"""Testing the :func:`encode_message` and :func:`decode_message`."""
+
+import json
+
+import pytest
+
+from app.pkg.codec import (
+    CONTENT_TYPE_JSON,
+    ENCODING_DEFLATE,
+    UnsupportedMessageEncoding,
+    decode_message,
+    encode_message,
+)
+from app.pkg.models.base import BaseModel
+
+
+class Message(BaseModel):
+    name: str
+    count: int = 0
+
+
+async def test_encode_message_plain():
+    body, content_encoding = encode_message(Message(name="a", count=1))
+
+    assert content_encoding is None
+    assert json.loads(body) == {"name": "a", "count": 1}
+
+
+async def test_encode_message_compressed_above_threshold():
+    message = Message(name="a" * 100)
+
+    body, content_encoding = encode_message(message, compress_threshold=10)
+
+    assert content_encoding == ENCODING_DEFLATE
+    assert (
+        decode_message(
+            body,
+            Message,
+            content_type=CONTENT_TYPE_JSON,
+            content_encoding=content_encoding,
+        )
+        == message
+    )
+
+
+async def test_decode_message_without_headers():
+    assert decode_message(b'{"name": "a"}', Message) == Message(name="a")
+
+
+@pytest.mark.parametrize(
+    "content_type,content_encoding",
+    [("application/msgpack", None), (CONTENT_TYPE_JSON, "br")],
+)
+async def test_decode_message_unsupported(content_type, content_encoding):
+    with pytest.raises(UnsupportedMessageEncoding):
+        decode_message(
+            b'{"name": "a"}',
+            Message,
+            content_type=content_type,
+            content_encoding=content_encoding,
+        )
+
+
+async def test_decode_message_invalid_body():
+    with pytest.raises(ValueError):
+        decode_message(b"{", Message)
@@ -0,0 +1,92 @@
+"""Tests for :func:`.direct_response` routes."""
+
+import typing
+
+import httpx
+import pydantic
+from fastapi import APIRouter, FastAPI, status
+from fastapi.responses import PlainTextResponse
+
+from app.pkg.models.base import BaseModel
+from app.pkg.models.base.json_response import direct_response
+from app.pkg.models.base.request_id_route import RequestIDRoute
+
+
+class Item(BaseModel):
+    item_id: int
+    item_name: str = pydantic.Field(alias="itemName")
+    comment: typing.Optional[str] = None
+
+
+class ItemWithSecret(Item):
+    secret: str
+
+
+def build_client(router: APIRouter) -> httpx.AsyncClient:
+    app = FastAPI()
+    app.include_router(router)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://test",
+    )
+
+
+async def test_direct_response_matches_default_serialization():
+    router = APIRouter(route_class=RequestIDRoute)
+    items = [
+        ItemWithSecret(item_id=i, itemName=f"item-{i}", secret="secret")
+        for i in range(3)
+    ]
+
+    @router.get("/default/", response_model=typing.List[Item])
+    async def read_default():
+        return items
+
+    @router.get("/direct/", response_model=typing.List[Item])
+    @direct_response()
+    async def read_direct():
+        return items
+
+    async with build_client(router) as client:
+        default = await client.get("/default/")
+        direct = await client.get("/direct/")
+
+    assert direct.status_code == status.HTTP_200_OK
+    assert direct.headers["content-type"] == "application/json"
+    assert "X-Request-ID" in direct.headers
+    assert direct.json() == default.json()
+    assert "secret" not in direct.json()[0]
+
+
+async def test_direct_response_route_options():
+    router = APIRouter(route_class=RequestIDRoute)
+
+    @router.post(
+        "/",
+        response_model=Item,
+        status_code=status.HTTP_201_CREATED,
+        response_model_exclude_none=True,
+    )
+    @direct_response()
+    def create():
+        return {"item_id": 1, "itemName": "item"}
+
+    async with build_client(router) as client:
+        response = await client.post("/")
+
+    assert response.status_code == status.HTTP_201_CREATED
+    assert response.json() == {"item_id": 1, "itemName": "item"}
+
+
+async def test_direct_response_passes_responses():
+    router = APIRouter(route_class=RequestIDRoute)
+
+    @router.get("/", response_model=Item)
+    @direct_response()
+    async def read():
+        return PlainTextResponse("plain")
+
+    async with build_client(router) as client:
+        response = await client.get("/")
+
+    assert response.text == "plain"
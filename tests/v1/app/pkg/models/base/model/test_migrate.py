@@ -114,3 +114,49 @@ async def test_with_extra_field():
     assert another_model.some_value_two == "1"
     assert another_model.some_value_three == "1"
     assert another_model.some_value_four == decimal.Decimal("1.0")
+
+
+async def test_migrate_many():
+    class TestModel(BaseModel):
+        some_value: int
+        some_value_two: pydantic.SecretStr
+        some_value_three: str
+
+    class AnotherTestModel(BaseModel):
+        first: int
+        some_value_two: pydantic.SecretStr
+        some_value_four: str
+
+    items = [
+        TestModel(some_value=i, some_value_two="key", some_value_three="1")
+        for i in range(3)
+    ]
+    another_models = TestModel.migrate_many(
+        items,
+        AnotherTestModel,
+        match_keys={"first": "some_value"},
+        extra_fields=[{"some_value_four": str(i)} for i in range(3)],
+    )
+
+    assert [model.first for model in another_models] == [0, 1, 2]
+    assert [model.some_value_four for model in another_models] == ["0", "1", "2"]
+    assert all(
+        model.some_value_two.get_secret_value() == "key" for model in another_models
+    )
+    assert another_models[0] == items[0].migrate(
+        AnotherTestModel,
+        match_keys={"first": "some_value"},
+        extra_fields={"some_value_four": "0"},
+    )
+
+
+async def test_migrate_many_with_missing_fields():
+    class TestModel(BaseModel):
+        some_value: int
+
+    class AnotherTestModel(BaseModel):
+        some_value: int
+        some_value_two: str
+
+    with pytest.raises(pydantic.ValidationError):
+        TestModel.migrate_many([TestModel(some_value=1)], AnotherTestModel)
@@ -0,0 +1,39 @@
+"""Testing the :class:`.ReadModel` tier of models."""
+
+import pydantic
+import pytest
+
+from app.pkg.models import v1 as models
+
+
+async def test_read_model_is_frozen():
+    country = models.Country(country_id=1, country_name="Russia", country_code="RUS")
+
+    with pytest.raises(pydantic.ValidationError):
+        country.country_name = "Other"
+    assert hash(country) == hash(country.model_copy())
+
+
+async def test_changelog_command_is_mutable():
+    cmd = models.CreateCountyChangelogCommand(
+        country_id=1,
+        country_name="Russia",
+        country_code="RUS",
+    )
+
+    cmd.country_name = "Other"
+
+    assert cmd.country_name == "Other"
+    assert not isinstance(cmd, models.Country)
+
+
+async def test_read_model_with_list_is_not_hashable():
+    country = models.CountryWithCities(
+        country_id=1,
+        country_name="Russia",
+        country_code="RUS",
+        cities=[],
+    )
+
+    with pytest.raises(TypeError):
+        hash(country)
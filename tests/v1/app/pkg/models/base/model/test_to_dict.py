@@ -192,5 +192,44 @@ async def test_model_reduction_with_deciphering():
     assert dict_model["reduction"] == "reduction"
 
 
-# TODO: Добавить бенчмарки для to_dict.
-#   Есть ощущение, что тут происходит много лишних операций.
+async def test_cast_nested_models_and_lists() -> None:
+    class Nested(BaseModel):
+        some_id: uuid.UUID
+        some_secret: pydantic.SecretStr
+        some_date: datetime.date
+        some_time: datetime.time
+
+    class TestModel(BaseModel):
+        some_value: typing.List[Nested]
+        some_value_two: typing.Dict[str, typing.Any]
+
+    now = datetime.datetime(2026, 10, 19, 12, 30, 15, 123)
+    some_id = uuid.uuid4()
+    model = TestModel(
+        some_value=[
+            Nested(
+                some_id=some_id,
+                some_secret="key",
+                some_date=now.date(),
+                some_time=now.time(),
+            ),
+        ],
+        some_value_two={"at": now, "ids": (some_id,), "empty": {}},
+    )
+
+    assert model.to_dict() == {
+        "some_value": [
+            {
+                "some_id": str(some_id),
+                "some_secret": "**********",
+                "some_date": "2026-10-19",
+                "some_time": "12:30:15",
+            },
+        ],
+        "some_value_two": {
+            "at": "2026-10-19 12:30:15",
+            "ids": [str(some_id)],
+            "empty": {},
+        },
+    }
+    assert model.to_dict(show_secrets=True)["some_value"][0]["some_secret"] == "key"
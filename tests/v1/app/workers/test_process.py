@@ -0,0 +1,23 @@
+"""Testing the consumer process."""
+
+import pytest
+
+from app.workers import process
+
+
+async def test_shutdown_resources_on_exit(monkeypatch):
+    closed = []
+
+    async def consume():
+        raise RuntimeError("consumer failed")
+
+    async def shutdown_resources():
+        closed.append(True)
+
+    monkeypatch.setattr(process, "consume", consume)
+    monkeypatch.setattr(process, "shutdown_resources", shutdown_resources)
+
+    with pytest.raises(RuntimeError):
+        await process.serve()
+
+    assert closed == [True]
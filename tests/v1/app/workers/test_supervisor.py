@@ -0,0 +1,90 @@
+"""Testing the :class:`Supervisor` of consumer processes."""
+
+import os
+import signal
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from app.workers.supervisor import Supervisor
+
+#: Environment variable with the log file of target processes.
+LOG_ENV = "SUPERVISOR_TEST_LOG"
+
+
+def log(line: str) -> None:
+    with open(os.environ[LOG_ENV], "a") as file:
+        file.write(f"{line}\n")
+
+
+def crash() -> None:
+    log("started")
+    sys.exit(3)
+
+
+def drain() -> None:
+    signal.signal(signal.SIGTERM, lambda *_: (log("drained"), sys.exit(0)))
+    log("started")
+    time.sleep(60)
+
+
+def hang() -> None:
+    signal.signal(signal.SIGTERM, signal.SIG_IGN)
+    log("started")
+    time.sleep(60)
+
+
+@pytest.fixture()
+def lines(monkeypatch, tmp_path: Path):
+    path = tmp_path / "supervisor.log"
+    path.touch()
+    monkeypatch.setenv(LOG_ENV, str(path))
+    handlers = {
+        signum: signal.getsignal(signum) for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    yield lambda: path.read_text().splitlines()
+    for signum, handler in handlers.items():
+        signal.signal(signum, handler)
+
+
+def stop_when(condition) -> threading.Thread:
+    """Send ``SIGTERM`` to the supervisor once the condition is true."""
+
+    def wait():
+        deadline = time.monotonic() + 30
+        while not condition() and time.monotonic() < deadline:
+            time.sleep(0.05)
+        os.kill(os.getpid(), signal.SIGTERM)
+
+    thread = threading.Thread(target=wait, daemon=True)
+    thread.start()
+    return thread
+
+
+def test_restart_crashed_process(lines):
+    stop_when(lambda: lines().count("started") >= 2)
+
+    Supervisor(target=crash, processes=1, drain_timeout=1, restart_delay=0).run()
+
+    assert lines().count("started") >= 2
+
+
+def test_drain_on_stop(lines):
+    stop_when(lambda: lines().count("started") == 2)
+
+    Supervisor(target=drain, processes=2, drain_timeout=10, restart_delay=0).run()
+
+    assert lines().count("drained") == 2
+
+
+def test_kill_hanging_process(lines):
+    stop_when(lambda: "started" in lines())
+
+    started = time.monotonic()
+    Supervisor(target=hang, processes=1, drain_timeout=1, restart_delay=0).run()
+
+    assert time.monotonic() - started < 30
+
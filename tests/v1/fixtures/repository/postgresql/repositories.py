@@ -2,7 +2,11 @@
 
 import pytest
 
-from app.internal.repository.v1.postgresql import CityRepository, CountryRepository
+from app.internal.repository.v1.postgresql import (
+    CityRepository,
+    CountryRepository,
+    OutboxRepository,
+)
 
 
 @pytest.fixture()
@@ -13,3 +17,8 @@ async def city_repository() -> CityRepository:
 @pytest.fixture()
 async def country_repository() -> CountryRepository:
     return CountryRepository()
+
+
+@pytest.fixture()
+async def outbox_repository() -> OutboxRepository:
+    return OutboxRepository()